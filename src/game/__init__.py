@@ -1,21 +1,26 @@
 """
 植物大战僵尸 Python 版 - 游戏核心模块
+
+导出的类在第一次访问时才导入，`import game` 本身几乎不花时间。
 """
 
-from .game_engine import GameEngine
-from .entities.plants import Plant, Peashooter, Sunflower
-from .entities.zombies import Zombie
-from .entities.projectiles import Pea
-from .entities.sun import Sun
-from .levels.level_manager import LevelManager
+from ._lazy import lazy_exports
+
+# 导出的名称 -> 所在的子模块
+_EXPORTS = {
+    'GameEngine': '.game_engine',
+    'VectorGameEngine': '.vector_engine',
+    'Plant': '.entities.plants',
+    'Peashooter': '.entities.plants',
+    'Sunflower': '.entities.plants',
+    'Zombie': '.entities.zombies',
+    'Pea': '.entities.projectiles',
+    'Sun': '.entities.sun',
+    'LevelManager': '.levels.level_manager'
+}
 
-__all__ = [
-    'GameEngine',
-    'Plant', 'Peashooter', 'Sunflower',
-    'Zombie',
-    'Pea',
-    'Sun',
-    'LevelManager'
-]
+__all__ = list(_EXPORTS)
 
 __version__ = "1.0.0"
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
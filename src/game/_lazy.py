@@ -0,0 +1,31 @@
+import importlib
+import sys
+
+
+def lazy_exports(package, exports, public=None):
+    """
+    生成包的模块级 __getattr__ 和 __dir__：导出的名称在第一次访问时才导入所在的子模块
+
+    Args:
+        package: 包名（调用方的 __name__）
+        exports: 导出的名称 -> 所在的子模块（相对于包）
+        public: __dir__ 中列出的名称，默认为 exports 中的全部名称
+
+    Returns:
+        tuple: (__getattr__, __dir__)，在包的 __init__ 中赋给同名的模块属性
+    """
+    public = list(exports) if public is None else list(public)
+
+    def __getattr__(name):
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module, package), name)
+        # 缓存到包的命名空间，之后的访问不再经过 __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package])) | set(public))
+
+    return __getattr__, __dir__
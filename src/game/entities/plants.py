@@ -1,28 +1,62 @@
-import pygame
-from typing import List, TYPE_CHECKING
+from typing import Dict, Optional, Type, TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from .projectiles import Pea
+    import pygame
+    from ..systems.lane_index import LaneIndex
+    from ..systems.projectiles import ProjectileSystem
+    from ..systems.timer_wheel import TimerWheel
 
 class Plant:
-    """植物基类"""
+    """植物基类
+    
+    实例只保存各自变化的状态；同类植物共享的数值放在类属性上。
+    植物不逐帧更新：放置到场上时由 attach() 记下引擎的时间轮（用作时钟）并返回第一次触发的帧，
+    到期时引擎调用 on_timer()，冷却剩余时间由时间轮的当前帧换算。
+    """
+    
+    __slots__ = ('row', 'col', 'x', 'y', 'health', 'timers')
+    
+    # 同类植物共享的属性
+    grid_size = 80      # 草坪格子边长
+    max_health = 100
+    cost = 50           # 种植花费的阳光
+    sun_value = 0       # 每次触发定时器时产生的阳光，0 表示不产生阳光
     
     def __init__(self, row: int, col: int, lawn_left: int, lawn_top: int, grid_size: int):
         self.row = row
         self.col = col
         self.x = lawn_left + col * grid_size
         self.y = lawn_top + row * grid_size
-        self.health = 100
-        self.attack_cooldown = 0
-        self.grid_size = grid_size
+        self.health = self.max_health
+        self.timers: Optional['TimerWheel'] = None
+    
+    @property
+    def attack_cooldown(self) -> int:
+        """剩余攻击冷却（没有攻击能力的植物始终为 0）"""
+        return 0
+    
+    def attach(self, timers: 'TimerWheel') -> Optional[int]:
+        """
+        放置到场上时调用
+        
+        Returns:
+            第一次触发 on_timer 的逻辑帧，不需要定时器时返回 None
+        """
+        self.timers = timers
+        return None
     
-    def update(self, zombies: List['Zombie'], peas: List['Pea']):
-        """更新植物状态"""
-        if self.attack_cooldown > 0:
-            self.attack_cooldown -= 1
+    def on_timer(self, lanes: 'LaneIndex', projectiles: 'ProjectileSystem') -> Optional[int]:
+        """
+        定时器到期时调用
+        
+        Returns:
+            下一次触发的逻辑帧，None 表示不再定时
+        """
+        return None
     
-    def draw(self, screen: pygame.Surface, image: pygame.Surface = None):
+    def draw(self, screen: 'pygame.Surface', image: 'pygame.Surface' = None):
         """绘制植物"""
+        import pygame
         if image:
             screen.blit(image, (self.x + 10, self.y + 10))
         else:
@@ -32,30 +66,54 @@ class Plant:
 
 
 class Peashooter(Plant):
-    """豌豆射手"""
+    """豌豆射手
+    
+    攻击冷却每帧减 2，因此每 shoot_cooldown // 2 帧才能开火一次。
+    冷却结束而前方没有僵尸时进入就绪状态，由引擎在僵尸出现时调用 shoot()。
+    """
+    
+    __slots__ = ('ready_tick',)
+    
+    shoot_cooldown = 60  # 攻击冷却时间
     
     def __init__(self, row: int, col: int, lawn_left: int, lawn_top: int, grid_size: int):
         super().__init__(row, col, lawn_left, lawn_top, grid_size)
-        self.attack_cooldown = 60  # 攻击冷却时间
+        self.ready_tick = 0  # 冷却结束的逻辑帧，attach 后有效
+    
+    @property
+    def attack_cooldown(self) -> int:
+        """剩余攻击冷却：冷却期间每帧减 2，就绪后每帧减 1（与向量化引擎的 cooldown 列一致）"""
+        if self.timers is None:
+            return self.shoot_cooldown
+        remaining = self.ready_tick - self.timers.now
+        return 2 * remaining if remaining >= 0 else remaining
     
-    def update(self, zombies: List['Zombie'], peas: List['Pea']):
-        """更新豌豆射手状态"""
-        super().update(zombies, peas)
+    def attach(self, timers: 'TimerWheel') -> Optional[int]:
+        """放置后经过一次冷却才能开火"""
+        self.timers = timers
+        self.ready_tick = timers.now + self.shoot_cooldown // 2
+        return self.ready_tick
+    
+    def on_timer(self, lanes: 'LaneIndex', projectiles: 'ProjectileSystem') -> Optional[int]:
+        """冷却结束：该行前方有僵尸时开火，否则返回 None 进入就绪状态"""
+        if lanes.has_zombie_ahead(self.row, self.x):
+            return self.shoot(projectiles)
+        return None
+    
+    def shoot(self, projectiles: 'ProjectileSystem') -> int:
+        """
+        发射豌豆
         
-        self.attack_cooldown -= 1
-        if self.attack_cooldown <= 0:
-            # 检查该行是否有僵尸
-            for zombie in zombies:
-                if zombie.row == self.row and zombie.x > self.x:
-                    # 发射豌豆
-                    from .projectiles import Pea
-                    peas.append(Pea(self.x + self.grid_size//2, 
-                                  self.y + self.grid_size//2, 
-                                  self.row))
-                    self.attack_cooldown = 60
-                    break
-    
-    def draw(self, screen: pygame.Surface, image: pygame.Surface = None):
+        Returns:
+            下一次冷却结束的逻辑帧
+        """
+        projectiles.fire(self.x + self.grid_size//2, 
+                         self.y + self.grid_size//2, 
+                         self.row)
+        self.ready_tick = self.timers.now + self.shoot_cooldown // 2
+        return self.ready_tick
+    
+    def draw(self, screen: 'pygame.Surface', image: 'pygame.Surface' = None):
         """绘制豌豆射手"""
         super().draw(screen, image)
 
@@ -63,21 +121,39 @@ class Peashooter(Plant):
 class Sunflower(Plant):
     """向日葵"""
     
+    __slots__ = ('sun_tick',)
+    
+    sun_interval = 300  # 阳光生成冷却时间
+    sun_value = 25
+    
     def __init__(self, row: int, col: int, lawn_left: int, lawn_top: int, grid_size: int):
         super().__init__(row, col, lawn_left, lawn_top, grid_size)
-        self.sun_cooldown = 300  # 阳光生成冷却时间
+        self.sun_tick = 0  # 下一次产生阳光的逻辑帧，attach 后有效
     
-    def update(self, zombies: List['Zombie'], peas: List['Pea']):
-        """更新向日葵状态"""
-        super().update(zombies, peas)
-        
-        self.sun_cooldown -= 1
-        if self.sun_cooldown <= 0:
-            # 生成阳光（这里只是标记，实际生成由GameEngine处理）
-            self.sun_cooldown = 300
-            return 25  # 返回阳光值
-        return 0
+    @property
+    def sun_cooldown(self) -> int:
+        """距离下一次产生阳光的帧数"""
+        if self.timers is None:
+            return self.sun_interval
+        return self.sun_tick - self.timers.now
+    
+    def attach(self, timers: 'TimerWheel') -> Optional[int]:
+        self.timers = timers
+        self.sun_tick = timers.now + self.sun_interval
+        return self.sun_tick
+    
+    def on_timer(self, lanes: 'LaneIndex', projectiles: 'ProjectileSystem') -> Optional[int]:
+        """产生阳光的时间到了（阳光由引擎的 SunEconomy 统一结算）"""
+        self.sun_tick = self.timers.now + self.sun_interval
+        return self.sun_tick
     
-    def draw(self, screen: pygame.Surface, image: pygame.Surface = None):
+    def draw(self, screen: 'pygame.Surface', image: 'pygame.Surface' = None):
         """绘制向日葵"""
         super().draw(screen, image)
+
+
+# 植物种类名 -> 植物类，GameEngine.place_plant 按名称创建植物
+PLANT_CLASSES: Dict[str, Type[Plant]] = {
+    "peashooter": Peashooter,
+    "sunflower": Sunflower,
+}
@@ -1,38 +1,73 @@
-import pygame
-from typing import List
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pygame
+    from ..systems.lane_index import LaneIndex
+    from ..systems.timer_wheel import TimerWheel
 
 class Pea:
-    """豌豆类"""
+    """豌豆类（可由对象池回收复用）
+    
+    豌豆沿所在行匀速飞行，不逐帧更新：发射后由 launch() 记下时间轮（用作时钟）和发射的帧，
+    当前位置由当前帧推算。何时需要检查命中由 systems.projectiles.ProjectileSystem 预测。
+    """
+    
+    __slots__ = ('start_x', 'y', 'row', 'fired', 'wake_tick', 'timers')
+    
+    # 所有豌豆共享的属性
+    speed = 5
+    damage = 20
+    reach = 30       # 命中判定距离
+    max_x = 900      # 超出此位置后移除（屏幕宽度）
     
     def __init__(self, x: int, y: int, row: int):
-        self.x = x
+        self.reset(x, y, row)
+    
+    def reset(self, x: int, y: int, row: int):
+        """重置状态，供对象池复用"""
+        self.start_x = x
         self.y = y
         self.row = row
-        self.speed = 5
-        self.damage = 20
+        self.fired = 0
+        self.wake_tick = 0  # 下一次检查命中的逻辑帧，由 ProjectileSystem 维护
+        self.timers: Optional['TimerWheel'] = None
+    
+    def launch(self, timers: 'TimerWheel'):
+        """在某一帧的更新中发射后调用，豌豆在同一帧开始飞行"""
+        self.timers = timers
+        self.fired = timers.now
+    
+    @property
+    def x(self) -> int:
+        """当前位置：发射的那一帧起每帧前进 speed"""
+        if self.timers is None:
+            return self.start_x
+        return self.start_x + self.speed * (self.timers.now - self.fired + 1)
+    
+    @property
+    def exit_tick(self) -> int:
+        """飞出屏幕（位置超过 max_x）的逻辑帧"""
+        return self.fired + (self.max_x - self.start_x) // self.speed
     
-    def update(self, zombies: List['Zombie']) -> bool:
-        """更新豌豆位置，返回是否应该被移除"""
-        self.x += self.speed
+    def strike(self, lanes: 'LaneIndex') -> bool:
+        """在当前位置检查命中，返回是否应该被移除"""
+        x = self.x
         
-        # 检查是否击中僵尸
-        for zombie in zombies:
-            if (zombie.row == self.row and 
-                abs(zombie.x - self.x) < 30 and 
-                abs(zombie.y + 40 - self.y) < 30):  # 40是僵尸高度的一半
-                zombie.take_damage(self.damage)
-                return True  # 击中僵尸，移除豌豆
+        # 检查是否击中同一行中最近的僵尸
+        zombie = lanes.nearest_zombie(self.row, x, self.reach)
+        if zombie is not None:
+            zombie.take_damage(self.damage)
+            return True  # 击中僵尸，移除豌豆
         
         # 检查是否超出屏幕
-        if self.x > 900:  # 屏幕宽度
-            return True  # 超出屏幕，移除豌豆
-            
-        return False
+        return x > self.max_x
     
-    def draw(self, screen: pygame.Surface, image: pygame.Surface = None):
+    def draw(self, screen: 'pygame.Surface', image: 'pygame.Surface' = None):
         """绘制豌豆"""
+        import pygame
+        x = self.x
         if image:
-            screen.blit(image, (self.x - 8, self.y - 8))
+            screen.blit(image, (x - 8, self.y - 8))
         else:
             # 默认绘制（贴图加载失败时使用）
-            pygame.draw.circle(screen, (0, 255, 0), (self.x, self.y), 8)
+            pygame.draw.circle(screen, (0, 255, 0), (x, self.y), 8)
@@ -1,29 +1,78 @@
-import pygame
 import random
+from typing import Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pygame
+    from ..systems.timer_wheel import TimerWheel
 
 class Sun:
-    """阳光类"""
-    
-    def __init__(self, screen_width: int):
-        self.x = random.randint(100, screen_width - 50)  # 从lawn_left开始
-        self.y = 0
-        self.target_y = random.randint(100, 400)
-        self.speed = 1
-        self.value = 25
-        self.timer = 300  # 存在时间
-    
-    def update(self) -> bool:
-        """更新阳光位置，返回是否应该被移除"""
-        # 移动到目标位置
-        if self.y < self.target_y:
-            self.y += self.speed
+    """阳光类（可由对象池回收复用）
+    
+    阳光不逐帧更新：引擎生成阳光后调用 start() 记下时间轮（用作时钟）和出现的帧，
+    下落位置和剩余时间都由当前帧推算，到期由时间轮通知引擎移除。
+    天上掉落的阳光从 y=0 开始下落，向日葵产生的阳光从向日葵处开始下落。
+    """
+    
+    __slots__ = ('x', 'start_y', 'target_y', 'rest_y', 'born', 'timers')
+    
+    # 所有阳光共享的属性
+    speed = 1
+    value = 25
+    lifetime = 300  # 存在时间（帧）
+    radius = 20     # 点击判定半径
+    
+    def __init__(self, x: int, target_y: int, start_y: int = 0):
+        self.reset(x, target_y, start_y)
+    
+    def reset(self, x: int, target_y: int, start_y: int = 0):
+        """重置状态，供对象池复用"""
+        self.x = x
+        self.start_y = start_y
+        self.target_y = target_y
+        # 每帧下落 speed，直到不低于 target_y 为止
+        fall = max(0, target_y - start_y)
+        self.rest_y = start_y - (-fall // self.speed) * self.speed
+        self.born = 0
+        self.timers: Optional['TimerWheel'] = None
+    
+    @staticmethod
+    def random_position(screen_width: int, rng: random.Random = random) -> Tuple[int, int]:
+        """天上掉落的阳光的随机位置 (x, target_y)"""
+        x = rng.randint(100, screen_width - 50)  # 从lawn_left开始
+        return x, rng.randint(100, 400)
+    
+    def start(self, timers: 'TimerWheel') -> int:
+        """
+        在某一帧的更新中生成后调用，阳光在同一帧开始下落
         
-        # 减少存在时间
-        self.timer -= 1
-        return self.timer <= 0
+        Returns:
+            阳光到期（应被移除）的逻辑帧
+        """
+        self.timers = timers
+        self.born = timers.now
+        return self.born + self.lifetime - 1
+    
+    def _age(self) -> int:
+        """已经历的帧数（含出现的那一帧）"""
+        return 0 if self.timers is None else self.timers.now - self.born + 1
+    
+    @property
+    def y(self) -> int:
+        """当前高度：从 start_y 开始每帧下落 speed，到达目标位置后停止"""
+        return min(self.start_y + self._age() * self.speed, self.rest_y)
+    
+    def tick_at(self, height: int) -> int:
+        """下落到不高于 height 的位置（height 不超过 rest_y）的逻辑帧"""
+        return self.born - 1 - (-(height - self.start_y) // self.speed)
+    
+    @property
+    def timer(self) -> int:
+        """剩余存在时间（帧）"""
+        return self.lifetime - self._age()
     
-    def draw(self, screen: pygame.Surface, image: pygame.Surface = None):
+    def draw(self, screen: 'pygame.Surface', image: 'pygame.Surface' = None):
         """绘制阳光"""
+        import pygame
         if image:
             screen.blit(image, (self.x - 20, self.y - 20))
         else:
@@ -33,4 +82,4 @@ class Sun:
     def is_clicked(self, mouse_x: int, mouse_y: int) -> bool:
         """检查是否被点击"""
         distance_squared = (mouse_x - self.x) ** 2 + (mouse_y - self.y) ** 2
-        return distance_squared <= 400  # 20像素半径内
+        return distance_squared <= self.radius ** 2
@@ -1,56 +1,73 @@
-import pygame
-from typing import List
-from .plants import Plant
+from typing import Optional, TYPE_CHECKING
+
+from ..utils.config import GAME_CONFIG
+
+if TYPE_CHECKING:
+    import pygame
+    from ..systems.lane_index import LaneIndex
+    from ..systems.timer_wheel import TimerWheel
+
+# 各难度下僵尸的默认属性：(生命值, 速度)，取自 utils.config.GAME_CONFIG
+ZOMBIE_STATS = {difficulty: (health, GAME_CONFIG["zombie_speed"][difficulty])
+                for difficulty, health in GAME_CONFIG["zombie_health"].items()}
+
 
 class Zombie:
-    """僵尸类"""
+    """僵尸类
+    
+    啃咬冷却记录为下一次可以啃咬的逻辑帧，不逐帧递减；
+    上场时引擎把时间轮赋给 timers，当前帧取自 timers.now。
+    """
+    
+    __slots__ = ('row', 'x', 'y', 'health', 'max_health', 'speed', 'bite_tick', 'timers')
     
-    def __init__(self, row: int, screen_width: int, lawn_top: int, grid_size: int, difficulty: str = "normal"):
+    # 所有僵尸共享的属性
+    grid_size = 80        # 草坪格子边长
+    bite_damage = 5
+    bite_cooldown = 30
+    house_x = 100         # 房子的位置（lawn_left）
+    
+    def __init__(self, row: int, screen_width: int, lawn_top: int, grid_size: int, difficulty: str = "normal",
+                 health: Optional[int] = None, speed: Optional[float] = None):
         self.row = row
         self.x = screen_width
         self.y = lawn_top + row * grid_size
-        self.grid_size = grid_size
         
-        # 根据难度调整属性
-        if difficulty == "easy":
-            self.health = 80
-            self.speed = 0.3
-        elif difficulty == "normal":
-            self.health = 100
-            self.speed = 0.5
-        else:  # hard
-            self.health = 150
-            self.speed = 0.7
+        # 根据难度调整属性，平衡测试时可覆盖默认属性
+        default_health, default_speed = ZOMBIE_STATS.get(difficulty, ZOMBIE_STATS["hard"])
+        self.health = default_health if health is None else health
+        self.speed = default_speed if speed is None else speed
             
-        self.attack_cooldown = 0
+        self.bite_tick = 0  # 不早于这一帧才能再次啃咬
+        self.timers: Optional['TimerWheel'] = None
         self.max_health = self.health
     
-    def update(self, plants: List[Plant]) -> bool:
+    @property
+    def attack_cooldown(self) -> int:
+        """剩余啃咬冷却（帧）"""
+        if self.timers is None:
+            return 0
+        return max(0, self.bite_tick - 1 - self.timers.now)
+    
+    def update(self, lanes: 'LaneIndex') -> bool:
         """更新僵尸状态，返回是否到达房子"""
-        plant_in_front = False
-        
         # 检查前方是否有植物
-        for plant in plants:
-            if plant.row == self.row and abs(plant.x - self.x) < self.grid_size:
-                plant_in_front = True
-                if self.attack_cooldown <= 0:
-                    plant.health -= 5
-                    self.attack_cooldown = 30
-                break
-                
-        # 如果没有植物阻挡，向前移动
-        if not plant_in_front:
+        plant = lanes.plant_in_front(self.row, self.x)
+        if plant is not None:
+            now = self.timers.now
+            if now >= self.bite_tick:
+                plant.health -= self.bite_damage
+                self.bite_tick = now + self.bite_cooldown
+        else:
+            # 如果没有植物阻挡，向前移动
             self.x -= self.speed
             
-        # 更新攻击冷却
-        if self.attack_cooldown > 0:
-            self.attack_cooldown -= 1
-            
         # 检查是否到达房子（左侧边界）
-        return self.x < 100  # lawn_left
+        return self.x < self.house_x
     
-    def draw(self, screen: pygame.Surface, image: pygame.Surface = None):
+    def draw(self, screen: 'pygame.Surface', image: 'pygame.Surface' = None):
         """绘制僵尸"""
+        import pygame
         if image:
             screen.blit(image, (self.x, self.y))
         else:
@@ -0,0 +1,521 @@
+import random
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+from .entities.plants import Plant, PLANT_CLASSES
+from .entities.zombies import Zombie
+from .entities.projectiles import Pea
+from .entities.sun import Sun
+from .levels.level_manager import LevelManager
+from .systems.lane_index import LaneIndex
+from .systems.entity_pool import EntityPool
+from .systems.object_pool import ObjectPool
+from .systems.projectiles import ProjectileSystem
+from .systems.sun_economy import SunEconomy
+from .systems.timer_wheel import TimerWheel
+from .utils.config import GAME_CONFIG
+
+# 默认平衡参数，取自 utils.config.GAME_CONFIG 中的同名配置
+DEFAULT_BALANCE = {key: dict(GAME_CONFIG[key])
+                   for key in ("zombie_spawn_rate", "zombie_health", "zombie_speed")}
+
+# 时间轮中定时器的种类，定时器的内容为 (种类, 实体句柄)
+TIMER_PLANT = 0   # 植物冷却结束（豌豆射手就绪、向日葵产生阳光）
+TIMER_SUN = 1     # 阳光到期消失
+TIMER_PEA = 2     # 豌豆可能击中僵尸或飞出屏幕（见 ProjectileSystem）
+TIMER_SUN_MOVE = 3  # 下落的阳光跨入下一行索引格子（见 SunEconomy）
+
+class GameEngine:
+    """游戏引擎核心类，负责游戏逻辑和状态管理
+    
+    引擎本身不依赖 pygame 和显示设备，时间由逻辑帧计数驱动：
+    每次推进一帧相当于 1000/fps 毫秒，阳光生成等计时都按逻辑帧计算，
+    因此可以脱离实时时钟以 CPU 允许的最快速度运行。
+    headless=True 时关卡完成也不写入存档，适用于批量模拟和回归测试。
+    
+    植物冷却、阳光存在时间和豌豆的命中检查由分层时间轮 self.timers 调度，每帧只处理到期的实体，
+    冷却中的植物、落地的阳光和飞行中的豌豆不产生逐帧开销；实体用 timers.now 换算剩余时间和位置。
+    
+    所有随机数都来自引擎自己的 rng。指定 seed 时每一局都使用该种子，
+    否则每局开始时随机选定一个种子并记录在 self.seed 中，便于录像回放。
+    
+    balance 可覆盖 DEFAULT_BALANCE 中的僵尸生成率、生命值和速度，
+    结构与 GAME_CONFIG 相同，例如 {"zombie_health": {"hard": 200}}。
+    
+    天上掉落的阳光和向日葵产生的阳光由 self.economy（SunEconomy）结算并统计产量。
+    auto_collect=True 时产生的阳光直接计入阳光数而不生成 Sun 对象，
+    结果与每帧收集全部阳光相同，适用于无头模拟和基准测试。
+    """
+    
+    def __init__(self, screen_width: int, screen_height: int, headless: bool = False, fps: int = 60,
+                 seed: Optional[int] = None, balance: Optional[Dict[str, Dict[str, float]]] = None,
+                 auto_collect: bool = False):
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.grid_size = 80
+        self.grid_rows = 5
+        self.grid_cols = 9
+        self.lawn_left = 100
+        self.lawn_top = 100
+        
+        # 豌豆和阳光生命周期短、数量多，回收复用以减少分配和垃圾回收停顿
+        self.pea_pool: ObjectPool[Pea] = ObjectPool(Pea)
+        self.sun_pool: ObjectPool[Sun] = ObjectPool(Sun)
+        
+        # 逻辑时钟（实体存储依赖时间轮）
+        self.tick = 0  # 已推进的逻辑帧数
+        self._reset_timers()
+        
+        # 游戏状态
+        self.suns: EntityPool[Sun] = EntityPool(self.sun_pool)
+        self._reset_entities()
+        self.occupancy = 0  # 已种植物的格子：第 row * grid_cols + col 位为 1
+        self.auto_collect = auto_collect
+        self.fps = fps
+        self._reset_economy()
+        
+        # 游戏数据
+        self.sun_count = 100
+        self.score = 0
+        self.sun_spent = 0
+        self.sun_collected = 0
+        self.game_over = False
+        self.is_paused = False
+        self.level_complete = False
+        
+        # 平衡参数
+        self.balance = {key: dict(values) for key, values in DEFAULT_BALANCE.items()}
+        for key, values in (balance or {}).items():
+            self.balance.setdefault(key, {}).update(values)
+        
+        # 时间控制
+        self.headless = headless
+        self.last_sun_time = 0
+        self.sun_rate = 5000  # 5秒生成一个阳光
+        
+        # 随机数与输入录制
+        self.base_seed = seed
+        self.rng = random.Random()
+        self._reseed()
+        self.recorder = None
+        
+        # 可选的性能采样器（systems.profiler.TickProfiler）
+        self.profiler = None
+        
+        # 关卡管理（无头模式不读写存档）
+        self.level_manager = None if headless else LevelManager()
+        self.current_level = 1
+        self.difficulty = "normal"
+        
+        # 关卡进度
+        self.zombies_spawned = 0
+        self.zombies_killed = 0
+        self.total_zombies_for_level = 0
+        
+        # 选中的植物
+        self.selected_plant = None
+        
+        self._calculate_zombies_for_level()
+    
+    def _reset_entities(self):
+        """重建植物、僵尸和豌豆的存储（子类可替换为其他存储方式）"""
+        if hasattr(self, 'peas'):
+            self.peas.clear()  # 把飞行中的豌豆还给对象池
+        self.plants: EntityPool[Plant] = EntityPool()
+        self.zombies: EntityPool[Zombie] = EntityPool()
+        self.peas: EntityPool[Pea] = EntityPool(self.pea_pool)
+        
+        # 按行索引的僵尸/植物，供碰撞和索敌查询使用
+        self.lanes = LaneIndex(self.grid_rows, self.grid_cols, self.lawn_left, self.grid_size)
+        
+        # 冷却已结束、等待僵尸进入本行前方的豌豆射手：每行一个 列号 -> 句柄 的字典
+        self._armed: List[Dict[int, int]] = [{} for _ in range(self.grid_rows)]
+        
+        # 豌豆的命中预测与结算
+        self.projectiles = ProjectileSystem(self.peas, self.lanes, self.timers, TIMER_PEA)
+    
+    def _reset_timers(self):
+        """重建时间轮（与逻辑帧计数同步）"""
+        self.timers = TimerWheel(self.tick)
+        self._due_plants: List[int] = []
+        self._due_suns: List[int] = []
+    
+    def _reset_economy(self):
+        """重建阳光经济（产量统计从当前帧开始）"""
+        self.economy = SunEconomy(self.suns, self.timers, TIMER_SUN, TIMER_SUN_MOVE, self.fps, self.auto_collect)
+    
+    def _calculate_zombies_for_level(self):
+        """根据关卡和难度计算僵尸数量"""
+        if self.difficulty == "easy":
+            self.total_zombies_for_level = self.current_level * 5
+        elif self.difficulty == "normal":
+            self.total_zombies_for_level = self.current_level * 15
+        else:  # hard
+            self.total_zombies_for_level = self.current_level * 25
+    
+    def set_difficulty(self, difficulty: str):
+        """设置游戏难度"""
+        self.difficulty = difficulty
+        self._calculate_zombies_for_level()
+    
+    def set_level(self, level: int):
+        """设置当前关卡"""
+        self.current_level = level
+        self._calculate_zombies_for_level()
+        self.reset_level()
+    
+    def reset_level(self):
+        """重置当前关卡"""
+        self.tick = 0
+        self._reset_timers()
+        self._reset_entities()
+        self.occupancy = 0
+        self.suns.clear()
+        self._reset_economy()
+        self.sun_count = 100
+        self.sun_spent = 0
+        self.sun_collected = 0
+        self.game_over = False
+        self.level_complete = False
+        self.zombies_spawned = 0
+        self.zombies_killed = 0
+        self.selected_plant = None
+        self.last_sun_time = 0
+        self._reseed()
+    
+    def _reseed(self):
+        """为新的一局选定随机种子"""
+        self.seed = self.base_seed if self.base_seed is not None else random.randrange(2 ** 32)
+        self.rng.seed(self.seed)
+    
+    def logical_time(self) -> float:
+        """按固定时间步长折算的逻辑时间（毫秒）"""
+        return self.tick * 1000 / self.fps
+    
+    def step(self):
+        """以固定时间步长推进一帧"""
+        self.update()
+    
+    def update(self, current_time: Optional[int] = None):
+        """更新游戏状态
+        
+        current_time 仅为兼容旧的调用方式而保留，计时统一使用逻辑时钟，
+        以保证相同种子和输入下结果可复现。
+        """
+        if self.is_paused or self.game_over:
+            return
+        
+        now = self.logical_time()
+        self.tick += 1
+        profiler = self.profiler
+        if profiler is None:
+            self._advance_timers()
+            self._generate_sun(now)
+            self._generate_zombies(now)
+            self._update_plants()
+            self._update_peas()
+            self._update_zombies()
+            self._update_suns()
+            self._remove_dead_plants()
+            self._check_level_complete()
+            return
+        
+        # 挂接了性能采样器时逐阶段计时
+        profiler.begin_tick()
+        profiler.time_phase('advance_timers', self._advance_timers)
+        profiler.time_phase('generate_sun', self._generate_sun, now)
+        profiler.time_phase('generate_zombies', self._generate_zombies, now)
+        profiler.time_phase('update_plants', self._update_plants)
+        profiler.time_phase('update_peas', self._update_peas)
+        profiler.time_phase('update_zombies', self._update_zombies)
+        profiler.time_phase('update_suns', self._update_suns)
+        profiler.time_phase('remove_dead_plants', self._remove_dead_plants)
+        profiler.time_phase('check_level_complete', self._check_level_complete)
+        profiler.end_tick(self)
+    
+    def _advance_timers(self):
+        """时间轮推进一帧，把到期的定时器按种类分给各阶段处理"""
+        due_plants: List[int] = []
+        due_suns: List[int] = []
+        for kind, handle in self.timers.advance():
+            if kind == TIMER_PLANT:
+                due_plants.append(handle)
+            elif kind == TIMER_SUN:
+                due_suns.append(handle)
+            elif kind == TIMER_PEA:
+                self.projectiles.wake(handle)
+            else:
+                self.economy.reindex(handle)
+        self._due_plants = due_plants
+        self._due_suns = due_suns
+    
+    def _generate_sun(self, current_time: int):
+        """生成阳光"""
+        if current_time - self.last_sun_time > self.sun_rate:
+            self._gain_sun(self.economy.drop(self.screen_width, self.rng))
+            self.last_sun_time = current_time
+    
+    def _gain_sun(self, value: int):
+        """计入自动收集的阳光"""
+        if value:
+            self.sun_count += value
+            self.sun_collected += value
+    
+    def _generate_zombies(self, current_time: int):
+        """生成僵尸"""
+        if self.zombies_spawned >= self.total_zombies_for_level:
+            return
+        
+        # 根据难度调整生成率
+        zombie_rate = self.balance["zombie_spawn_rate"].get(self.difficulty, 0.005)
+        
+        # 随着进度增加生成率
+        progress = self.zombies_spawned / self.total_zombies_for_level
+        adjusted_rate = zombie_rate * (1 + progress * 2)
+        
+        if self.rng.random() < adjusted_rate:
+            row = self.rng.randint(0, self.grid_rows - 1)
+            self._spawn_zombie(Zombie(row, self.screen_width, self.lawn_top, self.grid_size, self.difficulty,
+                                      health=self.balance["zombie_health"].get(self.difficulty),
+                                      speed=self.balance["zombie_speed"].get(self.difficulty)))
+            self.zombies_spawned += 1
+    
+    def spawn_zombie(self, zombie: Zombie):
+        """
+        把脚本布置的僵尸加入场上（基准测试、关卡编辑等使用）
+        
+        不计入本关已生成的僵尸数，也不消耗随机数，因此不影响随机生成的僵尸。
+        """
+        self._spawn_zombie(zombie)
+    
+    def _spawn_zombie(self, zombie: Zombie):
+        """将新僵尸加入场上（子类可替换为其他存储方式）"""
+        zombie.timers = self.timers
+        self.zombies.append(zombie)
+        self.lanes.add_zombie(zombie)
+        self.projectiles.zombie_added(zombie)
+    
+    def _update_plants(self):
+        """处理冷却结束的植物，并让就绪的豌豆射手向本行前方出现的僵尸开火"""
+        plants = self.plants
+        lanes = self.lanes
+        projectiles = self.projectiles
+        timers = self.timers
+        
+        producers = []
+        for handle in self._due_plants:
+            plant = plants.get(handle)
+            if plant is None:
+                continue  # 植物已被吃掉
+            due = plant.on_timer(lanes, projectiles)
+            if plant.sun_value:
+                producers.append(plant)
+            if due is not None:
+                timers.schedule(due, (TIMER_PLANT, handle))
+            else:
+                self._armed[plant.row][plant.col] = handle
+        if producers:
+            # 本帧产生阳光的向日葵整批结算
+            self._gain_sun(self.economy.produce(producers))
+        
+        for row, armed in enumerate(self._armed):
+            if not armed:
+                continue
+            ready = [col for col, handle in armed.items()
+                     if lanes.has_zombie_ahead(row, plants.get(handle).x)]
+            for col in ready:
+                handle = armed.pop(col)
+                timers.schedule(plants.get(handle).shoot(projectiles), (TIMER_PLANT, handle))
+    
+    def _update_peas(self):
+        """结算本帧可能命中或飞出屏幕的豌豆（飞行位置由逻辑帧推算，不需要逐帧更新）"""
+        self.projectiles.update()
+    
+    def _update_zombies(self):
+        """更新僵尸状态"""
+        lanes = self.lanes
+        
+        def update_zombie(zombie: Zombie) -> bool:
+            if zombie.update(lanes):
+                self.game_over = True
+            return zombie.health <= 0
+        
+        killed = self.zombies.remove_if(update_zombie)
+        self.zombies_killed += killed
+        self.score += 10 * killed
+        # 僵尸移动后重排各行索引，并剔除死亡僵尸
+        lanes.refresh()
+    
+    def _update_suns(self):
+        """移除到期的阳光（下落位置由逻辑帧推算，不需要逐帧更新）"""
+        if self._due_suns:
+            self.economy.expire(self._due_suns)
+    
+    def _remove_dead_plants(self):
+        """移除死亡的植物"""
+        lanes = self.lanes
+        
+        def is_dead(plant: Plant) -> bool:
+            if plant.health <= 0:
+                lanes.remove_plant(plant)
+                self._armed[plant.row].pop(plant.col, None)
+                self._free_cell(plant.row, plant.col)
+                return True
+            return False
+        
+        self.plants.remove_if(is_dead)
+    
+    def _check_level_complete(self):
+        """检查关卡是否完成"""
+        if self.level_complete:
+            return True
+        if (self.zombies_killed >= self.total_zombies_for_level and 
+            len(self.zombies) == 0):
+            self.level_complete = True
+            if self.level_manager is not None:
+                self.level_manager.complete_level(self.current_level, self.difficulty, {
+                    "sun_collected": self.sun_collected,
+                    "zombies_killed": self.zombies_killed
+                })
+            return True
+        return False
+    
+    def is_finished(self) -> bool:
+        """关卡是否已结束（失败或完成）"""
+        return self.game_over or self._check_level_complete()
+    
+    def place_plant(self, row: int, col: int, plant_type: str) -> bool:
+        """在指定位置放置植物"""
+        if self.recorder is not None:
+            self.recorder.record_place_plant(self.tick, row, col, plant_type)
+        plant = self._new_plant(row, col, plant_type)
+        if plant is None:
+            return False
+        self._add_plant(plant)
+        return True
+    
+    def place_plants(self, placements: Iterable[Tuple[int, int, str]]) -> List[bool]:
+        """
+        一次放置多株植物，结果与按顺序逐个调用 place_plant 相同
+        
+        每个放置 (行, 列, 植物种类) 依次校验阳光、格子和种类，
+        通过校验的植物最后整批加入场上。
+        
+        Returns:
+            每个放置是否成功
+        """
+        recorder = self.recorder
+        results = []
+        plants = []
+        for row, col, plant_type in placements:
+            if recorder is not None:
+                recorder.record_place_plant(self.tick, row, col, plant_type)
+            plant = self._new_plant(row, col, plant_type)
+            results.append(plant is not None)
+            if plant is not None:
+                plants.append(plant)
+        if plants:
+            self._add_plants(plants)
+        return results
+    
+    def _new_plant(self, row: int, col: int, plant_type: str) -> Optional[Plant]:
+        """校验放置并扣除阳光、占用格子，返回尚未加入场上的植物；不能放置时返回 None"""
+        plant_cls = PLANT_CLASSES.get(plant_type)
+        if plant_cls is None or self.sun_count < plant_cls.cost:
+            return None
+        
+        # 检查位置是否被占用
+        if self.is_occupied(row, col):
+            return None
+        
+        self.occupancy |= 1 << (row * self.grid_cols + col)
+        self.sun_count -= plant_cls.cost
+        self.sun_spent += plant_cls.cost
+        return plant_cls(row, col, self.lawn_left, self.lawn_top, self.grid_size)
+    
+    def is_occupied(self, row: int, col: int) -> bool:
+        """检查格子上是否已有植物，草坪以外的格子视为不可放置"""
+        if not (0 <= row < self.grid_rows and 0 <= col < self.grid_cols):
+            return True
+        return bool(self.occupancy >> (row * self.grid_cols + col) & 1)
+    
+    def _free_cell(self, row: int, col: int):
+        """植物死亡后空出格子"""
+        self.occupancy &= ~(1 << (row * self.grid_cols + col))
+    
+    def _add_plants(self, plants: List[Plant]):
+        """将一批新植物加入场上（子类可替换为整批写入）"""
+        for plant in plants:
+            self._add_plant(plant)
+    
+    def _add_plant(self, plant: Plant):
+        """将新植物加入场上"""
+        handle = self.plants.append(plant)
+        self.lanes.add_plant(plant)
+        due = plant.attach(self.timers)
+        if due is not None:
+            self.timers.schedule(due, (TIMER_PLANT, handle))
+    
+    def collect_sun(self, sun_handle: int) -> bool:
+        """收集阳光，sun_handle 为 check_sun_click 返回的句柄"""
+        if self.recorder is not None:
+            self.recorder.record_collect_sun(self.tick, sun_handle)
+        value = self.economy.collect(sun_handle)
+        if value:
+            self.sun_count += value
+            self.sun_collected += value
+            return True
+        return False
+    
+    def get_grid_position(self, x: int, y: int) -> tuple:
+        """获取鼠标点击的网格位置"""
+        if (self.lawn_left <= x <= self.lawn_left + self.grid_cols * self.grid_size and
+            self.lawn_top <= y <= self.lawn_top + self.grid_rows * self.grid_size):
+            col = (x - self.lawn_left) // self.grid_size
+            row = (y - self.lawn_top) // self.grid_size
+            return row, col
+        return None, None
+    
+    def check_sun_click(self, x: int, y: int) -> int:
+        """检查是否点击了阳光，返回阳光句柄，未点中返回 -1"""
+        hits = self.economy.suns_at(x, y)
+        return hits[0] if hits else -1
+    
+    def suns_at(self, x: int, y: int) -> List[int]:
+        """指针位置下的全部阳光句柄（用于悬停提示等），先绘制的在前"""
+        return self.economy.suns_at(x, y)
+    
+    def pause(self):
+        """暂停游戏"""
+        if self.recorder is not None:
+            self.recorder.record_pause(self.tick)
+        self.is_paused = True
+    
+    def resume(self):
+        """恢复游戏"""
+        if self.recorder is not None:
+            self.recorder.record_resume(self.tick)
+        self.is_paused = False
+    
+    def pool_stats(self) -> Dict[str, Dict[str, int]]:
+        """豌豆池和阳光池的统计数据（复用/新建次数、借出数量峰值等）"""
+        return {
+            'peas': self.pea_pool.stats(),
+            'suns': self.sun_pool.stats()
+        }
+    
+    def sun_metrics(self) -> Dict[str, float]:
+        """阳光经济的统计数据（各来源产量、收集量、每分钟产量等，见 SunEconomy.metrics）"""
+        return self.economy.metrics()
+    
+    def get_game_state(self) -> Dict[str, Any]:
+        """获取游戏状态"""
+        return {
+            'sun_count': self.sun_count,
+            'score': self.score,
+            'current_level': self.current_level,
+            'zombies_killed': self.zombies_killed,
+            'total_zombies': self.total_zombies_for_level,
+            'game_over': self.game_over,
+            'level_complete': self.level_complete,
+            'is_paused': self.is_paused,
+            'difficulty': self.difficulty
+        }
@@ -1,15 +1,46 @@
-import json
 import os
-from typing import Dict, Any
+import threading
+from contextlib import contextmanager
+from functools import partial
+from typing import Dict, Any, Optional, Set
 from .level_data import get_level_data
+from ..utils.save_writer import SaveWriter, get_backend, save_writer
+from ..utils.storage import DEFAULT_PROGRESS
 
 class LevelManager:
-    """关卡管理器"""
+    """
+    关卡管理器
     
-    def __init__(self, save_dir: str = "data/save_data"):
+    存档默认保存在进程共用的 SQLite 数据库中（见 utils.storage），
+    也可以用 backend 指定按文件保存的格式（见 utils.save_writer.SAVE_BACKENDS）。
+    存档数据按难度缓存在内存中，查询不再访问存储。缓存以存档格式给出的签名校验
+    （数据库版本号和本进程的写入次数，或文件的修改时间和大小），存档被其他进程修改后下次查询时重新读取。
+    保存时先更新缓存，再交给后台线程写入，不阻塞游戏循环；
+    在 batch() 中的多次保存会合并，退出时每个存档只提交一次。
+    """
+    
+    # 没有存档时的默认数据
+    DEFAULT_GAME_DATA = DEFAULT_PROGRESS
+    
+    def __init__(self, save_dir: str = "data/save_data", backend: Any = "sqlite",
+                 writer: Optional[SaveWriter] = None):
         self.save_dir = save_dir
-        self.ensure_save_directory()
         self.max_level = 30
+        self.backend = get_backend(backend)
+        self.writer = save_writer if writer is None else writer
+        # 难度 -> 存档数据
+        self._cache: Dict[str, Dict[str, Any]] = {}
+        # 难度 -> 读取或写入时存档的签名
+        self._signatures: Dict[str, Any] = {}
+        # 已修改但尚未提交写入的难度
+        self._dirty: Set[str] = set()
+        # 已提交但后台线程尚未写完的难度 -> 提交序号
+        self._in_flight: Dict[str, int] = {}
+        self._write_version = 0
+        self._lock = threading.Lock()
+        self._batch_depth = 0
+        self.disk_reads = 0
+        self.disk_writes = 0
     
     def ensure_save_directory(self):
         """确保保存目录存在"""
@@ -17,43 +48,116 @@ class LevelManager:
             os.makedirs(self.save_dir)
     
     def get_save_file_path(self, difficulty: str) -> str:
-        """获取存档文件路径"""
-        return os.path.join(self.save_dir, f"game_save_{difficulty}.json")
+        """获取存档位置（文件格式为文件路径，SQLite 格式为难度名）"""
+        return self.backend.key(self.save_dir, difficulty)
     
-    def load_game_data(self, difficulty: str) -> Dict[str, Any]:
-        """加载游戏数据"""
-        save_file = self.get_save_file_path(difficulty)
-        
-        if os.path.exists(save_file):
-            try:
-                with open(save_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, KeyError):
-                pass
+    def _cached_data(self, difficulty: str) -> Dict[str, Any]:
+        """返回缓存的存档数据（不复制），缓存失效时重新读取存档"""
+        if difficulty in self._dirty or difficulty in self._in_flight:
+            # 尚未写完的修改优先于磁盘上的内容
+            return self._cache[difficulty]
+        save_key = self.get_save_file_path(difficulty)
+        signature = self.backend.signature(save_key)
+        if difficulty in self._cache and self._signatures.get(difficulty) == signature:
+            return self._cache[difficulty]
         
-        # 返回默认数据
-        return {
-            "current_level": 1,
-            "score": 0,
-            "unlocked_levels": 1,
-            "total_sun_collected": 0,
-            "total_zombies_killed": 0
-        }
+        self.disk_reads += 1
+        try:
+            game_data = self.backend.read(save_key)
+        except (ValueError, KeyError, OSError):
+            game_data = None
+        if game_data is None:
+            game_data = dict(self.DEFAULT_GAME_DATA)
+        self._cache[difficulty] = game_data
+        self._signatures[difficulty] = signature
+        return game_data
+    
+    def load_game_data(self, difficulty: str) -> Dict[str, Any]:
+        """加载游戏数据（返回缓存的副本，修改后需调用 save_game_data 保存）"""
+        return dict(self._cached_data(difficulty))
     
     def save_game_data(self, difficulty: str, game_data: Dict[str, Any]):
-        """保存游戏数据"""
-        save_file = self.get_save_file_path(difficulty)
+        """保存游戏数据；在 batch() 中只更新缓存，退出时统一提交"""
+        self._cache[difficulty] = dict(game_data)
+        self._dirty.add(difficulty)
+        if self._batch_depth:
+            return True
+        return self._write(difficulty)
+    
+    def _write(self, difficulty: str) -> bool:
+        """把缓存中的存档提交给后台线程写入"""
+        with self._lock:
+            self._write_version += 1
+            self._in_flight[difficulty] = self._write_version
+            self._dirty.discard(difficulty)
+            callback = partial(self._on_written, difficulty, self._write_version)
+        return self.writer.submit(self.get_save_file_path(difficulty), self._cache[difficulty],
+                                  self.backend, callback)
+    
+    def _on_written(self, difficulty: str, version: int, save_key: str, ok: bool):
+        """后台线程写完一次存档后调用"""
+        with self._lock:
+            if ok:
+                self.disk_writes += 1
+            if self._in_flight.get(difficulty) != version:
+                return  # 之后又提交了新的数据，由那次写入更新状态
+            if ok:
+                # 先记录签名再移出 _in_flight，查询不会把自己写入的存档当成外部修改
+                self._signatures[difficulty] = self.backend.signature(save_key)
+            else:
+                self._dirty.add(difficulty)  # 下次 flush() 时重试
+            del self._in_flight[difficulty]
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        提交所有尚未写入的存档，并等待后台线程写完
         
+        Args:
+            timeout: 最长等待秒数，None 表示一直等待
+        
+        Returns:
+            bool: 是否全部写入成功
+        """
+        for difficulty in sorted(self._dirty):
+            self._write(difficulty)
+        return self.writer.flush(timeout) and not self._dirty and not self._in_flight
+    
+    @contextmanager
+    def batch(self):
+        """合并多次保存：在 with 块中的保存只更新缓存，退出最外层 with 块时每个存档提交一次"""
+        self._batch_depth += 1
         try:
-            with open(save_file, 'w', encoding='utf-8') as f:
-                json.dump(game_data, f, ensure_ascii=False, indent=2)
-            return True
-        except Exception as e:
-            print(f"保存游戏数据失败: {e}")
-            return False
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                for difficulty in sorted(self._dirty):
+                    self._write(difficulty)
+    
+    def invalidate(self, difficulty: Optional[str] = None):
+        """丢弃缓存（不影响尚未写入的修改），下次查询时重新读取存档"""
+        for key in ([difficulty] if difficulty is not None else list(self._cache)):
+            if key not in self._dirty and key not in self._in_flight:
+                self._cache.pop(key, None)
+                self._signatures.pop(key, None)
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        缓存统计
+        
+        Returns:
+            dict: 读存档次数、写存档次数、缓存的难度数和尚未写完的难度数
+        """
+        return {
+            "disk_reads": self.disk_reads,
+            "disk_writes": self.disk_writes,
+            "cached": len(self._cache),
+            "dirty": len(self._dirty) + len(self._in_flight)
+        }
     
-    def complete_level(self, level: int, difficulty: str) -> bool:
-        """完成关卡"""
+    def complete_level(self, level: int, difficulty: str,
+                       stats: Optional[Dict[str, int]] = None) -> bool:
+        """完成关卡；stats 为本关的统计（例如 {"zombies_killed": 15}），累加到存档的 total_* 字段"""
         if level > self.max_level:
             return False
         
@@ -62,33 +166,28 @@ class LevelManager:
         # 更新游戏数据
         game_data["current_level"] = level + 1
         game_data["unlocked_levels"] = max(game_data["unlocked_levels"], level + 1)
+        for name, value in (stats or {}).items():
+            key = f"total_{name}"
+            game_data[key] = game_data.get(key, 0) + value
         
         # 保存更新后的数据
         return self.save_game_data(difficulty, game_data)
     
     def get_unlocked_levels(self, difficulty: str) -> int:
         """获取已解锁的关卡数"""
-        game_data = self.load_game_data(difficulty)
-        return game_data.get("unlocked_levels", 1)
+        return self._cached_data(difficulty).get("unlocked_levels", 1)
     
     def get_current_level(self, difficulty: str) -> int:
         """获取当前关卡"""
-        game_data = self.load_game_data(difficulty)
-        return game_data.get("current_level", 1)
+        return self._cached_data(difficulty).get("current_level", 1)
     
     def reset_progress(self, difficulty: str):
         """重置游戏进度"""
-        default_data = {
-            "current_level": 1,
-            "score": 0,
-            "unlocked_levels": 1,
-            "total_sun_collected": 0,
-            "total_zombies_killed": 0
-        }
-        self.save_game_data(difficulty, default_data)
+        self.save_game_data(difficulty, self.DEFAULT_GAME_DATA)
     
-    def get_level_info(self, level: int, difficulty: str) -> Dict[str, Any]:
-        """获取关卡信息"""
+    def get_level_info(self, level: int, difficulty: str,
+                       unlocked_levels: Optional[int] = None) -> Dict[str, Any]:
+        """获取关卡信息（unlocked_levels 为 None 时从存档查询）"""
         level_data = get_level_data(level)
         if not level_data:
             return None
@@ -105,12 +204,14 @@ class LevelManager:
             "level": level,
             "zombie_count": zombie_count,
             "description": level_data.description,
-            "unlocked": level <= self.get_unlocked_levels(difficulty)
+            "unlocked": level <= (self.get_unlocked_levels(difficulty)
+                                  if unlocked_levels is None else unlocked_levels)
         }
     
     def get_all_levels_info(self, difficulty: str) -> list:
         """获取所有关卡信息"""
         levels_info = []
+        unlocked_levels = self.get_unlocked_levels(difficulty)
         for level in range(1, self.max_level + 1):
-            levels_info.append(self.get_level_info(level, difficulty))
+            levels_info.append(self.get_level_info(level, difficulty, unlocked_levels))
         return levels_info
@@ -0,0 +1,37 @@
+"""
+引擎子系统模块
+包含游戏引擎使用的索引、调度等内部子系统
+
+子模块按需导入，例如引擎只用到 LaneIndex 时不会导入 NumPy 或 multiprocessing。
+"""
+
+from .._lazy import lazy_exports
+
+# 导出的名称 -> 所在的子模块
+_EXPORTS = {
+    'LaneIndex': '.lane_index',
+    'EntityPool': '.entity_pool',
+    'ObjectPool': '.object_pool',
+    'SpatialHash': '.spatial_hash',
+    'SunEconomy': '.sun_economy',
+    'TimerWheel': '.timer_wheel',
+    'ProjectileSystem': '.projectiles',
+    'VectorSimulation': '.vector_sim',
+    'HeadlessResult': '.headless',
+    'run_headless': '.headless',
+    'Replay': '.replay',
+    'ReplayRecorder': '.replay',
+    'ReplayPlayer': '.replay',
+    'play_replay': '.replay',
+    'state_digest': '.replay',
+    'TickProfiler': '.profiler',
+    'STRATEGIES': '.strategies',
+    'BatchJob': '.batch',
+    'make_jobs': '.batch',
+    'run_batch': '.batch',
+    'run_job': '.batch'
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,218 @@
+import csv
+import itertools
+import json
+import multiprocessing
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .strategies import STRATEGIES
+
+# 结果文件中的列，顺序固定
+RESULT_COLUMNS = (
+    'seed', 'level', 'difficulty', 'strategy', 'vectorized', 'balance',
+    'won', 'game_over', 'ticks', 'zombies_killed', 'total_zombies',
+    'sun_spent', 'sun_collected', 'sun_produced', 'sun_per_minute', 'score', 'elapsed'
+)
+
+
+@dataclass(frozen=True)
+class BatchJob:
+    """一次无头模拟的参数"""
+    seed: int
+    level: int
+    difficulty: str = "normal"
+    strategy: str = "peashooter_wall"
+    # 当前难度下覆盖的平衡参数，例如 (("zombie_health", 120),)
+    balance: Tuple[Tuple[str, float], ...] = ()
+    max_ticks: int = 200000
+    vectorized: bool = False
+    # 产生的阳光直接计入阳光数，不生成阳光对象（与每帧收集全部阳光的结果相同）
+    auto_collect: bool = False
+
+
+def run_job(job: BatchJob) -> Dict[str, Any]:
+    """
+    在当前进程中运行一次无头模拟
+
+    Args:
+        job: 模拟参数
+
+    Returns:
+        dict: 一行结果，键为 RESULT_COLUMNS
+    """
+    if job.vectorized:
+        from ..vector_engine import VectorGameEngine as engine_cls
+    else:
+        from ..game_engine import GameEngine as engine_cls
+
+    balance = {key: {job.difficulty: value} for key, value in job.balance}
+    engine = engine_cls(900, 600, headless=True, seed=job.seed, balance=balance,
+                        auto_collect=job.auto_collect)
+    engine.set_difficulty(job.difficulty)
+    engine.set_level(job.level)
+    strategy = STRATEGIES[job.strategy]
+
+    start = time.perf_counter()
+    while not engine.is_finished() and engine.tick < job.max_ticks:
+        strategy(engine)
+        engine.step()
+    elapsed = time.perf_counter() - start
+    economy = engine.sun_metrics()
+
+    return {
+        'seed': job.seed,
+        'level': job.level,
+        'difficulty': job.difficulty,
+        'strategy': job.strategy,
+        'vectorized': job.vectorized,
+        'balance': json.dumps(dict(job.balance), sort_keys=True),
+        'won': engine.level_complete,
+        'game_over': engine.game_over,
+        'ticks': engine.tick,
+        'zombies_killed': engine.zombies_killed,
+        'total_zombies': engine.total_zombies_for_level,
+        'sun_spent': engine.sun_spent,
+        'sun_collected': engine.sun_collected,
+        'sun_produced': economy['produced'],
+        'sun_per_minute': economy['per_minute'],
+        'score': engine.score,
+        'elapsed': elapsed,
+    }
+
+
+def make_jobs(levels: Iterable[int], difficulties: Iterable[str], seeds: Iterable[int],
+              strategies: Iterable[str] = ("peashooter_wall",),
+              balance_grid: Optional[Dict[str, Sequence[float]]] = None,
+              **job_options) -> List[BatchJob]:
+    """
+    按参数网格生成任务（各参数取笛卡尔积）
+
+    Args:
+        levels: 关卡列表
+        difficulties: 难度列表
+        seeds: 随机种子列表
+        strategies: 放置策略名称列表
+        balance_grid: 平衡参数及其候选值，例如 {"zombie_health": [100, 150]}
+        job_options: 传给 BatchJob 的其他参数
+
+    Returns:
+        list: 任务列表
+    """
+    balance_grid = balance_grid or {}
+    keys = sorted(balance_grid)
+    balances = [tuple(zip(keys, values))
+                for values in itertools.product(*(balance_grid[key] for key in keys))]
+    return [
+        BatchJob(seed, level, difficulty, strategy, balance, **job_options)
+        for balance, difficulty, level, strategy, seed in itertools.product(
+            balances, list(difficulties), list(levels), list(strategies), list(seeds))
+    ]
+
+
+class ResultWriter:
+    """流式写出模拟结果
+
+    路径以 .parquet 结尾时按行组写出列式 Parquet 文件（需要安装 pyarrow），
+    否则写出 CSV。结果边产生边写入，不会在内存中积累。
+    """
+
+    def __init__(self, path: str, row_group_size: int = 4096):
+        self.path = path
+        self.row_group_size = row_group_size
+        self.rows_written = 0
+        self._buffer: List[Dict[str, Any]] = []
+        self._parquet = None
+        self._csv_file = None
+        self._csv = None
+
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        if path.endswith('.parquet'):
+            try:
+                import pyarrow
+                import pyarrow.parquet
+            except ImportError:
+                raise ImportError("写出 Parquet 文件需要安装 pyarrow")
+            self._pa = pyarrow
+            self._pq = pyarrow.parquet
+        else:
+            self._csv_file = open(path, 'w', newline='', encoding='utf-8')
+            self._csv = csv.DictWriter(self._csv_file, fieldnames=RESULT_COLUMNS)
+            self._csv.writeheader()
+
+    def write(self, row: Dict[str, Any]):
+        """写入一行结果"""
+        self.rows_written += 1
+        if self._csv is not None:
+            self._csv.writerow(row)
+            return
+        self._buffer.append(row)
+        if len(self._buffer) >= self.row_group_size:
+            self._flush_row_group()
+
+    def _flush_row_group(self):
+        if not self._buffer:
+            return
+        table = self._pa.table({name: [row[name] for row in self._buffer] for name in RESULT_COLUMNS})
+        if self._parquet is None:
+            self._parquet = self._pq.ParquetWriter(self.path, table.schema)
+        self._parquet.write_table(table)
+        self._buffer.clear()
+
+    def close(self):
+        """写出剩余数据并关闭文件"""
+        if self._csv_file is not None:
+            self._csv_file.close()
+            self._csv_file = None
+        else:
+            self._flush_row_group()
+            if self._parquet is not None:
+                self._parquet.close()
+                self._parquet = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def run_batch(jobs: Sequence[BatchJob], results_path: str, workers: Optional[int] = None,
+              chunksize: Optional[int] = None, progress=None) -> int:
+    """
+    在进程池中并行运行一批模拟，结果按完成顺序流式写入文件
+
+    Args:
+        jobs: 任务列表
+        results_path: 结果文件路径（.csv 或 .parquet）
+        workers: 工作进程数，默认为 CPU 核数
+        chunksize: 每次分派给工作进程的任务数，默认按任务量自动选择
+        progress: 可选回调 progress(done, total)
+
+    Returns:
+        int: 完成的任务数
+    """
+    workers = workers or os.cpu_count() or 1
+    if chunksize is None:
+        # 每个进程分到多批任务，兼顾负载均衡和进程间通信开销
+        chunksize = max(1, len(jobs) // (workers * 8))
+
+    pool = multiprocessing.Pool(workers) if workers > 1 else None
+    try:
+        if pool is not None:
+            results = pool.imap_unordered(run_job, jobs, chunksize)
+        else:
+            results = map(run_job, jobs)
+        with ResultWriter(results_path) as writer:
+            for row in results:
+                writer.write(row)
+                if progress:
+                    progress(writer.rows_written, len(jobs))
+            return writer.rows_written
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
@@ -0,0 +1,165 @@
+from typing import Callable, Generic, Iterable, Iterator, List, Optional, TypeVar, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .object_pool import ObjectPool
+
+T = TypeVar('T')
+
+# 句柄 = 代数 * SLOT_LIMIT + 槽位号
+SLOT_LIMIT = 1 << 24
+
+
+class EntityPool(Generic[T]):
+    """带代数句柄的稠密实体池
+
+    实体紧凑地存放在一个列表中，删除时把末尾元素换到空位（O(1)），
+    因此遍历顺序不固定。每个实体在加入时得到一个句柄，
+    句柄在实体存活期间保持不变；槽位被复用时代数加一，
+    旧句柄随之失效，不会误指向新实体。
+
+    指定 recycler 时，spawn 从对象池取得实体，删除的实体归还对象池复用；
+    因此 remove 返回的对象只应立即读取，不应长期持有。
+    """
+
+    def __init__(self, recycler: Optional['ObjectPool[T]'] = None):
+        self.recycler = recycler
+        self._items: List[T] = []        # 稠密存储
+        self._item_slots: List[int] = [] # 稠密下标 -> 槽位号
+        self._slot_index: List[int] = [] # 槽位号 -> 稠密下标，-1 表示空闲
+        self._generations: List[int] = []
+        self._free: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._items)
+
+    def __getitem__(self, index: int) -> T:
+        """按稠密下标取实体（下标在删除后可能改变，长期引用请使用句柄）"""
+        return self._items[index]
+
+    def add(self, item: T) -> int:
+        """加入实体，返回其句柄"""
+        if self._free:
+            slot = self._free.pop()
+            self._generations[slot] += 1
+        else:
+            slot = len(self._slot_index)
+            if slot >= SLOT_LIMIT:
+                raise OverflowError("实体池槽位已用尽")
+            self._slot_index.append(-1)
+            self._generations.append(0)
+        self._slot_index[slot] = len(self._items)
+        self._items.append(item)
+        self._item_slots.append(slot)
+        return self._generations[slot] * SLOT_LIMIT + slot
+
+    # 兼容列表的写法，例如 peas.append(pea)
+    append = add
+
+    def spawn(self, *args) -> int:
+        """从对象池取得实体并加入，返回句柄"""
+        if self.recycler is None:
+            raise TypeError("未指定对象池的实体池不能使用 spawn")
+        return self.add(self.recycler.acquire(*args))
+
+    def _resolve(self, handle: int) -> int:
+        """句柄对应的稠密下标，句柄无效时返回 -1"""
+        if handle < 0:
+            return -1
+        generation, slot = divmod(handle, SLOT_LIMIT)
+        if slot >= len(self._slot_index) or self._generations[slot] != generation:
+            return -1
+        return self._slot_index[slot]
+
+    def get(self, handle: int) -> Optional[T]:
+        """按句柄取实体，句柄已失效时返回 None"""
+        index = self._resolve(handle)
+        return self._items[index] if index >= 0 else None
+
+    def index_of(self, handle: int) -> int:
+        """句柄对应实体当前的稠密下标，句柄已失效时返回 -1"""
+        return self._resolve(handle)
+
+    def handle_at(self, index: int) -> int:
+        """稠密下标处实体的句柄"""
+        slot = self._item_slots[index]
+        return self._generations[slot] * SLOT_LIMIT + slot
+
+    def remove(self, handle: int) -> Optional[T]:
+        """按句柄删除实体并返回它，句柄已失效时返回 None"""
+        index = self._resolve(handle)
+        if index < 0:
+            return None
+        return self._remove_at(index)
+
+    def _remove_at(self, index: int) -> T:
+        items = self._items
+        item_slots = self._item_slots
+        item = items[index]
+        slot = item_slots[index]
+        last = len(items) - 1
+        if index != last:
+            items[index] = items[last]
+            moved_slot = item_slots[last]
+            item_slots[index] = moved_slot
+            self._slot_index[moved_slot] = index
+        items.pop()
+        item_slots.pop()
+        self._slot_index[slot] = -1
+        self._free.append(slot)
+        if self.recycler is not None:
+            self.recycler.release(item)
+        return item
+
+    def remove_many(self, handles: Iterable[int]) -> int:
+        """
+        按句柄删除多个实体，已失效的句柄被忽略
+
+        每次删除当前稠密下标最小的那个，删除后的顺序与 remove_if 删除同一批实体时相同
+        （适合每次只删除少量实体的场合）。
+
+        Returns:
+            int: 删除的实体数
+        """
+        resolve = self._resolve
+        pending = {handle for handle in handles if resolve(handle) >= 0}
+        removed = len(pending)
+        while pending:
+            handle = min(pending, key=resolve)
+            pending.remove(handle)
+            self._remove_at(resolve(handle))
+        return removed
+
+    def remove_if(self, predicate: Callable[[T], bool]) -> int:
+        """
+        遍历所有实体，删除 predicate 返回真的实体（就地压缩，不产生临时列表）
+
+        每个实体恰好被 predicate 处理一次；删除时末尾的实体被换到当前位置，
+        随后在同一位置继续处理。
+
+        Returns:
+            int: 删除的实体数
+        """
+        items = self._items
+        start_count = count = len(items)
+        i = 0
+        while i < count:
+            if predicate(items[i]):
+                self._remove_at(i)
+                count -= 1
+            else:
+                i += 1
+        return start_count - count
+
+    def clear(self):
+        """删除全部实体，已发出的句柄全部失效"""
+        for slot in self._item_slots:
+            self._slot_index[slot] = -1
+            self._free.append(slot)
+        if self.recycler is not None:
+            for item in self._items:
+                self.recycler.release(item)
+        self._items.clear()
+        self._item_slots.clear()
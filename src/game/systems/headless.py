@@ -0,0 +1,46 @@
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..game_engine import GameEngine
+
+
+@dataclass
+class HeadlessResult:
+    """一次无头运行的结果"""
+    ticks: int
+    elapsed: float
+    won: bool
+    state: Dict[str, Any]
+
+    @property
+    def ticks_per_second(self) -> float:
+        """每秒推进的逻辑帧数"""
+        return self.ticks / self.elapsed if self.elapsed > 0 else float('inf')
+
+
+def run_headless(engine: 'GameEngine', max_ticks: Optional[int] = None) -> HeadlessResult:
+    """
+    以 CPU 允许的最快速度推进引擎，直到关卡结束、引擎暂停或达到帧数上限
+    
+    Args:
+        engine: 以 headless=True 创建的游戏引擎
+        max_ticks: 最多推进的逻辑帧数，None 表示不限
+    
+    Returns:
+        HeadlessResult: 帧数、耗时、是否胜利及最终状态
+    """
+    start_tick = engine.tick
+    start = time.perf_counter()
+    while not engine.is_finished() and not engine.is_paused:
+        if max_ticks is not None and engine.tick - start_tick >= max_ticks:
+            break
+        engine.step()
+    elapsed = time.perf_counter() - start
+    return HeadlessResult(
+        ticks=engine.tick - start_tick,
+        elapsed=elapsed,
+        won=engine.level_complete,
+        state=engine.get_game_state()
+    )
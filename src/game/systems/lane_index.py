@@ -0,0 +1,105 @@
+from bisect import bisect_left, insort
+from operator import attrgetter
+from typing import Dict, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..entities.plants import Plant
+    from ..entities.zombies import Zombie
+
+_zombie_x = attrgetter('x')
+
+
+class LaneIndex:
+    """按行（车道）划分的实体索引
+
+    每一行维护一个按 x 坐标升序排列的僵尸列表，以及一个以列号为键的植物字典。
+    僵尸移动后由 refresh() 统一重排（近乎有序的数据排序接近线性），
+    因此“前方是否有僵尸”“离豌豆最近的僵尸”“僵尸前方的植物”
+    这几类查询都只需 O(1) 或 O(log n)，不再扫描全部实体。
+    """
+
+    def __init__(self, rows: int, cols: int, lawn_left: int, grid_size: int):
+        self.rows = rows
+        self.cols = cols
+        self.lawn_left = lawn_left
+        self.grid_size = grid_size
+        self.zombies: List[List['Zombie']] = [[] for _ in range(rows)]
+        self.plants: List[Dict[int, 'Plant']] = [{} for _ in range(rows)]
+
+    def clear(self):
+        """清空索引"""
+        for lane in self.zombies:
+            lane.clear()
+        for lane in self.plants:
+            lane.clear()
+
+    # ---- 僵尸 ----
+
+    def add_zombie(self, zombie: 'Zombie'):
+        """登记新生成的僵尸"""
+        insort(self.zombies[zombie.row], zombie, key=_zombie_x)
+
+    def remove_zombie(self, zombie: 'Zombie'):
+        """移除僵尸"""
+        lane = self.zombies[zombie.row]
+        for i, other in enumerate(lane):
+            if other is zombie:
+                del lane[i]
+                return
+
+    def refresh(self):
+        """僵尸移动后重建各行顺序，并剔除已死亡的僵尸"""
+        for lane in self.zombies:
+            if any(zombie.health <= 0 for zombie in lane):
+                lane[:] = [zombie for zombie in lane if zombie.health > 0]
+            lane.sort(key=_zombie_x)
+
+    def has_zombie_ahead(self, row: int, x: float) -> bool:
+        """检查该行 x 右侧是否有僵尸"""
+        lane = self.zombies[row]
+        return bool(lane) and lane[-1].x > x
+
+    def nearest_zombie(self, row: int, x: float, reach: float) -> Optional['Zombie']:
+        """返回该行与 x 距离小于 reach 的最近僵尸，距离相同时取更靠左者"""
+        lane = self.zombies[row]
+        i = bisect_left(lane, x - reach, key=_zombie_x)
+        best = None
+        best_distance = reach
+        while i < len(lane):
+            zombie = lane[i]
+            distance = zombie.x - x
+            if distance >= reach:
+                break
+            if abs(distance) < best_distance:
+                best = zombie
+                best_distance = abs(distance)
+            i += 1
+        return best
+
+    # ---- 植物 ----
+
+    def add_plant(self, plant: 'Plant'):
+        """登记新放置的植物"""
+        self.plants[plant.row][plant.col] = plant
+
+    def remove_plant(self, plant: 'Plant'):
+        """移除植物"""
+        lane = self.plants[plant.row]
+        if lane.get(plant.col) is plant:
+            del lane[plant.col]
+
+    def plant_at(self, row: int, col: int) -> Optional['Plant']:
+        """获取指定格子上的植物"""
+        return self.plants[row].get(col)
+
+    def plant_in_front(self, row: int, x: float) -> Optional['Plant']:
+        """返回与 x 水平距离小于一个格子的植物，优先取僵尸正前方（左侧）那一格"""
+        lane = self.plants[row]
+        if not lane:
+            return None
+        col = int((x - self.lawn_left) // self.grid_size)
+        for c in (col, col + 1):
+            plant = lane.get(c)
+            if plant is not None and abs(plant.x - x) < self.grid_size:
+                return plant
+        return None
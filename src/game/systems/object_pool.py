@@ -0,0 +1,51 @@
+from typing import Dict, Generic, List, Type, TypeVar
+
+T = TypeVar('T')
+
+
+class ObjectPool(Generic[T]):
+    """可回收对象池
+
+    acquire 优先复用已回收的对象（调用其 reset 方法重置状态），
+    没有可用对象时才新建；release 把对象放回池中等待复用。
+    池化的类需要提供与构造函数参数相同的 reset 方法。
+    """
+
+    def __init__(self, cls: Type[T], max_size: int = 4096):
+        self.cls = cls
+        self.max_size = max_size
+        self._free: List[T] = []
+        self.hits = 0        # 复用已回收对象的次数
+        self.misses = 0      # 新建对象的次数
+        self.in_use = 0      # 当前借出的对象数
+        self.high_water = 0  # 同时借出对象数的最大值
+
+    def acquire(self, *args) -> T:
+        """取出一个对象并用 args 初始化"""
+        if self._free:
+            obj = self._free.pop()
+            obj.reset(*args)
+            self.hits += 1
+        else:
+            obj = self.cls(*args)
+            self.misses += 1
+        self.in_use += 1
+        if self.in_use > self.high_water:
+            self.high_water = self.in_use
+        return obj
+
+    def release(self, obj: T):
+        """归还对象，池已满时直接丢弃"""
+        self.in_use -= 1
+        if len(self._free) < self.max_size:
+            self._free.append(obj)
+
+    def stats(self) -> Dict[str, int]:
+        """对象池统计数据"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'in_use': self.in_use,
+            'high_water': self.high_water,
+            'free': len(self._free),
+        }
@@ -0,0 +1,153 @@
+import gc
+import json
+import os
+import sys
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..game_engine import GameEngine
+
+_perf_counter = time.perf_counter
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class TickProfiler:
+    """逐帧性能采样器
+
+    挂接到 GameEngine.profiler 后，update 会为每个阶段计时，并记录实体数量、
+    内存块增量和垃圾回收次数；未挂接时 update 只多一次 None 判断。
+    最近 window 帧的耗时用于计算 p50/p95/p99，dump_path 不为空时
+    每 dump_every 帧追加一条记录（.csv 写 CSV，其余写 JSONL）。
+    """
+
+    def __init__(self, window: int = 600, dump_path: Optional[str] = None, dump_every: int = 60):
+        self.window = window
+        self.dump_path = dump_path
+        self.dump_every = dump_every
+
+        self.ticks = 0
+        self.tick_times = deque(maxlen=window)   # 每帧 update 耗时（毫秒）
+        self.frame_times = deque(maxlen=window)  # 两次 mark_frame 之间的完整帧耗时（毫秒）
+        self.phase_totals: Dict[str, float] = {}  # 各阶段累计耗时（秒）
+        self.last_phases: Dict[str, float] = {}   # 最近一帧各阶段耗时（毫秒）
+        self.entity_counts: Dict[str, int] = {}
+        self.allocated_blocks = 0  # 最近一帧净增的内存块数
+        self.gc_collections = 0    # 累计垃圾回收次数
+
+        self._tick_start = 0.0
+        self._blocks_start = 0
+        self._last_frame = None
+        self._dump_file = None
+
+    # ---- 由引擎调用 ----
+
+    def begin_tick(self):
+        self._blocks_start = sys.getallocatedblocks()
+        self._tick_start = _perf_counter()
+
+    def time_phase(self, name: str, method: Callable, *args):
+        """调用一个更新阶段并记录耗时"""
+        start = _perf_counter()
+        result = method(*args)
+        elapsed = _perf_counter() - start
+        self.phase_totals[name] = self.phase_totals.get(name, 0.0) + elapsed
+        self.last_phases[name] = elapsed * 1000
+        return result
+
+    def end_tick(self, engine: 'GameEngine'):
+        self.tick_times.append((_perf_counter() - self._tick_start) * 1000)
+        self.allocated_blocks = sys.getallocatedblocks() - self._blocks_start
+        self.ticks += 1
+        if self.dump_path and self.ticks % self.dump_every == 0:
+            self._dump(engine)
+
+    # ---- 由主循环调用 ----
+
+    def mark_frame(self):
+        """在每个渲染帧结束时调用，记录包含绘制在内的完整帧耗时"""
+        now = _perf_counter()
+        if self._last_frame is not None:
+            self.frame_times.append((now - self._last_frame) * 1000)
+        self._last_frame = now
+
+    # ---- 查询 ----
+
+    @staticmethod
+    def _count_entities(engine: 'GameEngine') -> Dict[str, int]:
+        return {
+            'plants': len(engine.plants),
+            'zombies': len(engine.zombies),
+            'peas': len(engine.peas),
+            'suns': len(engine.suns),
+        }
+
+    def percentiles(self, frames: bool = False) -> Dict[str, float]:
+        """最近 window 帧的 p50/p95/p99（毫秒），frames=True 时统计完整帧耗时"""
+        values = sorted(self.frame_times if frames else self.tick_times)
+        return {
+            'p50': _percentile(values, 0.50),
+            'p95': _percentile(values, 0.95),
+            'p99': _percentile(values, 0.99),
+        }
+
+    def snapshot(self, engine: Optional['GameEngine'] = None) -> Dict[str, Any]:
+        """当前统计数据"""
+        if engine is not None:
+            self.entity_counts = self._count_entities(engine)
+        self.gc_collections = sum(stat['collections'] for stat in gc.get_stats())
+        data = {
+            'ticks': self.ticks,
+            'tick_ms': self.percentiles(),
+            'frame_ms': self.percentiles(frames=True),
+            'phases_ms': dict(self.last_phases),
+            'entities': dict(self.entity_counts),
+            'allocated_blocks': self.allocated_blocks,
+            'gc_collections': self.gc_collections,
+        }
+        if engine is not None:
+            data.update(level=engine.current_level, tick=engine.tick,
+                        zombies_spawned=engine.zombies_spawned, zombies_killed=engine.zombies_killed)
+        return data
+
+    # ---- 输出 ----
+
+    def _dump(self, engine: 'GameEngine'):
+        if self._dump_file is None:
+            directory = os.path.dirname(self.dump_path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+            self._dump_file = open(self.dump_path, 'a', encoding='utf-8')
+        data = self.snapshot(engine)
+        if self.dump_path.endswith('.csv'):
+            row = self._flatten(data)
+            if self._dump_file.tell() == 0:
+                # 追加到已有文件时不重复写表头
+                self._dump_file.write(','.join(row) + '\n')
+            self._dump_file.write(','.join(str(value) for value in row.values()) + '\n')
+        else:
+            self._dump_file.write(json.dumps(data) + '\n')
+        self._dump_file.flush()
+
+    @staticmethod
+    def _flatten(data: Dict[str, Any], prefix: str = '') -> Dict[str, Any]:
+        row = {}
+        for key, value in data.items():
+            if isinstance(value, dict):
+                row.update(TickProfiler._flatten(value, f"{prefix}{key}."))
+            else:
+                row[prefix + key] = value
+        return row
+
+    def close(self):
+        """关闭输出文件"""
+        if self._dump_file is not None:
+            self._dump_file.close()
+            self._dump_file = None
@@ -0,0 +1,114 @@
+import math
+from bisect import bisect_left
+from operator import attrgetter
+from typing import Any, Dict, List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..entities.projectiles import Pea
+    from ..entities.zombies import Zombie
+    from .entity_pool import EntityPool
+    from .lane_index import LaneIndex
+    from .timer_wheel import TimerWheel
+
+_zombie_x = attrgetter('x')
+
+# 预测时扣除的余量（帧），抵消僵尸坐标逐帧累减产生的浮点误差
+_EPSILON = 1e-6
+
+
+class ProjectileSystem:
+    """豌豆的命中预测与结算
+
+    豌豆和僵尸都沿所在行匀速相向移动（僵尸被植物挡住时停下），因此发射时就能算出
+    豌豆最早可能击中僵尸的帧：假设该行每个僵尸都以场上最快的僵尸速度前进，
+    取最先进入命中距离的那一帧。豌豆只在这一帧（或飞出屏幕的那一帧）检查命中，
+    其余时间不产生任何开销；没有命中时从当时的位置重新预测。
+
+    预测只会偏早不会偏晚，因此结果与逐帧检查完全相同。僵尸被挡住、死亡都只会推迟命中，
+    不需要处理；只有新僵尸上场可能让命中提前，此时重新预测该行的豌豆。
+
+    定时器挂在引擎的时间轮上，内容为 (timer_kind, 豌豆句柄)，到期时由引擎调用 wake()。
+    时间轮不能取消定时器，豌豆的 wake_tick 记录当前有效的检查帧，其余定时器到期时忽略。
+    """
+
+    def __init__(self, peas: 'EntityPool[Pea]', lanes: 'LaneIndex', timers: 'TimerWheel', timer_kind: Any):
+        self.peas = peas
+        self.lanes = lanes
+        self.timers = timers
+        self.timer_kind = timer_kind
+        self.max_zombie_speed = 0.0
+        self._rows: List[Dict[int, 'Pea']] = [{} for _ in range(lanes.rows)]  # 每行飞行中的豌豆
+        self._due: List[int] = []  # 本帧需要检查的豌豆句柄
+
+    def fire(self, x: int, y: int, row: int) -> int:
+        """发射豌豆（由豌豆池复用已回收的对象），返回句柄"""
+        handle = self.peas.spawn(x, y, row)
+        pea = self.peas.get(handle)
+        pea.launch(self.timers)
+        self._rows[row][handle] = pea
+        self._set_wake(handle, pea, self._predict(pea, 0))
+        return handle
+
+    def wake(self, handle: int):
+        """时间轮上的定时器到期"""
+        self._due.append(handle)
+
+    def zombie_added(self, zombie: 'Zombie'):
+        """新僵尸上场后调用，重新预测该行的豌豆"""
+        if zombie.speed > self.max_zombie_speed:
+            self.max_zombie_speed = zombie.speed
+        for handle, pea in self._rows[zombie.row].items():
+            wake_tick = self._predict(pea, 0)
+            if wake_tick < pea.wake_tick:
+                self._set_wake(handle, pea, wake_tick)
+
+    def update(self) -> int:
+        """
+        结算本帧到期的豌豆
+
+        Returns:
+            int: 移除的豌豆数（击中僵尸或飞出屏幕）
+        """
+        due, self._due = self._due, []
+        now = self.timers.now
+        lanes = self.lanes
+        removed = []
+        for handle in due:
+            pea = self.peas.get(handle)
+            if pea is None or pea.wake_tick != now:
+                continue  # 已移除或定时器已过期
+            if pea.strike(lanes):
+                pea.wake_tick = -1
+                del self._rows[pea.row][handle]
+                removed.append(handle)
+            else:
+                self._set_wake(handle, pea, self._predict(pea, 1))
+        if removed:
+            self.peas.remove_many(removed)
+        return len(removed)
+
+    def _predict(self, pea: 'Pea', min_ticks: int) -> int:
+        """
+        豌豆最早可能击中僵尸或飞出屏幕的逻辑帧
+
+        Args:
+            pea: 豌豆
+            min_ticks: 至少在多少帧之后（本帧已检查过为 1，否则为 0）
+        """
+        now = self.timers.now
+        wake_tick = pea.exit_tick
+        x = pea.x
+        lane = self.lanes.zombies[pea.row]
+        # 已经落在豌豆身后命中距离之外的僵尸不会再被这颗豌豆击中
+        i = bisect_left(lane, x - pea.reach, key=_zombie_x)
+        if i < len(lane):
+            ticks = (lane[i].x - x - pea.reach) / (pea.speed + self.max_zombie_speed)
+            wake_tick = min(wake_tick, now + max(min_ticks, math.floor(ticks - _EPSILON) + 1))
+        return max(wake_tick, now + min_ticks)
+
+    def _set_wake(self, handle: int, pea: 'Pea', wake_tick: int):
+        pea.wake_tick = wake_tick
+        if wake_tick <= self.timers.now:
+            self._due.append(handle)
+        else:
+            self.timers.schedule(wake_tick, (self.timer_kind, handle))
@@ -0,0 +1,206 @@
+import hashlib
+import struct
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple, Type, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..game_engine import GameEngine
+
+# 录像文件格式（小端）：
+#   文件头  magic(4s) version(B) seed(Q) level(H) difficulty(B) fps(B) width(H) height(H)
+#   事件    tick(I) op(B) + 各操作的参数
+#   结束    tick(I) OP_END
+MAGIC = b"PVZR"
+VERSION = 2
+_HEADER = struct.Struct("<4sBQHBBHH")
+_EVENT = struct.Struct("<IB")
+
+OP_PLACE_PLANT = 1
+OP_COLLECT_SUN = 2
+OP_PAUSE = 3
+OP_RESUME = 4
+OP_END = 255
+
+# 各操作参数的编码格式
+_PAYLOADS = {
+    OP_PLACE_PLANT: struct.Struct("<BBB"),  # row, col, plant_type
+    OP_COLLECT_SUN: struct.Struct("<q"),    # 阳光句柄
+    OP_PAUSE: None,
+    OP_RESUME: None,
+    OP_END: None,
+}
+
+DIFFICULTIES = ("easy", "normal", "hard")
+PLANT_TYPES = ("peashooter", "sunflower")
+
+
+@dataclass
+class Replay:
+    """一局游戏的输入录像"""
+    seed: int
+    level: int
+    difficulty: str
+    fps: int = 60
+    screen_width: int = 900
+    screen_height: int = 600
+    events: List[Tuple[int, int, tuple]] = field(default_factory=list)
+    end_tick: Optional[int] = None
+
+    def to_bytes(self) -> bytes:
+        """编码为紧凑的二进制格式"""
+        parts = [_HEADER.pack(MAGIC, VERSION, self.seed, self.level,
+                              DIFFICULTIES.index(self.difficulty), self.fps,
+                              self.screen_width, self.screen_height)]
+        for tick, op, args in self.events:
+            parts.append(_EVENT.pack(tick, op))
+            payload = _PAYLOADS[op]
+            if payload is not None:
+                parts.append(payload.pack(*args))
+        if self.end_tick is not None:
+            parts.append(_EVENT.pack(self.end_tick, OP_END))
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'Replay':
+        """从二进制数据解码"""
+        magic, version, seed, level, difficulty, fps, width, height = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("不是有效的录像文件")
+        replay = cls(seed, level, DIFFICULTIES[difficulty], fps, width, height)
+        offset = _HEADER.size
+        while offset < len(data):
+            tick, op = _EVENT.unpack_from(data, offset)
+            offset += _EVENT.size
+            if op not in _PAYLOADS:
+                raise ValueError(f"未知的录像操作 {op}")
+            if op == OP_END:
+                replay.end_tick = tick
+                break
+            payload = _PAYLOADS[op]
+            args = ()
+            if payload is not None:
+                args = payload.unpack_from(data, offset)
+                offset += payload.size
+            replay.events.append((tick, op, args))
+        return replay
+
+    def save(self, path: str):
+        """保存录像文件"""
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> 'Replay':
+        """读取录像文件"""
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+
+class ReplayRecorder:
+    """挂接到引擎上，按逻辑帧记录玩家输入
+
+    应在 set_level 之后创建，此时引擎的种子、关卡和难度即为录像的起始条件。
+    """
+
+    def __init__(self, engine: 'GameEngine'):
+        self.replay = Replay(engine.seed, engine.current_level, engine.difficulty,
+                             engine.fps, engine.screen_width, engine.screen_height)
+        self.engine = engine
+        engine.recorder = self
+
+    def record_place_plant(self, tick: int, row: int, col: int, plant_type: str):
+        engine = self.engine
+        if plant_type not in PLANT_TYPES or not (0 <= row < engine.grid_rows and 0 <= col < engine.grid_cols):
+            return  # 草坪以外的格子和未知的植物种类不会放置成功，不影响回放
+        self.replay.events.append((tick, OP_PLACE_PLANT, (row, col, PLANT_TYPES.index(plant_type))))
+
+    def record_collect_sun(self, tick: int, sun_handle: int):
+        self.replay.events.append((tick, OP_COLLECT_SUN, (sun_handle,)))
+
+    def record_pause(self, tick: int):
+        self.replay.events.append((tick, OP_PAUSE, ()))
+
+    def record_resume(self, tick: int):
+        self.replay.events.append((tick, OP_RESUME, ()))
+
+    def stop(self) -> Replay:
+        """结束录制并返回录像"""
+        self.replay.end_tick = self.engine.tick
+        self.engine.recorder = None
+        return self.replay
+
+
+class ReplayPlayer:
+    """在无头引擎中逐帧回放录像：每次 step() 先应用本帧的输入，再推进一帧"""
+
+    def __init__(self, replay: Replay, engine_cls: Optional[Type['GameEngine']] = None):
+        if engine_cls is None:
+            from ..game_engine import GameEngine
+            engine_cls = GameEngine
+        self.replay = replay
+        self.engine = engine_cls(replay.screen_width, replay.screen_height,
+                                 headless=True, fps=replay.fps, seed=replay.seed)
+        self.engine.set_difficulty(replay.difficulty)
+        self.engine.set_level(replay.level)
+        self._next = 0  # 下一个要应用的输入
+
+    def step(self) -> bool:
+        """应用到期的输入并推进一帧，录像结束时返回 False"""
+        engine = self.engine
+        events = self.replay.events
+        i = self._next
+        while i < len(events) and events[i][0] <= engine.tick:
+            _apply(engine, events[i])
+            i += 1
+        self._next = i
+        if self.replay.end_tick is not None and engine.tick >= self.replay.end_tick:
+            return False
+        if engine.is_finished():
+            return False
+        if engine.is_paused:
+            # 暂停期间逻辑帧不前进，之后的输入应都在当前帧
+            return i < len(events) and events[i][0] <= engine.tick
+        engine.step()
+        return True
+
+
+def play_replay(replay: Replay, engine_cls: Optional[Type['GameEngine']] = None) -> 'GameEngine':
+    """
+    在无头引擎中以最快速度回放录像
+
+    Args:
+        replay: 录像
+        engine_cls: 使用的引擎类，默认为 GameEngine
+
+    Returns:
+        GameEngine: 回放结束时的引擎
+    """
+    player = ReplayPlayer(replay, engine_cls)
+    while player.step():
+        pass
+    return player.engine
+
+
+def _apply(engine: 'GameEngine', event: Tuple[int, int, tuple]):
+    _, op, args = event
+    if op == OP_PLACE_PLANT:
+        row, col, plant_type = args
+        engine.place_plant(row, col, PLANT_TYPES[plant_type])
+    elif op == OP_COLLECT_SUN:
+        engine.collect_sun(*args)
+    elif op == OP_PAUSE:
+        engine.pause()
+    elif op == OP_RESUME:
+        engine.resume()
+
+
+def state_digest(engine: 'GameEngine') -> str:
+    """计算引擎状态的摘要，可用于比对回放结果"""
+    state = engine.get_game_state()
+    h = hashlib.sha1(repr(sorted(state.items())).encode())
+    h.update(repr(engine.tick).encode())
+    h.update(repr(sorted((p.row, p.col, p.health, p.attack_cooldown) for p in engine.plants)).encode())
+    h.update(repr(sorted((z.row, float(z.x), z.health) for z in engine.zombies)).encode())
+    h.update(repr(sorted((p.row, float(p.x)) for p in engine.peas)).encode())
+    h.update(repr(sorted((s.x, s.y, s.timer) for s in engine.suns)).encode())
+    return h.hexdigest()
@@ -0,0 +1,75 @@
+from typing import Dict, List, Set, Tuple
+
+
+class SpatialHash:
+    """均匀网格空间哈希，用于指针命中（点击、悬停）查询
+
+    每个实体以句柄为键，按中心点所在的格子登记；实体移动后由调用方 move()，
+    只有跨过格子边界时才真正改动索引。查询只检查与查询范围相交的格子，
+    cell_size 不小于查询半径的两倍时，一次查询最多检查 4 个格子，与实体总数无关。
+    查询返回的是候选句柄，精确的命中判定由调用方完成。
+    """
+
+    def __init__(self, cell_size: int = 80):
+        self.cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], Set[int]] = {}
+        self._where: Dict[int, Tuple[int, int]] = {}  # 句柄 -> 所在格子
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __contains__(self, handle: int) -> bool:
+        return handle in self._where
+
+    def cell_of(self, x: float, y: float) -> Tuple[int, int]:
+        """坐标所在的格子"""
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def insert(self, handle: int, x: float, y: float):
+        """登记实体"""
+        cell = self.cell_of(x, y)
+        self._where[handle] = cell
+        self._cells.setdefault(cell, set()).add(handle)
+
+    def move(self, handle: int, x: float, y: float):
+        """实体移动到 (x, y)"""
+        cell = self.cell_of(x, y)
+        old = self._where.get(handle)
+        if old == cell:
+            return
+        if old is not None:
+            self._discard(old, handle)
+        self._where[handle] = cell
+        self._cells.setdefault(cell, set()).add(handle)
+
+    def remove(self, handle: int) -> bool:
+        """移除实体，返回它是否在索引中"""
+        cell = self._where.pop(handle, None)
+        if cell is None:
+            return False
+        self._discard(cell, handle)
+        return True
+
+    def _discard(self, cell: Tuple[int, int], handle: int):
+        bucket = self._cells[cell]
+        bucket.discard(handle)
+        if not bucket:
+            del self._cells[cell]
+
+    def query(self, x: float, y: float, radius: float) -> List[int]:
+        """中心点可能落在 (x, y) 周围 radius 以内的实体句柄（顺序不固定）"""
+        x0, y0 = self.cell_of(x - radius, y - radius)
+        x1, y1 = self.cell_of(x + radius, y + radius)
+        cells = self._cells
+        found = []
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.extend(bucket)
+        return found
+
+    def clear(self):
+        """清空索引"""
+        self._cells.clear()
+        self._where.clear()
@@ -0,0 +1,51 @@
+from typing import Callable, Dict, TYPE_CHECKING
+
+from ..entities.plants import PLANT_CLASSES
+
+if TYPE_CHECKING:
+    from ..game_engine import GameEngine
+
+# 脚本化的放置策略：每一帧推进前调用一次，可以收集阳光、放置植物
+
+
+def _collect_all_suns(engine: 'GameEngine'):
+    suns = engine.suns
+    while suns:
+        engine.collect_sun(suns.handle_at(len(suns) - 1))
+
+
+def _fill_columns(engine: 'GameEngine', columns, plant_type: str):
+    """按列从左到右、每列从上到下放置植物，直到阳光不足"""
+    affordable = engine.sun_count // PLANT_CLASSES[plant_type].cost
+    if affordable <= 0:
+        return
+    cells = [(row, col, plant_type) for col in columns for row in range(engine.grid_rows)
+             if not engine.is_occupied(row, col)]
+    if cells:
+        engine.place_plants(cells[:affordable])
+
+
+def idle(engine: 'GameEngine'):
+    """什么都不做，用于衡量僵尸的基准强度"""
+
+
+def peashooter_wall(engine: 'GameEngine'):
+    """收集所有阳光，并从最左列开始铺满豌豆射手"""
+    _collect_all_suns(engine)
+    if engine.sun_count >= 50:
+        _fill_columns(engine, range(engine.grid_cols), "peashooter")
+
+
+def sunflower_first(engine: 'GameEngine'):
+    """收集所有阳光，第一列种向日葵，其余列种豌豆射手"""
+    _collect_all_suns(engine)
+    if engine.sun_count >= 50:
+        _fill_columns(engine, (0,), "sunflower")
+        _fill_columns(engine, range(1, engine.grid_cols), "peashooter")
+
+
+STRATEGIES: Dict[str, Callable[['GameEngine'], None]] = {
+    'idle': idle,
+    'peashooter_wall': peashooter_wall,
+    'sunflower_first': sunflower_first,
+}
@@ -0,0 +1,195 @@
+import random
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
+
+from ..entities.sun import Sun
+from .spatial_hash import SpatialHash
+
+if TYPE_CHECKING:
+    from ..entities.plants import Plant
+    from .entity_pool import EntityPool
+    from .timer_wheel import TimerWheel
+
+
+class SunEconomy:
+    """阳光的产生、收集与统计
+
+    天上掉落的阳光和向日葵产生的阳光都经由这里结算：引擎每帧把到期的向日葵整批交给 produce()，
+    一帧只记一次产量。默认为每份阳光生成一个 Sun 实体，等待玩家点击收集或到期消失；
+    auto_collect=True 时不生成任何 Sun 对象，产量直接计入阳光数（适用于无头模拟和基准测试）。
+    自动收集时仍然抽取天上阳光的随机位置，因此随机数序列（僵尸生成）与逐个收集全部阳光时相同。
+
+    阳光到期的定时器挂在引擎的时间轮上，内容为 (timer_kind, 阳光句柄)。
+
+    场上的阳光登记在空间哈希 self.index 中，供点击和悬停查询（suns_at）使用。
+    阳光的下落位置由逻辑帧决定，因此不逐帧更新索引：生成时算出中心点跨入下一行格子的帧，
+    挂上内容为 (move_kind, 阳光句柄) 的定时器，到期时由引擎调用 reindex() 更新索引。
+
+    metrics() 给出产量、收集量、过期量以及全局和最近 window 帧（默认一分钟）的每分钟产量，
+    供平衡测试使用。
+    """
+
+    def __init__(self, suns: 'EntityPool[Sun]', timers: 'TimerWheel', timer_kind: Any, move_kind: Any,
+                 fps: int = 60, auto_collect: bool = False, window: Optional[int] = None,
+                 cell_size: int = 80):
+        self.suns = suns
+        self.timers = timers
+        self.timer_kind = timer_kind
+        self.move_kind = move_kind
+        self.index = SpatialHash(cell_size)
+        self.fps = fps
+        self.auto_collect = auto_collect
+        self.window = window if window is not None else 60 * fps
+        self.start_tick = timers.now
+        self.sky_produced = 0     # 天上掉落的阳光总值
+        self.flower_produced = 0  # 向日葵产生的阳光总值
+        self.flower_events = 0    # 向日葵产生阳光的次数
+        self.collected = 0        # 玩家点击收集的阳光总值
+        self.auto_collected = 0   # 自动收集的阳光总值
+        self.expired = 0          # 未被收集而消失的阳光总值
+        self._recent: Deque[Tuple[int, int]] = deque()  # 最近各帧的产量 (帧, 阳光值)
+        self._recent_total = 0
+
+    # ---- 产生 ----
+
+    def drop(self, screen_width: int, rng: random.Random) -> int:
+        """
+        天上掉落一个阳光
+
+        Returns:
+            int: 自动收集的阳光值（未开启自动收集时为 0）
+        """
+        x, target_y = Sun.random_position(screen_width, rng)
+        self.sky_produced += Sun.value
+        self._record(Sun.value)
+        if self.auto_collect:
+            self.auto_collected += Sun.value
+            return Sun.value
+        self._spawn(x, target_y, 0)
+        return 0
+
+    def produce(self, flowers: Iterable['Plant']) -> int:
+        """
+        结算本帧产生阳光的向日葵（按行、列顺序生成阳光，与植物的存储顺序无关）
+
+        Returns:
+            int: 自动收集的阳光值（未开启自动收集时为 0）
+        """
+        flowers = sorted(flowers, key=lambda plant: (plant.row, plant.col))
+        value = sum(plant.sun_value for plant in flowers)
+        if not value:
+            return 0
+        self.flower_produced += value
+        self.flower_events += len(flowers)
+        self._record(value)
+        if self.auto_collect:
+            self.auto_collected += value
+            return value
+        for plant in flowers:
+            # 从向日葵顶部落到格子中央
+            x = int(plant.x) + plant.grid_size // 2
+            y = int(plant.y)
+            self._spawn(x, y + plant.grid_size // 2, y)
+        return 0
+
+    def _spawn(self, x: int, target_y: int, start_y: int) -> int:
+        handle = self.suns.spawn(x, target_y, start_y)
+        sun = self.suns.get(handle)
+        self.timers.schedule(sun.start(self.timers), (self.timer_kind, handle))
+        self.index.insert(handle, sun.x, sun.y)
+        self._schedule_move(handle, sun)
+        return handle
+
+    def _schedule_move(self, handle: int, sun: Sun):
+        # 中心点下一次跨入下一行格子的帧，已经落地的阳光不再移动
+        boundary = (int(sun.y) // self.index.cell_size + 1) * self.index.cell_size
+        if boundary <= sun.rest_y:
+            self.timers.schedule(sun.tick_at(boundary), (self.move_kind, handle))
+
+    def reindex(self, handle: int):
+        """阳光下落跨过格子边界时更新空间索引"""
+        sun = self.suns.get(handle)
+        if sun is None:
+            return  # 已被收集或消失
+        self.index.move(handle, sun.x, sun.y)
+        self._schedule_move(handle, sun)
+
+    def _record(self, value: int):
+        now = self.timers.now
+        recent = self._recent
+        if recent and recent[-1][0] == now:
+            recent[-1] = (now, recent[-1][1] + value)
+        else:
+            recent.append((now, value))
+        self._recent_total += value
+        self._prune(now)
+
+    def _prune(self, now: int):
+        recent = self._recent
+        while recent and recent[0][0] <= now - self.window:
+            self._recent_total -= recent.popleft()[1]
+
+    # ---- 查询、收集与消失 ----
+
+    def suns_at(self, x: int, y: int) -> List[int]:
+        """指针位置 (x, y) 下的阳光句柄，按绘制顺序（先绘制的在前）排列"""
+        suns = self.suns
+        hits = [handle for handle in self.index.query(x, y, Sun.radius)
+                if suns.get(handle).is_clicked(x, y)]
+        if len(hits) > 1:
+            hits.sort(key=suns.index_of)
+        return hits
+
+    def collect(self, handle: int) -> int:
+        """
+        玩家收集一个阳光
+
+        Returns:
+            int: 收集到的阳光值，句柄已失效时为 0
+        """
+        sun = self.suns.remove(handle)
+        if sun is None:
+            return 0
+        self.index.remove(handle)
+        self.collected += sun.value
+        return sun.value
+
+    def expire(self, handles: Iterable[int]):
+        """移除到期的阳光"""
+        for handle in handles:
+            self.index.remove(handle)
+        self.expired += self.suns.remove_many(handles) * Sun.value
+
+    # ---- 统计 ----
+
+    @property
+    def produced(self) -> int:
+        """产生的阳光总值"""
+        return self.sky_produced + self.flower_produced
+
+    def per_minute(self, ticks: int, value: int) -> float:
+        """把 ticks 帧内的阳光值换算为每分钟产量"""
+        return value * 60 * self.fps / ticks if ticks > 0 else 0.0
+
+    def metrics(self) -> Dict[str, float]:
+        """
+        阳光经济的统计数据
+
+        Returns:
+            dict: 各来源产量、收集量、过期量、场上阳光值，以及全局和最近 window 帧的每分钟产量
+        """
+        now = self.timers.now
+        self._prune(now)
+        elapsed = now - self.start_tick
+        return {
+            'sky_produced': self.sky_produced,
+            'flower_produced': self.flower_produced,
+            'flower_events': self.flower_events,
+            'produced': self.produced,
+            'collected': self.collected,
+            'auto_collected': self.auto_collected,
+            'expired': self.expired,
+            'on_field': len(self.suns) * Sun.value,
+            'per_minute': self.per_minute(elapsed, self.produced),
+            'recent_per_minute': self.per_minute(min(elapsed, self.window), self._recent_total),
+        }
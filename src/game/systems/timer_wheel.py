@@ -0,0 +1,84 @@
+from typing import Any, List, Tuple
+
+
+class TimerWheel:
+    """分层时间轮
+
+    定时器按到期的逻辑帧挂在时间轮的槽位上。第 0 层每个槽位对应一帧，
+    第 k 层每个槽位覆盖 2^(slot_bits*k) 帧；到期帧与当前帧只在低位不同的定时器挂在低层，
+    越远的挂在越高层，推进跨过高层槽位的边界时再把该槽位的定时器下放到低层。
+    因此 schedule 和 advance 的均摊开销都是 O(1)，与挂起的定时器数量无关，
+    没有到期的定时器在推进时不会被访问。超出最高层范围的定时器放在溢出列表中。
+
+    时间轮不支持取消定时器：调用方在定时器触发时自行判断它是否仍然有效
+    （例如用实体句柄判断实体是否还在场上）。
+
+    now 是时间轮的当前帧，实体也用它换算剩余的冷却时间。
+    """
+
+    def __init__(self, now: int = 0, slot_bits: int = 6, levels: int = 4):
+        self.now = now
+        self.slot_bits = slot_bits
+        self.levels = levels
+        self._mask = (1 << slot_bits) - 1
+        self._wheels: List[List[List[Tuple[int, Any]]]] = [
+            [[] for _ in range(1 << slot_bits)] for _ in range(levels)
+        ]
+        self._overflow: List[Tuple[int, Any]] = []
+        self._count = 0
+
+    def __len__(self) -> int:
+        """尚未触发的定时器数（包括调用方已视为无效的定时器）"""
+        return self._count
+
+    def schedule(self, due: int, item: Any):
+        """在第 due 帧触发 item；due 不晚于当前帧时在下一帧触发"""
+        if due <= self.now:
+            due = self.now + 1
+        self._insert(due, item)
+        self._count += 1
+
+    def _insert(self, due: int, item: Any):
+        # 按到期帧与当前帧最高的不同位所在的层放置
+        diff = due ^ self.now
+        bits = self.slot_bits
+        for level in range(self.levels):
+            if not diff >> (bits * (level + 1)):
+                self._wheels[level][(due >> (bits * level)) & self._mask].append((due, item))
+                return
+        self._overflow.append((due, item))
+
+    def advance(self) -> List[Any]:
+        """
+        推进一帧
+
+        Returns:
+            list: 在新的当前帧到期的 item，按挂入槽位的顺序排列
+        """
+        self.now = now = self.now + 1
+        bits = self.slot_bits
+        if not now & self._mask:
+            # 跨过了上层槽位的边界，从最高的一层开始逐层下放
+            top = 1
+            while top < self.levels and not now & ((1 << (bits * (top + 1))) - 1):
+                top += 1
+            if top == self.levels:
+                overflow, self._overflow = self._overflow, []
+                for due, item in overflow:
+                    self._insert(due, item)
+                top -= 1
+            for level in range(top, 0, -1):
+                slot = self._wheels[level]
+                index = (now >> (bits * level)) & self._mask
+                timers, slot[index] = slot[index], []
+                for due, item in timers:
+                    self._insert(due, item)
+
+        slot = self._wheels[0]
+        index = now & self._mask
+        timers = slot[index]
+        if not timers:
+            return timers
+        slot[index] = []
+        self._count -= len(timers)
+        return [item for _, item in timers]
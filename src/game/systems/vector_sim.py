@@ -0,0 +1,381 @@
+from collections.abc import Sequence
+from typing import Dict, Iterable, List, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy 为可选依赖，只有向量化模式需要
+    np = None
+
+from ..entities.plants import Plant, Peashooter, Sunflower
+from ..entities.zombies import Zombie
+from ..entities.projectiles import Pea
+
+# 植物种类编号
+PEASHOOTER = 0
+SUNFLOWER = 1
+
+# 以下数值直接取自实体类，保证两种引擎一致
+PEASHOOTER_COOLDOWN = Peashooter.shoot_cooldown
+SUNFLOWER_COOLDOWN = Sunflower.sun_interval
+PEA_SPEED = Pea.speed
+PEA_DAMAGE = Pea.damage
+PEA_REACH = Pea.reach
+PEA_MAX_X = Pea.max_x
+ZOMBIE_BITE_DAMAGE = Zombie.bite_damage
+ZOMBIE_BITE_COOLDOWN = Zombie.bite_cooldown
+HOUSE_X = Zombie.house_x
+
+
+class _Table:
+    """按列（结构体数组）存放的一组实体
+
+    每一列是一个预留了容量的数组，前 n 个元素为有效的实体，列属性是这一段的视图。
+    追加时写入 [n, n + k)，容量不足时按两倍扩容；剔除实体时在原数组中原地前移压缩，
+    不重新分配数组。列属性只能原地修改（x[...] = ...、x += ...），不能整体替换。
+    """
+
+    _MIN_CAPACITY = 16
+
+    def __init__(self, fields: Dict[str, str]):
+        self._fields = fields
+        self._columns = {name: np.empty(self._MIN_CAPACITY, dtype=dtype) for name, dtype in fields.items()}
+        self.n = 0
+        self._refresh()
+
+    def __len__(self) -> int:
+        return self.n
+
+    @property
+    def capacity(self) -> int:
+        """不扩容时最多能存放的实体数"""
+        return len(self._columns[next(iter(self._fields))])
+
+    def _refresh(self):
+        # 列属性指向各列前 n 个元素
+        n = self.n
+        for name, column in self._columns.items():
+            setattr(self, name, column[:n])
+
+    def _reserve(self, count: int):
+        capacity = self.capacity
+        if count <= capacity:
+            return
+        capacity = max(count, capacity * 2)
+        for name, column in self._columns.items():
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[:self.n] = column[:self.n]
+            self._columns[name] = grown
+
+    def append(self, **columns):
+        """追加一批实体，columns 中每一列长度相同（标量视为一个实体）"""
+        values = {name: np.asarray(columns[name]).reshape(-1) for name in self._fields}
+        count = len(next(iter(values.values())))
+        if not count:
+            return
+        n = self.n
+        self._reserve(n + count)
+        for name, value in values.items():
+            self._columns[name][n:n + count] = value
+        self.n = n + count
+        self._refresh()
+
+    def keep(self, mask):
+        """只保留 mask 为真的实体（保持原有顺序）"""
+        index = np.flatnonzero(mask)
+        count = len(index)
+        if count == self.n:
+            return
+        for column in self._columns.values():
+            column[:count] = column[index]
+        self.n = count
+        self._refresh()
+
+    def clear(self):
+        """清空全部实体（保留容量）"""
+        self.n = 0
+        self._refresh()
+
+
+class VectorSimulation:
+    """以 NumPy 数组保存植物、僵尸和豌豆状态，并整体推进一帧
+
+    每个阶段的语义与对象引擎逐个实体更新的结果一致：
+    豌豆命中同一行中距离最近的僵尸（距离相同取更靠左、更早生成者），
+    僵尸啃咬正前方格子的植物，死亡的实体在各自阶段结束时统一剔除。
+    """
+
+    def __init__(self, rows: int, cols: int, lawn_left: int, grid_size: int):
+        if np is None:
+            raise ImportError("向量化模拟需要安装 numpy")
+        self.rows = rows
+        self.cols = cols
+        self.lawn_left = lawn_left
+        self.grid_size = grid_size
+        self.plants = _Table({
+            'x': 'f8', 'y': 'f8', 'row': 'i8', 'col': 'i8', 'kind': 'i1',
+            'health': 'i8', 'cooldown': 'i8', 'sun_cooldown': 'i8'
+        })
+        self.zombies = _Table({
+            'x': 'f8', 'y': 'f8', 'row': 'i8', 'health': 'i8', 'max_health': 'i8',
+            'speed': 'f8', 'cooldown': 'i8', 'serial': 'i8'
+        })
+        self.peas = _Table({'x': 'f8', 'y': 'f8', 'row': 'i8'})
+        # 每个格子上植物在 plants 表中的下标，-1 表示空（只供啃咬查找；能否放置以引擎的 occupancy 为准）
+        self.plant_grid = np.full((rows, cols), -1, dtype=np.int64)
+        self._next_serial = 0
+
+    # ---- 实体登记 ----
+
+    def add_plant(self, plant: Plant):
+        """登记植物对象的初始状态"""
+        self.add_plants((plant,))
+
+    def add_plants(self, plants: Iterable[Plant]):
+        """整批登记植物（只追加一次数组、重建一次格子索引）"""
+        plants = list(plants)
+        self.plants.append(
+            x=[plant.x for plant in plants], y=[plant.y for plant in plants],
+            row=[plant.row for plant in plants], col=[plant.col for plant in plants],
+            kind=[SUNFLOWER if isinstance(plant, Sunflower) else PEASHOOTER for plant in plants],
+            health=[plant.health for plant in plants],
+            cooldown=[plant.attack_cooldown for plant in plants],
+            sun_cooldown=[getattr(plant, 'sun_cooldown', 0) for plant in plants]
+        )
+        self._rebuild_plant_grid()
+
+    def add_zombie(self, zombie: Zombie):
+        """登记僵尸对象的初始状态"""
+        self.zombies.append(
+            x=zombie.x, y=zombie.y, row=zombie.row, health=zombie.health,
+            max_health=zombie.max_health, speed=zombie.speed,
+            cooldown=zombie.attack_cooldown, serial=self._next_serial
+        )
+        self._next_serial += 1
+
+    def _rebuild_plant_grid(self):
+        self.plant_grid.fill(-1)
+        p = self.plants
+        inside = (p.row >= 0) & (p.row < self.rows) & (p.col >= 0) & (p.col < self.cols)
+        self.plant_grid[p.row[inside], p.col[inside]] = np.nonzero(inside)[0]
+
+    # ---- 每帧阶段 ----
+
+    def update_plants(self):
+        """植物阶段：冷却递减、豌豆射手开火、向日葵计时
+
+        Returns:
+            本帧产生阳光的向日葵在 plants 表中的下标
+        """
+        p = self.plants
+        if not len(p):
+            return np.empty(0, dtype=np.int64)
+        p.cooldown[p.cooldown > 0] -= 1
+
+        shooter = p.kind == PEASHOOTER
+        p.cooldown[shooter] -= 1
+        lane_front = np.full(self.rows, -np.inf)
+        z = self.zombies
+        if len(z):
+            np.maximum.at(lane_front, z.row, z.x)
+        fire = shooter & (p.cooldown <= 0) & (lane_front[p.row] > p.x)
+        if fire.any():
+            half = self.grid_size // 2
+            self.peas.append(x=p.x[fire] + half, y=p.y[fire] + half, row=p.row[fire])
+            p.cooldown[fire] = PEASHOOTER_COOLDOWN
+
+        flower = p.kind == SUNFLOWER
+        p.sun_cooldown[flower] -= 1
+        produced = np.nonzero(flower & (p.sun_cooldown <= 0))[0]
+        p.sun_cooldown[produced] = SUNFLOWER_COOLDOWN
+        return produced
+
+    def update_peas(self):
+        """豌豆阶段：移动、按行结算命中、剔除命中或出界的豌豆"""
+        q = self.peas
+        if not len(q):
+            return
+        q.x += PEA_SPEED
+        target = self._pea_targets()
+        hit = target >= 0
+        if hit.any():
+            np.add.at(self.zombies.health, target[hit], -PEA_DAMAGE)
+        q.keep(~(hit | (q.x > PEA_MAX_X)))
+
+    def _pea_targets(self):
+        """为每颗豌豆找出命中的僵尸下标，未命中为 -1
+
+        所有行一次完成：把 x 坐标换成名次（相等的坐标名次相同，不损失精度），
+        以 行号 * 名次数 + 名次 作为整数键，僵尸按 (行, x, 生成序号) 排序后用 searchsorted 找相邻的僵尸。
+        """
+        q = self.peas
+        z = self.zombies
+        target = np.full(len(q), -1, dtype=np.int64)
+        if not len(z):
+            return target
+        order = np.lexsort((z.serial, z.x, z.row))
+        zx = z.x[order]
+        zrow = z.row[order]
+        ranks, rank = np.unique(np.concatenate((zx, q.x)), return_inverse=True)
+        stride = len(ranks)
+        zkey = zrow * stride + rank[:len(zx)]
+        px = q.x
+        prow = q.row
+        pkey = prow * stride + rank[len(zx):]
+
+        last = len(zx) - 1
+        right = np.searchsorted(zkey, pkey, side='left')
+        left = right - 1
+        left_c = np.maximum(left, 0)
+        right_c = np.minimum(right, last)
+        has_left = (left >= 0) & (zrow[left_c] == prow)
+        has_right = (right <= last) & (zrow[right_c] == prow)
+        # 同一 x 上有多个僵尸时取最早生成者（排序后相同键的第一个）
+        left_first = np.searchsorted(zkey, zkey[left_c], side='left')
+        left_dist = np.where(has_left, px - zx[left_c], np.inf)
+        right_dist = np.where(has_right, zx[right_c] - px, np.inf)
+
+        use_left = left_dist <= right_dist
+        best = np.where(use_left, left_first, right_c)
+        best_dist = np.where(use_left, left_dist, right_dist)
+        ok = best_dist < PEA_REACH
+        target[ok] = order[best[ok]]
+        return target
+
+    def update_zombies(self) -> Tuple[bool, int]:
+        """僵尸阶段：啃咬或前进、冷却递减、剔除死亡僵尸
+
+        Returns:
+            (是否有僵尸到达房子, 本帧死亡的僵尸数)
+        """
+        z = self.zombies
+        if not len(z):
+            return False, 0
+        p = self.plants
+        g = self.grid_size
+        col = np.floor_divide(z.x - self.lawn_left, g).astype(np.int64)
+
+        # 先检查后一格，再用正前方一格覆盖，使正前方的植物优先
+        target = np.full(len(z), -1, dtype=np.int64)
+        for offset in (1, 0):
+            c = col + offset
+            valid = (c >= 0) & (c < self.cols)
+            idx = np.full(len(z), -1, dtype=np.int64)
+            idx[valid] = self.plant_grid[z.row[valid], c[valid]]
+            ok = idx >= 0
+            ok[ok] = np.abs(p.x[idx[ok]] - z.x[ok]) < g
+            target = np.where(ok, idx, target)
+
+        blocked = target >= 0
+        bite = blocked & (z.cooldown <= 0)
+        if bite.any():
+            np.add.at(p.health, target[bite], -ZOMBIE_BITE_DAMAGE)
+            z.cooldown[bite] = ZOMBIE_BITE_COOLDOWN
+        moving = ~blocked
+        z.x[moving] -= z.speed[moving]
+        z.cooldown[z.cooldown > 0] -= 1
+
+        reached = bool((z.x < HOUSE_X).any())
+        dead = z.health <= 0
+        killed = int(dead.sum())
+        if killed:
+            z.keep(~dead)
+        return reached, killed
+
+    def remove_dead_plants(self) -> List[Tuple[int, int]]:
+        """剔除生命值耗尽的植物
+
+        Returns:
+            被剔除的植物所在的 (行, 列)
+        """
+        p = self.plants
+        alive = p.health > 0
+        if alive.all():
+            return []
+        dead = ~alive
+        cells = list(zip(p.row[dead].tolist(), p.col[dead].tolist()))
+        p.keep(alive)
+        self._rebuild_plant_grid()
+        return cells
+
+
+# ---- 供绘制使用的轻量视图 ----
+# 视图只保存模拟对象和下标，读取属性时直接访问数组，
+# 继承实体类以复用 draw 方法和 isinstance 判断。
+# 下标在下一次 update 后可能失效，因此视图只应在绘制时临时使用。
+
+def _column(table: str, name: str):
+    def getter(self):
+        return getattr(getattr(self._sim, table), name)[self._index].item()
+    return property(getter)
+
+
+class _View:
+    def __init__(self, sim: VectorSimulation, index: int):
+        self._sim = sim
+        self._index = index
+
+    @property
+    def grid_size(self):
+        return self._sim.grid_size
+
+
+class _PlantView(_View):
+    x = _column('plants', 'x')
+    y = _column('plants', 'y')
+    row = _column('plants', 'row')
+    col = _column('plants', 'col')
+    health = _column('plants', 'health')
+    attack_cooldown = _column('plants', 'cooldown')
+
+
+class PeashooterView(_PlantView, Peashooter):
+    """豌豆射手的只读视图"""
+
+
+class SunflowerView(_PlantView, Sunflower):
+    """向日葵的只读视图"""
+    sun_cooldown = _column('plants', 'sun_cooldown')
+
+
+class ZombieView(_View, Zombie):
+    """僵尸的只读视图"""
+    x = _column('zombies', 'x')
+    y = _column('zombies', 'y')
+    row = _column('zombies', 'row')
+    health = _column('zombies', 'health')
+    max_health = _column('zombies', 'max_health')
+    speed = _column('zombies', 'speed')
+    attack_cooldown = _column('zombies', 'cooldown')
+
+
+class PeaView(_View, Pea):
+    """豌豆的只读视图"""
+    x = _column('peas', 'x')
+    y = _column('peas', 'y')
+    row = _column('peas', 'row')
+
+
+class EntityViews(Sequence):
+    """按需生成视图的只读序列，长度查询不产生任何对象"""
+
+    def __init__(self, sim: VectorSimulation, table: str):
+        self._sim = sim
+        self._table = table
+
+    def __len__(self) -> int:
+        return len(getattr(self._sim, self._table))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        if self._table == 'zombies':
+            return ZombieView(self._sim, index)
+        if self._table == 'peas':
+            return PeaView(self._sim, index)
+        if self._sim.plants.kind[index] == SUNFLOWER:
+            return SunflowerView(self._sim, index)
+        return PeashooterView(self._sim, index)
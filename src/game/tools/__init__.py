@@ -0,0 +1,4 @@
+"""
+命令行工具模块
+包含批量模拟、性能测试等开发工具，使用 python -m game.tools.<名称> 运行
+"""
@@ -0,0 +1,108 @@
+"""
+批量平衡模拟
+
+示例：
+    python -m game.tools.batch_sim --levels 1-30 --difficulties hard --seeds 20 \\
+        --param zombie_health=120,150,180 --param zombie_speed=0.5,0.7 --out results/hard.csv
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from ..game_engine import DEFAULT_BALANCE
+from ..systems.batch import make_jobs, run_batch
+from ..systems.strategies import STRATEGIES
+
+# 平衡参数的取值范围：(类型, 最小值, 最大值)
+# 向量化引擎以 64 位整数保存生命值，生命值必须是整数，否则两种引擎的结果不同
+PARAM_RANGES = {
+    "zombie_spawn_rate": (float, 0.0, 1.0),
+    "zombie_health": (int, 1, 2 ** 62),
+    "zombie_speed": (float, 0.0, 900.0),
+}
+
+
+def parse_range(text):
+    """解析 "1-30" 或 "1,5,10" 形式的整数列表"""
+    values = []
+    for part in text.split(','):
+        if '-' in part:
+            start, end = part.split('-')
+            values.extend(range(int(start), int(end) + 1))
+        else:
+            values.append(int(part))
+    return values
+
+
+def parse_param(text):
+    """解析 "zombie_health=100,150" 形式的平衡参数"""
+    key, _, values = text.partition('=')
+    if not values:
+        raise argparse.ArgumentTypeError(f"参数格式应为 名称=值1,值2: {text}")
+    return key, [float(v) if '.' in v else int(v) for v in values.split(',')]
+
+
+def check_param(key, values):
+    """
+    检查平衡参数的名称和取值
+
+    Returns:
+        str: 错误信息，参数有效时返回 None
+    """
+    if key not in DEFAULT_BALANCE:
+        return f"未知的平衡参数 {key}，可用的参数: {', '.join(sorted(DEFAULT_BALANCE))}"
+    kind, low, high = PARAM_RANGES[key]
+    for value in values:
+        if kind is int and not isinstance(value, int):
+            return f"{key} 必须是整数: {value}"
+        if not low <= value <= high:
+            return f"{key} 应在 {low} 到 {high} 之间: {value}"
+    return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="在多个 CPU 核上批量运行无头关卡模拟")
+    parser.add_argument('--levels', type=parse_range, default=list(range(1, 31)), help="关卡，如 1-30")
+    parser.add_argument('--difficulties', default="easy,normal,hard", help="难度，逗号分隔")
+    parser.add_argument('--seeds', type=int, default=10, help="每组参数运行的种子数")
+    parser.add_argument('--seed-base', type=int, default=0, help="起始种子")
+    parser.add_argument('--strategy', action='append', choices=sorted(STRATEGIES), help="放置策略，可重复")
+    parser.add_argument('--param', action='append', type=parse_param, default=[],
+                        help="平衡参数候选值，如 zombie_health=100,150，可重复")
+    parser.add_argument('--max-ticks', type=int, default=200000, help="单局最多推进的帧数")
+    parser.add_argument('--vectorized', action='store_true', help="使用 NumPy 向量化引擎")
+    parser.add_argument('--auto-collect', action='store_true', help="自动收集阳光，不生成阳光对象")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="工作进程数")
+    parser.add_argument('--out', default="results.csv", help="结果文件（.csv 或 .parquet）")
+    args = parser.parse_args(argv)
+    for key, values in args.param:
+        error = check_param(key, values)
+        if error:
+            parser.error(error)
+
+    jobs = make_jobs(
+        levels=args.levels,
+        difficulties=args.difficulties.split(','),
+        seeds=range(args.seed_base, args.seed_base + args.seeds),
+        strategies=args.strategy or ["peashooter_wall"],
+        balance_grid=dict(args.param),
+        max_ticks=args.max_ticks,
+        vectorized=args.vectorized,
+        auto_collect=args.auto_collect,
+    )
+
+    def progress(done, total):
+        if done % 100 == 0 or done == total:
+            print(f"\r{done}/{total}", end='', file=sys.stderr, flush=True)
+
+    start = time.perf_counter()
+    count = run_batch(jobs, args.out, workers=args.workers, progress=progress)
+    elapsed = time.perf_counter() - start
+    print(f"\n完成 {count} 局模拟，用时 {elapsed:.1f} 秒（{count / elapsed:.1f} 局/秒），结果写入 {args.out}",
+          file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,433 @@
+"""
+引擎性能基准测试
+
+对若干脚本化场景测量 GameEngine.update 的帧率、各子系统耗时、内存峰值，
+以及在 dummy SDL 视频驱动下的绘制帧率，结果写入 JSON 文件以便跨提交比较。
+
+录像（systems.replay）也可以作为场景：--replay 回放录制的真实对局并计时，
+同时把结束时的 state_digest 与录像所在目录 digests.json 中记录的值比对，不一致时返回非零退出码。
+
+示例：
+    python -m game.tools.bench --out bench/baseline.json
+    python -m game.tools.bench --out bench/new.json --compare bench/baseline.json
+    python -m game.tools.bench --replay bench/replays/level3_hard.pvzr --no-draw
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from ..entities.zombies import Zombie
+from ..systems.profiler import TickProfiler
+from ..systems.replay import Replay, ReplayPlayer, state_digest
+
+
+def _engine_cls(vectorized):
+    if vectorized:
+        from ..vector_engine import VectorGameEngine
+        return VectorGameEngine
+    from ..game_engine import GameEngine
+    return GameEngine
+
+
+def _create_engine(vectorized, **kwargs):
+    engine = _engine_cls(vectorized)(900, 600, headless=True, seed=12345, **kwargs)
+    engine.set_difficulty("hard")
+    engine.set_level(30)
+    # 场景自行布置僵尸，关闭随机生成
+    engine.zombies_spawned = engine.total_zombies_for_level
+    engine.sun_count = 10 ** 9
+    return engine
+
+
+def _fill_grid(engine, plant_type):
+    engine.place_plants((row, col, plant_type)
+                        for row in range(engine.grid_rows) for col in range(engine.grid_cols))
+
+
+def _spawn(engine, count, x0, spacing, **stats):
+    for i in range(count):
+        zombie = Zombie(i % engine.grid_rows, x0 + (i // engine.grid_rows) * spacing,
+                        engine.lawn_top, engine.grid_size, engine.difficulty, **stats)
+        engine.spawn_zombie(zombie)
+
+
+def scenario_empty_lawn(vectorized):
+    """空草坪：只有阳光生成"""
+    return _create_engine(vectorized)
+
+
+def scenario_full_grid(vectorized):
+    """5x9 全部种满豌豆射手，前方有少量不死的僵尸"""
+    engine = _create_engine(vectorized, balance={"zombie_speed": {"hard": 0}})
+    _fill_grid(engine, "peashooter")
+    _spawn(engine, engine.grid_rows, 880, 0, health=10 ** 9)
+    return engine
+
+
+def scenario_zombie_swarm(vectorized):
+    """500 只僵尸在没有防线的草坪上行进"""
+    engine = _create_engine(vectorized)
+    _spawn(engine, 500, 900, 4)
+    return engine
+
+
+def scenario_pea_storm(vectorized):
+    """全场豌豆射手对着远处不动的僵尸，大量豌豆同时在飞行"""
+    engine = _create_engine(vectorized, balance={"zombie_speed": {"hard": 0}})
+    _fill_grid(engine, "peashooter")
+    _spawn(engine, engine.grid_rows, 2400, 0, health=10 ** 9)
+    return engine
+
+
+def scenario_siege(vectorized):
+    """全场豌豆射手对抗 1000 只不死的僵尸：实体数量多时向量化引擎的吞吐量"""
+    engine = _create_engine(vectorized)
+    _fill_grid(engine, "peashooter")
+    _spawn(engine, 1000, 900, 2, health=10 ** 6)
+    return engine
+
+
+def scenario_heavy_sun(vectorized):
+    """每帧掉落一个阳光，场上种满向日葵"""
+    engine = _create_engine(vectorized)
+    engine.sun_rate = 0
+    _fill_grid(engine, "sunflower")
+    return engine
+
+
+def scenario_sun_economy(vectorized):
+    """与 heavy_sun 相同，但阳光自动收集，不生成阳光对象"""
+    engine = _create_engine(vectorized, auto_collect=True)
+    engine.sun_rate = 0
+    _fill_grid(engine, "sunflower")
+    return engine
+
+
+SCENARIOS = {
+    'empty_lawn': scenario_empty_lawn,
+    'full_grid': scenario_full_grid,
+    'zombie_swarm': scenario_zombie_swarm,
+    'pea_storm': scenario_pea_storm,
+    'siege': scenario_siege,
+    'heavy_sun': scenario_heavy_sun,
+    'sun_economy': scenario_sun_economy,
+}
+
+
+# 录像所在目录中记录期望摘要的文件：录像文件名 -> state_digest
+REPLAY_DIGESTS = "digests.json"
+
+
+def expected_digest(path):
+    """录像所在目录 digests.json 中记录的期望摘要，没有记录时返回 None"""
+    digests_file = os.path.join(os.path.dirname(path), REPLAY_DIGESTS)
+    try:
+        with open(digests_file, 'r', encoding='utf-8') as f:
+            digests = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return digests.get(os.path.basename(path))
+
+
+def _entity_counts(engine):
+    return {
+        'plants': len(engine.plants),
+        'zombies': len(engine.zombies),
+        'peas': len(engine.peas),
+        'suns': len(engine.suns),
+    }
+
+
+def measure_update(setup, vectorized, warmup, ticks):
+    """测量 update 帧率和各子系统耗时"""
+    engine = setup(vectorized)
+    for _ in range(warmup):
+        engine.step()
+    profiler = engine.profiler = TickProfiler(window=ticks)
+    start = time.perf_counter()
+    for _ in range(ticks):
+        engine.step()
+    elapsed = time.perf_counter() - start
+    engine.profiler = None
+    return engine, {
+        'ticks': ticks,
+        'elapsed_s': elapsed,
+        'ticks_per_second': ticks / elapsed if elapsed > 0 else None,
+        'tick_ms': profiler.percentiles(),
+        'phases_us_per_tick': {name: total / ticks * 1e6 for name, total in profiler.phase_totals.items()},
+        'entities': _entity_counts(engine),
+        'pools': engine.pool_stats(),
+        'sun_economy': engine.sun_metrics(),
+    }
+
+
+def measure_memory(setup, vectorized, warmup, ticks):
+    """单独运行一遍以测量 Python 堆内存峰值（tracemalloc 会拖慢计时，因此不与计时同跑）"""
+    tracemalloc.start()
+    try:
+        engine = setup(vectorized)
+        for _ in range(warmup + ticks):
+            engine.step()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+
+def measure_replay(path, vectorized):
+    """
+    从头到尾回放一个录像，测量 update 帧率、各子系统耗时和内存峰值，并校验结束时的状态摘要
+
+    录像中的输入必须从第 0 帧开始应用，因此不预热。
+    """
+    replay = Replay.load(path)
+    player = ReplayPlayer(replay, _engine_cls(vectorized))
+    engine = player.engine
+    profiler = engine.profiler = TickProfiler()
+    start = time.perf_counter()
+    while player.step():
+        pass
+    elapsed = time.perf_counter() - start
+    engine.profiler = None
+    ticks = engine.tick
+
+    tracemalloc.start()
+    try:
+        memory_player = ReplayPlayer(replay, _engine_cls(vectorized))
+        while memory_player.step():
+            pass
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    digest = state_digest(engine)
+    expected = expected_digest(path)
+    return engine, {
+        'update': {
+            'ticks': ticks,
+            'elapsed_s': elapsed,
+            'ticks_per_second': ticks / elapsed if elapsed > 0 else None,
+            'tick_ms': profiler.percentiles(),
+            'phases_us_per_tick': {name: total / ticks * 1e6 for name, total in profiler.phase_totals.items()}
+                                  if ticks else {},
+            'entities': _entity_counts(engine),
+            'pools': engine.pool_stats(),
+            'sun_economy': engine.sun_metrics(),
+        },
+        'peak_memory_kb': peak / 1024,
+        'digest': digest,
+        'expected_digest': expected,
+        'digest_ok': None if expected is None else digest == expected,
+    }
+
+
+def _load_images():
+    from ..utils.assets import assets
+    return assets.images()
+
+
+def measure_draw(engine, frames):
+    """在 dummy 视频驱动下测量绘制路径帧率"""
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    try:
+        import pygame
+    except ImportError:
+        return {'skipped': "未安装 pygame"}
+    pygame.init()
+    screen = pygame.display.set_mode((engine.screen_width, engine.screen_height))
+    from ..ui.hud import GameHUD
+
+    images = _load_images()
+    from ..entities.plants import Sunflower
+    hud = GameHUD(engine.screen_width, engine.screen_height)
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        screen.fill((100, 200, 100))
+        for plant in engine.plants:
+            plant.draw(screen, images['sunflower' if isinstance(plant, Sunflower) else 'peashooter'])
+        for zombie in engine.zombies:
+            zombie.draw(screen, images['zombie'])
+        for pea in engine.peas:
+            pea.draw(screen, images['pea'])
+        for sun in engine.suns:
+            sun.draw(screen, images['sun'])
+        hud.draw(screen, engine.sun_count, engine.score, engine.current_level,
+                 engine.zombies_killed, engine.total_zombies_for_level, engine.difficulty)
+        hud.draw_plant_selection(screen, engine.selected_plant, images)
+        pygame.display.flip()
+    elapsed = time.perf_counter() - start
+    return {
+        'frames': frames,
+        'frames_per_second': frames / elapsed if elapsed > 0 else None,
+        'entities': _entity_counts(engine),
+    }
+
+
+def measure_draw_dirty(setup, vectorized, warmup, frames):
+    """
+    在引擎持续推进的情况下比较整屏重绘和脏矩形渲染
+
+    两种方式各自运行一遍场景，只统计绘制和刷新屏幕的耗时。
+    """
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    try:
+        import pygame
+    except ImportError:
+        return {'skipped': "未安装 pygame"}
+    pygame.init()
+    from ..ui.hud import GameHUD
+    from ..ui.renderer import GameRenderer
+
+    results = {}
+    for mode in ('full', 'dirty'):
+        engine = setup(vectorized)
+        for _ in range(warmup):
+            engine.step()
+        screen = pygame.display.set_mode((engine.screen_width, engine.screen_height))
+        renderer = GameRenderer(screen, engine, GameHUD(engine.screen_width, engine.screen_height))
+        screen_area = engine.screen_width * engine.screen_height
+        elapsed = 0.0
+        area = 0
+        for _ in range(frames):
+            engine.step()
+            start = time.perf_counter()
+            if mode == 'full':
+                renderer.invalidate()
+            rects = renderer.render()
+            renderer.present(rects)
+            elapsed += time.perf_counter() - start
+            area += sum(rect.width * rect.height for rect in rects)
+        results[mode] = {
+            'frames_per_second': frames / elapsed if elapsed > 0 else None,
+            'updated_area_ratio': area / (screen_area * frames),
+        }
+    return results
+
+
+def _git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'],
+                                       cwd=os.path.dirname(__file__), stderr=subprocess.DEVNULL,
+                                       text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(names, vectorized=False, warmup=120, ticks=600, frames=120, draw=True, replays=()):
+    """
+    运行基准测试
+
+    Args:
+        names: 场景名称列表
+        vectorized: 是否使用向量化引擎
+        warmup: 计时前预热的帧数（让豌豆、阳光达到稳定数量）
+        ticks: 计时的帧数
+        frames: 绘制测试的帧数
+        draw: 是否测试绘制路径
+        replays: 作为场景回放的录像文件路径，结果的场景名为 replay:<文件名>
+
+    Returns:
+        dict: 可直接写入 JSON 的结果
+    """
+    results = {}
+    for name in names:
+        setup = SCENARIOS[name]
+        engine, update = measure_update(setup, vectorized, warmup, ticks)
+        result = {'update': update, 'peak_memory_kb': measure_memory(setup, vectorized, warmup, ticks)}
+        if draw:
+            result['draw'] = measure_draw(engine, frames)
+            result['draw_dirty'] = measure_draw_dirty(setup, vectorized, warmup, frames)
+        results[name] = result
+    for path in replays:
+        engine, result = measure_replay(path, vectorized)
+        if draw:
+            result['draw'] = measure_draw(engine, frames)
+        results[f"replay:{os.path.basename(path)}"] = result
+    return {
+        'meta': {
+            'commit': _git_commit(),
+            'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'engine': 'vector' if vectorized else 'object',
+        },
+        'scenarios': results,
+    }
+
+
+def print_report(report, baseline=None):
+    """打印结果摘要，提供 baseline 时同时显示相对变化"""
+    def change(new, old):
+        if not old or new is None:
+            return ""
+        return f" ({(new / old - 1) * 100:+.1f}%)"
+
+    for name, result in report['scenarios'].items():
+        old = (baseline or {}).get('scenarios', {}).get(name, {})
+        tps = result['update']['ticks_per_second']
+        line = f"{name:14s} {tps:10.0f} 帧/秒{change(tps, old.get('update', {}).get('ticks_per_second'))}"
+        line += f"  内存峰值 {result['peak_memory_kb']:8.0f} KB"
+        draw = result.get('draw', {})
+        if draw.get('frames_per_second'):
+            fps = draw['frames_per_second']
+            line += f"  绘制 {fps:7.0f} 帧/秒{change(fps, old.get('draw', {}).get('frames_per_second'))}"
+        print(line)
+        dirty = result.get('draw_dirty', {})
+        if dirty.get('dirty', {}).get('frames_per_second'):
+            print(f"    整屏重绘 {dirty['full']['frames_per_second']:.0f} 帧/秒"
+                  f"  脏矩形 {dirty['dirty']['frames_per_second']:.0f} 帧/秒"
+                  f"（刷新面积 {dirty['dirty']['updated_area_ratio'] * 100:.1f}%）")
+        phases = result['update']['phases_us_per_tick']
+        print("    " + "  ".join(f"{phase} {us:.1f}us" for phase, us in phases.items()))
+        if 'digest' in result:
+            status = {True: "一致", False: "不一致", None: "没有记录"}[result['digest_ok']]
+            print(f"    {result['update']['ticks']} 帧  状态摘要 {result['digest']}（与记录的摘要{status}）")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="引擎更新与绘制路径的性能基准测试")
+    parser.add_argument('scenarios', nargs='*', help=f"要运行的场景，默认全部：{', '.join(SCENARIOS)}")
+    parser.add_argument('--vectorized', action='store_true', help="使用 NumPy 向量化引擎")
+    parser.add_argument('--ticks', type=int, default=600, help="计时的帧数")
+    parser.add_argument('--warmup', type=int, default=120, help="预热帧数")
+    parser.add_argument('--frames', type=int, default=120, help="绘制测试帧数")
+    parser.add_argument('--no-draw', action='store_true', help="跳过绘制测试")
+    parser.add_argument('--out', default="bench.json", help="结果 JSON 文件")
+    parser.add_argument('--compare', help="与之比较的旧结果 JSON 文件")
+    parser.add_argument('--replay', action='append', default=[], metavar='PATH',
+                        help="回放录像文件作为场景，可重复；只给出录像时不运行内置场景")
+    args = parser.parse_args(argv)
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"未知的场景: {', '.join(sorted(unknown))}")
+
+    names = args.scenarios or ([] if args.replay else list(SCENARIOS))
+    report = run_benchmarks(names, args.vectorized, args.warmup, args.ticks, args.frames,
+                            not args.no_draw, args.replay)
+    directory = os.path.dirname(args.out)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+    with open(args.out, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+    # 录像回放的结果与记录的摘要不一致时视为回归
+    if any(result.get('digest_ok') is False for result in report['scenarios'].values()):
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,145 @@
+"""
+实体内存基准测试
+
+逐类创建大量实体，用 tracemalloc 测量每个实体占用的字节数，
+并运行一个同时存在上万实体的压力场景，报告 Python 堆内存峰值。
+
+示例：
+    python -m game.tools.memory_bench
+    python -m game.tools.memory_bench --count 50000 --out bench/memory.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import tracemalloc
+
+from ..entities.plants import Peashooter, Sunflower
+from ..entities.zombies import Zombie
+from ..entities.projectiles import Pea
+from ..entities.sun import Sun
+
+LAWN_LEFT = 100
+LAWN_TOP = 100
+GRID_SIZE = 80
+
+# 每类实体的构造方式，参数 i 为实体序号
+FACTORIES = {
+    'Peashooter': lambda i, rng: Peashooter(i % 5, i % 9, LAWN_LEFT, LAWN_TOP, GRID_SIZE),
+    'Sunflower': lambda i, rng: Sunflower(i % 5, i % 9, LAWN_LEFT, LAWN_TOP, GRID_SIZE),
+    'Zombie': lambda i, rng: Zombie(i % 5, 900, LAWN_TOP, GRID_SIZE, "normal"),
+    'Pea': lambda i, rng: Pea(LAWN_LEFT + i % 800, LAWN_TOP + i % 400, i % 5),
+    'Sun': lambda i, rng: Sun(*Sun.random_position(900, rng)),
+}
+
+
+def measure_entity(name, count):
+    """
+    测量一类实体的平均内存占用
+
+    Args:
+        name: FACTORIES 中的实体名称
+        count: 创建的实体数
+
+    Returns:
+        dict: 每个实体的字节数（tracemalloc 统计，含属性值）和 sys.getsizeof 的结果
+    """
+    factory = FACTORIES[name]
+    rng = random.Random(0)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        # 先分配好列表，避免列表扩容计入实体的占用
+        entities = [None] * count
+        after_list = tracemalloc.get_traced_memory()[0]
+        for i in range(count):
+            entities[i] = factory(i, rng)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    sample = entities[0]
+    return {
+        'count': count,
+        'bytes_per_entity': (after - after_list) / count,
+        'list_bytes': after_list - before,
+        'getsizeof': sys.getsizeof(sample),
+        'has_dict': hasattr(sample, '__dict__'),
+    }
+
+
+def measure_stress(zombies, peas, vectorized=False):
+    """
+    压力场景：全场种满豌豆射手，同时存在大量僵尸和飞行中的豌豆
+
+    Returns:
+        dict: 实体数量和 Python 堆内存峰值（KB）
+    """
+    if vectorized:
+        from ..vector_engine import VectorGameEngine as engine_cls
+    else:
+        from ..game_engine import GameEngine as engine_cls
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        engine = engine_cls(900, 600, headless=True, seed=12345)
+        engine.set_level(30)
+        engine.zombies_spawned = engine.total_zombies_for_level
+        engine.sun_count = 10 ** 9
+        engine.place_plants((row, col, "peashooter")
+                            for row in range(engine.grid_rows) for col in range(engine.grid_cols))
+        for i in range(zombies):
+            engine.spawn_zombie(Zombie(i % engine.grid_rows, 2000 + i // engine.grid_rows,
+                                       engine.lawn_top, engine.grid_size, engine.difficulty,
+                                       health=10 ** 9, speed=0))
+        if vectorized:
+            for i in range(peas):
+                engine.sim.peas.append(x=LAWN_LEFT + i % 800, y=LAWN_TOP, row=i % engine.grid_rows)
+        else:
+            for i in range(peas):
+                engine.peas.spawn(LAWN_LEFT + i % 800, LAWN_TOP, i % engine.grid_rows)
+        engine.step()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        'entities': len(engine.plants) + len(engine.zombies) + len(engine.peas) + len(engine.suns),
+        'current_kb': current / 1024,
+        'peak_kb': peak / 1024,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="实体内存占用基准测试")
+    parser.add_argument('--count', type=int, default=20000, help="每类实体创建的数量")
+    parser.add_argument('--zombies', type=int, default=5000, help="压力场景中的僵尸数")
+    parser.add_argument('--peas', type=int, default=10000, help="压力场景中的豌豆数")
+    parser.add_argument('--vectorized', action='store_true', help="压力场景使用 NumPy 向量化引擎")
+    parser.add_argument('--out', help="结果 JSON 文件")
+    args = parser.parse_args(argv)
+
+    report = {
+        'entities': {name: measure_entity(name, args.count) for name in FACTORIES},
+        'stress': measure_stress(args.zombies, args.peas, args.vectorized),
+    }
+    for name, result in report['entities'].items():
+        print(f"{name:12s} {result['bytes_per_entity']:8.1f} 字节/个"
+              f"  getsizeof {result['getsizeof']:4d}  __dict__ {'有' if result['has_dict'] else '无'}")
+    stress = report['stress']
+    print(f"压力场景 {stress['entities']} 个实体  当前 {stress['current_kb']:.0f} KB"
+          f"  峰值 {stress['peak_kb']:.0f} KB")
+
+    if args.out:
+        directory = os.path.dirname(args.out)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
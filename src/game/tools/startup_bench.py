@@ -0,0 +1,185 @@
+"""
+启动时间基准测试
+
+分两部分测量：
+1. 用 python -X importtime 在子进程中导入指定模块，报告累计导入耗时和最慢的几个模块；
+2. 在子进程中按游戏启动流程初始化 pygame、显示加载画面并加载资源、绘制主菜单，
+   报告从启动子进程到第一帧（加载画面）和到可交互（主菜单）的时间。
+
+每次测量都在新的子进程中进行，结果不受本进程已导入模块的影响。
+没有显示设备时默认使用 SDL 的 dummy 视频驱动。
+
+示例：
+    python -m game.tools.startup_bench
+    python -m game.tools.startup_bench --repeat 5 --out bench/startup.json
+    python -m game.tools.startup_bench --modules game game.game_engine game.ui.menus
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# src 目录，子进程从这里导入 game 包
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+DEFAULT_MODULES = ['game', 'game.game_engine', 'game.ui']
+
+# 子进程中执行的启动流程，每到一个阶段打印一行 "<阶段> <time.time()>"
+STARTUP_SCRIPT = """
+import time
+import pygame
+
+pygame.init()
+screen = pygame.display.set_mode((900, 600))
+
+from game.ui.loading_screen import LoadingScreen
+from game.utils.asset_loader import default_asset_loader
+
+loader = default_asset_loader()
+loader.start()
+LoadingScreen(900, 600).draw(screen, loader.progress)
+pygame.display.flip()
+print("first_frame", time.time(), flush=True)
+
+loader.wait()
+from game.ui.menus import MainMenu
+menu = MainMenu(900, 600, {"current_level": 1, "score": 0, "unlocked_levels": 1})
+pygame.display.update(menu.render(screen))
+print("interactive", time.time(), flush=True)
+pygame.quit()
+"""
+
+
+def _child_env(video_driver=None):
+    env = dict(os.environ)
+    env['PYTHONPATH'] = SRC_DIR + os.pathsep + env.get('PYTHONPATH', '')
+    env.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+    if video_driver:
+        env['SDL_VIDEODRIVER'] = video_driver
+    return env
+
+
+def parse_importtime(stderr):
+    """
+    解析 -X importtime 的输出
+
+    Args:
+        stderr: 子进程的标准错误输出
+
+    Returns:
+        list: (模块名, 自身耗时微秒, 累计耗时微秒) 列表，按导入完成顺序排列
+    """
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # 表头
+        rows.append((fields[2].strip(), int(fields[0]), int(fields[1])))
+    return rows
+
+
+def measure_import(module, top=5):
+    """
+    在新的子进程中导入模块，统计导入耗时
+
+    Args:
+        module: 模块名
+        top: 报告自身耗时最长的模块数
+
+    Returns:
+        dict: 累计导入耗时（毫秒）、是否导入了 pygame / numpy 和最慢的模块
+    """
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                          env=_child_env(), capture_output=True, text=True, cwd=SRC_DIR)
+    if proc.returncode != 0:
+        raise RuntimeError(f"导入 {module} 失败:\n{proc.stderr}")
+    rows = parse_importtime(proc.stderr)
+    names = {name for name, _, _ in rows}
+    # 顶层模块是最后完成导入的那一行
+    total = next((cumulative for name, _, cumulative in reversed(rows) if name == module), 0)
+    slowest = sorted(rows, key=lambda row: row[1], reverse=True)[:top]
+    return {
+        'total_ms': total / 1000,
+        'modules': len(rows),
+        'imports_pygame': 'pygame' in names,
+        'imports_numpy': 'numpy' in names,
+        'slowest': [{'module': name, 'self_ms': self_us / 1000} for name, self_us, _ in slowest],
+    }
+
+
+def measure_startup(video_driver='dummy'):
+    """
+    在新的子进程中运行一次启动流程
+
+    Returns:
+        dict: 从启动子进程到第一帧、到可交互的时间（毫秒）
+    """
+    start = time.time()
+    proc = subprocess.run([sys.executable, '-c', STARTUP_SCRIPT], env=_child_env(video_driver),
+                          capture_output=True, text=True, cwd=SRC_DIR)
+    if proc.returncode != 0:
+        raise RuntimeError(f"启动流程失败:\n{proc.stderr}")
+    marks = {}
+    for line in proc.stdout.splitlines():
+        parts = line.split()
+        if len(parts) == 2 and parts[0] in ('first_frame', 'interactive'):
+            marks[parts[0]] = float(parts[1])
+    return {
+        'first_frame_ms': (marks['first_frame'] - start) * 1000,
+        'interactive_ms': (marks['interactive'] - start) * 1000,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="导入耗时与启动时间基准测试")
+    parser.add_argument('--modules', nargs='+', default=DEFAULT_MODULES, help="测量导入耗时的模块")
+    parser.add_argument('--repeat', type=int, default=3, help="每项测量的重复次数，报告中位数")
+    parser.add_argument('--video-driver', default=None,
+                        help="SDL 视频驱动，默认在没有 DISPLAY 时使用 dummy")
+    parser.add_argument('--no-startup', action='store_true', help="只测量导入耗时")
+    parser.add_argument('--out', help="结果 JSON 文件")
+    args = parser.parse_args(argv)
+
+    video_driver = args.video_driver
+    if video_driver is None and not os.environ.get('DISPLAY') and sys.platform.startswith('linux'):
+        video_driver = 'dummy'
+
+    report = {'imports': {}}
+    for module in args.modules:
+        runs = [measure_import(module) for _ in range(args.repeat)]
+        result = min(runs, key=lambda run: run['total_ms'])
+        result['total_ms'] = statistics.median(run['total_ms'] for run in runs)
+        report['imports'][module] = result
+        flags = ', '.join(name for name, used in (('pygame', result['imports_pygame']),
+                                                   ('numpy', result['imports_numpy'])) if used)
+        slowest = ', '.join(f"{row['module']} {row['self_ms']:.1f}ms" for row in result['slowest'][:3])
+        print(f"import {module:20s} {result['total_ms']:8.1f} ms  {result['modules']:4d} 个模块"
+              f"  {'导入 ' + flags if flags else ''}")
+        print(f"    最慢: {slowest}")
+
+    if not args.no_startup:
+        runs = [measure_startup(video_driver) for _ in range(args.repeat)]
+        report['startup'] = {
+            key: statistics.median(run[key] for run in runs)
+            for key in ('first_frame_ms', 'interactive_ms')
+        }
+        report['startup']['runs'] = runs
+        print(f"第一帧 {report['startup']['first_frame_ms']:.0f} ms"
+              f"  可交互 {report['startup']['interactive_ms']:.0f} ms")
+
+    if args.out:
+        directory = os.path.dirname(args.out)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,18 +1,29 @@
 """
 UI 模块
 包含游戏的所有用户界面组件
+
+各组件在第一次访问时才导入，`import game.ui` 不会初始化 pygame 的字体和显示。
 """
 
-from .buttons import Button
-from .menus import MainMenu, LevelSelectMenu, SettingsMenu, PauseMenu, LevelCompleteMenu
-from .hud import GameHUD
+from .._lazy import lazy_exports
+
+# 导出的名称 -> 所在的子模块
+_EXPORTS = {
+    'Button': '.buttons',
+    'MainMenu': '.menus',
+    'LevelSelectMenu': '.menus',
+    'SettingsMenu': '.menus',
+    'PauseMenu': '.menus',
+    'LevelCompleteMenu': '.menus',
+    'GameHUD': '.hud',
+    'TextCache': '.text_cache',
+    'render_text': '.text_cache',
+    'GameRenderer': '.renderer',
+    'build_lawn_background': '.renderer',
+    'LoadingScreen': '.loading_screen',
+    'run_loading_screen': '.loading_screen'
+}
+
+__all__ = list(_EXPORTS)
 
-__all__ = [
-    'Button',
-    'MainMenu', 
-    'LevelSelectMenu',
-    'SettingsMenu',
-    'PauseMenu',
-    'LevelCompleteMenu',
-    'GameHUD'
-]
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -1,5 +1,6 @@
 import pygame
 from ..utils.config import get_font
+from .text_cache import render_text
 
 class Button:
     """按钮类，用于创建可交互的UI按钮"""
@@ -43,8 +44,8 @@ class Button:
         if self.border_width > 0:
             pygame.draw.rect(screen, self.border_color, self.rect, self.border_width)
         
-        # 绘制文本
-        text_surface = self.font.render(self.text, True, self.text_color)
+        # 绘制文本（同一文字和颜色只渲染一次）
+        text_surface = render_text(self.font, self.text, self.text_color)
         text_rect = text_surface.get_rect(center=self.rect.center)
         screen.blit(text_surface, text_rect)
         
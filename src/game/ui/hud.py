@@ -1,5 +1,7 @@
 import pygame
 from ..utils.config import get_font
+from .text_cache import render_text
+from ..utils.assets import assets
 
 class GameHUD:
     """游戏内HUD（抬头显示）"""
@@ -14,27 +16,36 @@ class GameHUD:
         self.hud_top = 160
         self.line_height = 30
         
-    def draw(self, screen, sun_count, score, current_level, zombies_killed, total_zombies, difficulty):
-        """绘制HUD"""
-        # 阳光计数
-        sun_text = self.font.render(f"阳光: {sun_count}", True, (0, 0, 0))
-        screen.blit(sun_text, (self.hud_left, self.hud_top))
-        
-        # 分数
-        score_text = self.font.render(f"分数: {score}", True, (0, 0, 0))
-        screen.blit(score_text, (self.hud_left, self.hud_top + self.line_height))
+        # 性能叠加层使用的小字体，首次绘制时再加载
+        self.profiler_font = None
         
-        # 关卡
-        level_text = self.font.render(f"关卡: {current_level}", True, (0, 0, 0))
-        screen.blit(level_text, (self.hud_left, self.hud_top + self.line_height * 2))
+        # 每行上次绘制的文本和渲染结果，文本不变时直接复用
+        self._line_texts = [None] * 5
+        self._line_surfaces = [None] * 5
         
-        # 僵尸进度
-        zombies_text = self.font.render(f"僵尸: {zombies_killed}/{total_zombies}", True, (0, 0, 0))
-        screen.blit(zombies_text, (self.hud_left, self.hud_top + self.line_height * 3))
+    def _line_surface(self, index, text):
+        """取第 index 行的文本图像，只有文本变化时才重新渲染"""
+        if self._line_texts[index] != text:
+            self._line_texts[index] = text
+            self._line_surfaces[index] = self.font.render(text, True, (0, 0, 0))
+        return self._line_surfaces[index]
         
-        # 难度
-        difficulty_text = self.font.render(f"难度: {difficulty}", True, (0, 0, 0))
-        screen.blit(difficulty_text, (self.hud_left, self.hud_top + self.line_height * 4))
+    def draw(self, screen, sun_count, score, current_level, zombies_killed, total_zombies, difficulty):
+        """绘制HUD"""
+        lines = (
+            f"阳光: {sun_count}",                        # 阳光计数
+            f"分数: {score}",                            # 分数
+            f"关卡: {current_level}",                    # 关卡
+            f"僵尸: {zombies_killed}/{total_zombies}",   # 僵尸进度
+            f"难度: {difficulty}"                        # 难度
+        )
+        for i, text in enumerate(lines):
+            screen.blit(self._line_surface(i, text), (self.hud_left, self.hud_top + self.line_height * i))
+    
+    def line_rects(self):
+        """上一次 draw 绘制的各行文本所占的矩形"""
+        return [surface.get_rect(topleft=(self.hud_left, self.hud_top + self.line_height * i))
+                for i, surface in enumerate(self._line_surfaces) if surface is not None]
     
     def draw_plant_selection(self, screen, selected_plant, plant_images):
         """绘制植物选择区域"""
@@ -54,17 +65,38 @@ class GameHUD:
     
     def draw_game_over(self, screen):
         """绘制游戏结束画面"""
-        # 半透明背景
-        s = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-        s.fill((0, 0, 0, 128))
-        screen.blit(s, (0, 0))
+        # 半透明背景（同一尺寸只创建一次）
+        screen.blit(assets.overlay((self.screen_width, self.screen_height), (0, 0, 0), 128), (0, 0))
         
         # 游戏结束文本
         game_over_font = get_font(36)
-        game_over_text = game_over_font.render("游戏结束! 僵尸吃掉了你的脑子!", True, (255, 0, 0))
+        game_over_text = render_text(game_over_font, "游戏结束! 僵尸吃掉了你的脑子!", (255, 0, 0))
         screen.blit(game_over_text, (self.screen_width // 2 - game_over_text.get_width() // 2, self.screen_height // 2))
         
         # 重新开始提示
         restart_font = get_font(20)
-        restart_text = restart_font.render("按 R 键重新开始游戏", True, (255, 255, 255))
-        screen.blit(restart_text, (self.screen_width // 2 - restart_text.get_width() // 2, self.screen_height // 2 + 50))
\ No newline at end of file
+        restart_text = render_text(restart_font, "按 R 键重新开始游戏", (255, 255, 255))
+        screen.blit(restart_text, (self.screen_width // 2 - restart_text.get_width() // 2, self.screen_height // 2 + 50))
+    
+    def draw_profiler(self, screen, profiler, engine=None):
+        """绘制性能叠加层（帧耗时分位数、各阶段耗时和实体数量），返回所占矩形"""
+        if self.profiler_font is None:
+            self.profiler_font = get_font(14)
+        
+        data = profiler.snapshot(engine)
+        tick = data['tick_ms']
+        frame = data['frame_ms']
+        lines = [
+            f"update p50/p95/p99: {tick['p50']:.2f}/{tick['p95']:.2f}/{tick['p99']:.2f} ms",
+            f"frame  p50/p95/p99: {frame['p50']:.1f}/{frame['p95']:.1f}/{frame['p99']:.1f} ms",
+        ]
+        lines.extend(f"{name}: {ms:.3f} ms" for name, ms in data['phases_ms'].items())
+        lines.append("  ".join(f"{name} {count}" for name, count in data['entities'].items()))
+        lines.append(f"alloc {data['allocated_blocks']:+d}  gc {data['gc_collections']}")
+        
+        x = self.screen_width - 300
+        area = pygame.Rect(x, 10, 0, 0)
+        for i, line in enumerate(lines):
+            text = self.profiler_font.render(line, True, (255, 255, 255), (0, 0, 0))
+            area.union_ip(screen.blit(text, (x, 10 + i * 16)))
+        return area
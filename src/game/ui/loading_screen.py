@@ -0,0 +1,60 @@
+import pygame
+
+
+class LoadingScreen:
+    """启动加载画面，显示后台资源加载的进度"""
+
+    def __init__(self, screen_width, screen_height):
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.background_color = (135, 206, 235)  # 天空蓝
+        self.bar_rect = pygame.Rect(screen_width // 2 - 200, screen_height // 2 - 10, 400, 20)
+        # 使用 pygame 自带的字体，不需要等待中文字体加载
+        self.font = pygame.font.Font(None, 28)
+
+    def draw(self, screen, progress):
+        """
+        绘制加载画面
+
+        Args:
+            screen: 显示表面
+            progress: 加载进度（0.0 到 1.0）
+        """
+        screen.fill(self.background_color)
+        pygame.draw.rect(screen, (255, 255, 255), self.bar_rect)
+        filled = pygame.Rect(self.bar_rect)
+        filled.width = int(self.bar_rect.width * progress)
+        pygame.draw.rect(screen, (0, 128, 0), filled)
+        pygame.draw.rect(screen, (0, 0, 0), self.bar_rect, 2)
+
+        text = self.font.render(f"{int(progress * 100)}%", True, (0, 0, 0))
+        screen.blit(text, text.get_rect(center=(self.screen_width // 2, self.bar_rect.bottom + 25)))
+
+
+def run_loading_screen(screen, loader, fps=60):
+    """
+    启动加载器并显示加载画面，直到所有资源加载完成
+
+    第一帧在加载开始后立即绘制，加载期间照常处理窗口事件。
+
+    Args:
+        screen: 显示表面
+        loader: 尚未开始的 AssetLoader
+        fps: 加载画面的刷新率
+
+    Returns:
+        bool: 加载完成返回 True，加载期间用户关闭窗口返回 False
+    """
+    loading_screen = LoadingScreen(screen.get_width(), screen.get_height())
+    clock = pygame.time.Clock()
+    loader.start()
+    while True:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return False
+        done = loader.is_done()
+        loading_screen.draw(screen, loader.progress)
+        pygame.display.flip()
+        if done:
+            return True
+        clock.tick(fps)
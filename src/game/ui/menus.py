@@ -1,6 +1,8 @@
 import pygame
 from .buttons import Button, ToggleButton
-from ..utils.config import get_font, title_font, GAME_CONFIG
+from ..utils.config import get_font, get_title_font, GAME_CONFIG
+from .text_cache import render_text
+from ..utils.assets import assets
 
 class BaseMenu:
     """基础菜单类"""
@@ -11,6 +13,9 @@ class BaseMenu:
         self.buttons = []
         self.background_color = (135, 206, 235)  # 天空蓝
         
+        # 脏矩形绘制：上次绘制时各按钮的外观，None 表示需要整屏重绘
+        self._drawn_buttons = None
+        
     def handle_event(self, event, mouse_pos):
         """处理事件"""
         for button in self.buttons:
@@ -32,6 +37,33 @@ class BaseMenu:
         screen.fill(self.background_color)
         for button in self.buttons:
             button.draw(screen)
+    
+    def invalidate(self):
+        """下一次 render 时整屏重绘（菜单重新显示或窗口被覆盖后调用）"""
+        self._drawn_buttons = None
+    
+    def render(self, screen):
+        """
+        只重绘发生变化的部分
+        
+        第一次调用时完整绘制菜单，之后只重绘悬停状态、文字或颜色改变了的按钮。
+        
+        Returns:
+            list: 变化的矩形，可直接传给 pygame.display.update
+        """
+        looks = [(button.is_hovered, button.text, button.color) for button in self.buttons]
+        if self._drawn_buttons is None or len(looks) != len(self._drawn_buttons):
+            self.draw(screen)
+            self._drawn_buttons = looks
+            return [screen.get_rect()]
+        
+        dirty = []
+        for button, look, drawn in zip(self.buttons, looks, self._drawn_buttons):
+            if look != drawn:
+                button.draw(screen)
+                dirty.append(button.rect)
+        self._drawn_buttons = looks
+        return dirty
 
 
 class MainMenu(BaseMenu):
@@ -71,23 +103,23 @@ class MainMenu(BaseMenu):
         super().draw(screen)
         
         # 绘制标题
-        title_surface = title_font.render(self.title_text, True, (0, 128, 0))
+        title_surface = render_text(get_title_font(), self.title_text, (0, 128, 0))
         title_rect = title_surface.get_rect(center=(self.screen_width // 2, 100))
         screen.blit(title_surface, title_rect)
         
         # 绘制游戏数据
         font = get_font(18)
-        level_text = font.render(f"当前进度: 第{self.game_data['current_level']}关", True, (0, 0, 0))
+        level_text = render_text(font, f"当前进度: 第{self.game_data['current_level']}关", (0, 0, 0))
         screen.blit(level_text, (self.screen_width - 250, 20))
         
-        score_text = font.render(f"总分数: {self.game_data['score']}", True, (0, 0, 0))
+        score_text = render_text(font, f"总分数: {self.game_data['score']}", (0, 0, 0))
         screen.blit(score_text, (self.screen_width - 250, 50))
         
         # 版本信息
-        version_text = font.render("当前版本号：1.00正式版", True, (0, 128, 0))
+        version_text = render_text(font, "当前版本号：1.00正式版", (0, 128, 0))
         screen.blit(version_text, (20, self.screen_height - 60))
         
-        warning_text = font.render("本游戏免费，若需要付费，请找商家退还钱财并举报该商家", True, (255, 0, 0))
+        warning_text = render_text(font, "本游戏免费，若需要付费，请找商家退还钱财并举报该商家", (255, 0, 0))
         screen.blit(warning_text, (20, self.screen_height - 30))
 
 
@@ -129,11 +161,11 @@ class LevelSelectMenu(BaseMenu):
         super().draw(screen)
         
         # 绘制标题
-        title_text = get_font(24).render("选择关卡", True, (0, 128, 0))
+        title_text = render_text(get_font(24), "选择关卡", (0, 128, 0))
         screen.blit(title_text, (self.screen_width // 2 - title_text.get_width() // 2, 50))
         
         # 显示当前难度
-        difficulty_text = get_font(18).render(f"难度: {self.difficulty}", True, (0, 0, 0))
+        difficulty_text = render_text(get_font(18), f"难度: {self.difficulty}", (0, 0, 0))
         screen.blit(difficulty_text, (self.screen_width - 200, 20))
         
         # 绘制锁定关卡
@@ -142,7 +174,7 @@ class LevelSelectMenu(BaseMenu):
                 locked_rect = pygame.Rect(level_button.rect)
                 pygame.draw.rect(screen, (200, 200, 200), locked_rect)
                 pygame.draw.rect(screen, (0, 0, 0), locked_rect, 2)
-                lock_text = get_font(18).render(f"关卡 {i+1}", True, (0, 0, 0))
+                lock_text = render_text(get_font(18), f"关卡 {i+1}", (0, 0, 0))
                 text_rect = lock_text.get_rect(center=locked_rect.center)
                 screen.blit(lock_text, text_rect)
 
@@ -200,11 +232,11 @@ class SettingsMenu(BaseMenu):
         super().draw(screen)
         
         # 绘制标题
-        title_text = get_font(24).render("游戏设置", True, (0, 128, 0))
+        title_text = render_text(get_font(24), "游戏设置", (0, 128, 0))
         screen.blit(title_text, (self.screen_width // 2 - title_text.get_width() // 2, 50))
         
         # 提示信息
-        tip_text = get_font(16).render("切换难度不会丢失进度，每个难度有独立的存档", True, (0, 0, 255))
+        tip_text = render_text(get_font(16), "切换难度不会丢失进度，每个难度有独立的存档", (0, 0, 255))
         screen.blit(tip_text, (self.screen_width // 2 - tip_text.get_width() // 2, 400))
 
 
@@ -246,10 +278,9 @@ class PauseMenu(BaseMenu):
     
     def draw(self, screen):
         """绘制暂停菜单"""
-        # 半透明背景
-        s = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-        s.fill(self.background_color)
-        screen.blit(s, (0, 0))
+        # 半透明背景（同一尺寸只创建一次）
+        *color, alpha = self.background_color
+        screen.blit(assets.overlay((self.screen_width, self.screen_height), color, alpha), (0, 0))
         
         # 菜单背景
         menu_rect = pygame.Rect(self.screen_width // 2 - 150, self.screen_height // 2 - 150, 300, 300)
@@ -257,7 +288,7 @@ class PauseMenu(BaseMenu):
         pygame.draw.rect(screen, (0, 0, 0), menu_rect, 2)
         
         # 标题
-        title_text = get_font(24).render("游戏暂停", True, (0, 0, 0))
+        title_text = render_text(get_font(24), "游戏暂停", (0, 0, 0))
         screen.blit(title_text, (self.screen_width // 2 - title_text.get_width() // 2, self.screen_height // 2 - 120))
         
         # 绘制按钮
@@ -294,10 +325,8 @@ class LevelCompleteMenu(BaseMenu):
     
     def draw(self, screen):
         """绘制关卡完成菜单"""
-        # 半透明背景
-        s = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-        s.fill((0, 0, 0, 128))
-        screen.blit(s, (0, 0))
+        # 半透明背景（同一尺寸只创建一次）
+        screen.blit(assets.overlay((self.screen_width, self.screen_height), (0, 0, 0), 128), (0, 0))
         
         # 完成菜单背景
         menu_rect = pygame.Rect(self.screen_width // 2 - 200, self.screen_height // 2 - 150, 400, 300)
@@ -305,15 +334,15 @@ class LevelCompleteMenu(BaseMenu):
         pygame.draw.rect(screen, (0, 128, 0), menu_rect, 4)
         
         # 标题
-        title_text = get_font(24).render("关卡完成！", True, (0, 128, 0))
+        title_text = render_text(get_font(24), "关卡完成！", (0, 128, 0))
         screen.blit(title_text, (self.screen_width // 2 - title_text.get_width() // 2, self.screen_height // 2 - 120))
         
         # 关卡信息
-        level_text = get_font(20).render(f"恭喜通过第 {self.current_level} 关", True, (0, 0, 0))
+        level_text = render_text(get_font(20), f"恭喜通过第 {self.current_level} 关", (0, 0, 0))
         screen.blit(level_text, (self.screen_width // 2 - level_text.get_width() // 2, self.screen_height // 2 - 70))
         
         # 统计数据
-        stats_text = get_font(18).render(f"本关击杀僵尸: {self.zombies_killed}/{self.total_zombies}", True, (0, 0, 0))
+        stats_text = render_text(get_font(18), f"本关击杀僵尸: {self.zombies_killed}/{self.total_zombies}", (0, 0, 0))
         screen.blit(stats_text, (self.screen_width // 2 - stats_text.get_width() // 2, self.screen_height // 2 - 30))
         
         # 绘制按钮
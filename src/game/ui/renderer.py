@@ -0,0 +1,281 @@
+import pygame
+from ..entities.plants import Sunflower
+from ..utils.config import COLORS
+from ..utils.assets import assets
+
+
+def build_lawn_background(width, height, lawn_left, lawn_top, grid_size, grid_rows, grid_cols):
+    """
+    绘制静态的草坪背景
+
+    Args:
+        width, height: 屏幕尺寸
+        lawn_left, lawn_top: 草坪左上角位置
+        grid_size: 格子边长
+        grid_rows, grid_cols: 格子行列数
+
+    Returns:
+        pygame.Surface: 背景图像
+    """
+    background = pygame.Surface((width, height))
+    background.fill(COLORS["light_green"])
+    for row in range(grid_rows):
+        for col in range(grid_cols):
+            cell = (lawn_left + col * grid_size, lawn_top + row * grid_size, grid_size, grid_size)
+            pygame.draw.rect(background, COLORS["green"], cell, 1)
+    return background
+
+
+class GameRenderer:
+    """
+    脏矩形渲染层
+
+    背景只绘制一次并缓存，实体贴图和生命条拼成贴图集，一帧的实体用一次 blits 画完。
+    每帧比较实体、HUD 和植物选择框与上一帧的差异，
+    只在发生变化的区域恢复背景并重绘，render 返回这些区域，
+    交给 pygame.display.update 只刷新屏幕上变化的部分。
+    弹出菜单、切换显示模式等覆盖了整个屏幕之后需要调用 invalidate。
+    """
+
+    def __init__(self, screen, engine, hud, background=None, asset_manager=None):
+        """
+        初始化渲染层
+
+        Args:
+            screen: 显示表面
+            engine: 游戏引擎（只读取其状态）
+            hud: GameHUD 对象
+            background: 背景图像，默认绘制草坪网格
+            asset_manager: 提供贴图和贴图集的 AssetManager，默认为全进程共用的 assets
+        """
+        self.screen = screen
+        self.engine = engine
+        self.hud = hud
+        self.asset_manager = assets if asset_manager is None else asset_manager
+        # 贴图和贴图集由 AssetManager 按显示模式缓存，整个进程只有一份
+        self.images = self.asset_manager.images()
+        self.atlas = self.asset_manager.atlas()
+        self._bar_areas = {}      # (生命值, 最大生命值) -> 生命条在贴图集中的位置
+        if background is None:
+            background = build_lawn_background(
+                screen.get_width(), screen.get_height(), engine.lawn_left, engine.lawn_top,
+                engine.grid_size, engine.grid_rows, engine.grid_cols)
+        self.background = background
+
+        self._full_redraw = True
+        self._drawn = {}          # 上一帧每个实体：id -> (绘制状态, 所占矩形)
+        self._hud_key = None
+        self._hud_rects = []
+        self._selection_key = None
+        self._profiler_rect = None
+        self._game_over_drawn = False
+
+        # 变化区域超过屏幕面积的这一比例时改为整屏重绘
+        self.full_redraw_ratio = 0.5
+        
+        # 植物选择框所在区域（与 GameHUD.draw_plant_selection 一致）
+        self.selection_rect = pygame.Rect(15, 15, 70, 140)
+
+    def invalidate(self):
+        """下一帧重绘整个屏幕"""
+        self._full_redraw = True
+
+    def set_screen(self, screen):
+        """
+        显示模式改变（例如切换全屏）后换用新的显示表面，贴图和贴图集从 AssetManager 重新获取
+
+        Args:
+            screen: 新的显示表面
+        """
+        self.screen = screen
+        self.images = self.asset_manager.images()
+        self.atlas = self.asset_manager.atlas()
+        self._bar_areas = {}
+        engine = self.engine
+        self.background = build_lawn_background(
+            screen.get_width(), screen.get_height(), engine.lawn_left, engine.lawn_top,
+            engine.grid_size, engine.grid_rows, engine.grid_cols)
+        self.invalidate()
+
+    # ---- 实体的绘制状态 ----
+    # 状态相同的实体画出的像素相同；状态改变的实体的新旧位置都需要刷新
+
+    def _entity_states(self):
+        """每个实体的 (实体, 绘制状态, 所占矩形, 需要的 blit 列表)，按绘制层次排列"""
+        engine = self.engine
+        grid = engine.grid_size
+        atlas = self.atlas
+        surface = atlas.surface
+        areas = atlas.rects
+        states = []
+        append = states.append
+        for plant in engine.plants:
+            is_sunflower = isinstance(plant, Sunflower)
+            x, y = plant.x, plant.y
+            # 贴图画在格子内缩 10 像素处
+            append((plant, (is_sunflower, x, y), pygame.Rect(x + 10, y + 10, grid - 20, grid - 20),
+                    ((surface, (x + 10, y + 10), areas['sunflower' if is_sunflower else 'peashooter']),)))
+        area = areas['zombie']
+        bar_areas = self._bar_areas
+        for zombie in engine.zombies:
+            # 包含上方的生命条
+            x, y, health = zombie.x, zombie.y, zombie.health
+            bar_key = (health, zombie.max_health)
+            bar_area = bar_areas.get(bar_key)
+            if bar_area is None:
+                bar_area = bar_areas[bar_key] = atlas.bar_rect(health / zombie.max_health)
+            append((zombie, (x, y, health), pygame.Rect(int(x), y - 10, 41, grid + 10),
+                    ((surface, (x, y), area), (surface, (x, y - 10), bar_area))))
+        area = areas['pea']
+        for pea in engine.peas:
+            x, y = pea.x, pea.y
+            append((pea, (x, y), pygame.Rect(x - 8, y - 8, 17, 17), ((surface, (x - 8, y - 8), area),)))
+        area = areas['sun']
+        for sun in engine.suns:
+            x, y = sun.x, sun.y
+            append((sun, (x, y), pygame.Rect(x - 20, y - 20, 41, 41), ((surface, (x - 20, y - 20), area),)))
+        return states
+
+    def _draw_entities(self, states, redraw=None):
+        """把需要绘制的实体合并成一次 Surface.blits 调用"""
+        if redraw is None:
+            batch = [item for _, _, _, blits in states for item in blits]
+        else:
+            batch = [item for (_, _, _, blits), needed in zip(states, redraw) if needed for item in blits]
+        if batch:
+            self.screen.blits(batch, doreturn=False)
+
+    def _entity_dirty_rects(self, states):
+        """与上一帧相比发生变化的区域，同一实体移动前后的矩形相交时合并为一个"""
+        previous = self._drawn
+        dirty = []
+        for entity, state, rect, _ in states:
+            # 以对象 id 匹配上一帧：即使 id 被新对象复用，只有状态也相同时才视为未变化，
+            # 而状态相同意味着画出的像素相同
+            old = previous.pop(id(entity), None)
+            if old is None:
+                dirty.append(rect)
+            elif old[0] != state:
+                old_rect = old[1]
+                if old_rect.colliderect(rect):
+                    dirty.append(old_rect.union(rect))
+                else:
+                    dirty.append(old_rect)
+                    dirty.append(rect)
+        dirty.extend(rect for _, rect in previous.values())
+        return dirty
+
+    def _collect_dirty(self, states, hud_key, selection_key):
+        """
+        计算需要恢复背景并重绘的区域
+
+        从发生变化的区域出发，把与之相交的实体、选择框和 HUD 的整个矩形也加入，
+        直到不再有新的相交者。这样重绘的对象下方总是先恢复了背景，
+        半透明边缘不会因为重复叠加而变深。
+
+        Returns:
+            (区域列表, 每个实体是否重绘, HUD 是否重绘, 选择框是否重绘)；
+            变化区域过大、整屏重绘更快时区域列表为 None
+        """
+        limit = self.full_redraw_ratio * self.screen.get_width() * self.screen.get_height()
+        dirty = self._entity_dirty_rects(states)
+        if self._profiler_rect is not None:
+            dirty.append(self._profiler_rect)
+
+        hud_area = None
+        for rect in self._hud_rects:
+            hud_area = rect.copy() if hud_area is None else hud_area.union(rect)
+        hud_changed = hud_key != self._hud_key
+        if hud_changed and hud_area is not None:
+            dirty.append(hud_area)
+        selection_changed = selection_key != self._selection_key
+        if selection_changed:
+            dirty.append(self.selection_rect)
+
+        area = sum(rect.width * rect.height for rect in dirty)
+        redraw = [False] * len(states)
+        frontier = dirty
+        while frontier:
+            if area > limit:
+                return None, redraw, hud_changed, selection_changed
+            added = []
+            for i, (_, _, rect, _) in enumerate(states):
+                if not redraw[i] and rect.collidelist(frontier) != -1:
+                    redraw[i] = True
+                    added.append(rect)
+            if not selection_changed and self.selection_rect.collidelist(frontier) != -1:
+                selection_changed = True
+                added.append(self.selection_rect)
+            if not hud_changed and hud_area is not None and hud_area.collidelist(frontier) != -1:
+                hud_changed = True
+                added.append(hud_area)
+            dirty.extend(added)
+            area += sum(rect.width * rect.height for rect in added)
+            frontier = added
+        return dirty, redraw, hud_changed, selection_changed
+
+    def _restore(self, rects):
+        for rect in rects:
+            self.screen.blit(self.background, rect, rect)
+
+    def render(self, profiler=None):
+        """
+        绘制一帧
+
+        Args:
+            profiler: 可选的 TickProfiler，提供时绘制性能叠加层
+
+        Returns:
+            list: 本帧发生变化的矩形，可直接传给 pygame.display.update
+        """
+        engine = self.engine
+        hud = self.hud
+        states = self._entity_states()
+        hud_key = (engine.sun_count, engine.score, engine.current_level,
+                   engine.zombies_killed, engine.total_zombies_for_level, engine.difficulty)
+        selection_key = engine.selected_plant
+
+        if engine.game_over and self._game_over_drawn and not self._full_redraw:
+            # 游戏结束画面是静止的，画好之后不再刷新
+            return []
+        
+        dirty = None
+        if not self._full_redraw:
+            dirty, redraw, hud_changed, selection_changed = self._collect_dirty(states, hud_key, selection_key)
+        
+        if dirty is None:
+            self.screen.blit(self.background, (0, 0))
+            self._draw_entities(states)
+            hud.draw_plant_selection(self.screen, selection_key, self.images)
+            hud.draw(self.screen, *hud_key)
+            dirty = [self.screen.get_rect()]
+            self._game_over_drawn = False
+        else:
+            self._restore(dirty)
+            self._draw_entities(states, redraw)
+            if selection_changed:
+                hud.draw_plant_selection(self.screen, selection_key, self.images)
+            if hud_changed:
+                hud.draw(self.screen, *hud_key)
+                dirty.extend(hud.line_rects())
+
+        self._drawn = {id(entity): (state, rect) for entity, state, rect, _ in states}
+        self._hud_key = hud_key
+        self._hud_rects = hud.line_rects()
+        self._selection_key = selection_key
+        self._full_redraw = False
+
+        self._profiler_rect = None
+        if profiler is not None:
+            self._profiler_rect = hud.draw_profiler(self.screen, profiler, engine)
+            dirty.append(self._profiler_rect)
+        if engine.game_over:
+            hud.draw_game_over(self.screen)
+            self._game_over_drawn = True
+            dirty = [self.screen.get_rect()]
+        return dirty
+
+    def present(self, rects):
+        """把变化的区域刷新到屏幕"""
+        if rects:
+            pygame.display.update(rects)
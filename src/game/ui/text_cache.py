@@ -0,0 +1,83 @@
+from collections import OrderedDict
+
+
+class TextCache:
+    """
+    已渲染文本的缓存
+
+    以 (字体, 文本, 颜色, 抗锯齿, 背景色) 为键缓存 font.render 的结果，
+    按最近使用顺序淘汰，缓存的像素总量不超过 max_bytes。
+    返回的 Surface 是共享的，调用方只应读取或 blit，不应在上面绘制。
+    """
+
+    def __init__(self, max_entries=512, max_bytes=8 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self._surfaces = OrderedDict()
+
+    @staticmethod
+    def _surface_bytes(surface):
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def render(self, font, text, color, antialias=True, background=None):
+        """
+        获取渲染好的文本
+
+        Args:
+            font: pygame.font.Font 字体对象
+            text: 文本
+            color: 文本颜色
+            antialias: 是否抗锯齿
+            background: 背景色，None 表示透明
+
+        Returns:
+            pygame.Surface: 文本图像
+        """
+        key = (font, text, tuple(color), antialias, None if background is None else tuple(background))
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        if background is None:
+            surface = font.render(text, antialias, color)
+        else:
+            surface = font.render(text, antialias, color, background)
+        self._surfaces[key] = surface
+        self.bytes_used += self._surface_bytes(surface)
+        while self._surfaces and (len(self._surfaces) > self.max_entries or self.bytes_used > self.max_bytes):
+            _, evicted = self._surfaces.popitem(last=False)
+            self.bytes_used -= self._surface_bytes(evicted)
+        return surface
+
+    def clear(self):
+        """清空缓存（字体缓存清空或显示模式改变后调用）"""
+        self._surfaces.clear()
+        self.bytes_used = 0
+
+    def stats(self):
+        """
+        缓存统计
+
+        Returns:
+            dict: 命中次数、未命中次数、缓存条目数和占用字节数
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "cached": len(self._surfaces),
+            "bytes": self.bytes_used
+        }
+
+
+text_cache = TextCache()
+
+
+def render_text(font, text, color, antialias=True, background=None):
+    """经过全局缓存的 font.render，参数含义同 TextCache.render"""
+    return text_cache.render(font, text, color, antialias, background)
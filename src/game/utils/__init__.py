@@ -1,23 +1,45 @@
 """
 工具模块
 包含游戏的各种工具函数和配置管理
+
+配置、存档和资源工具在第一次访问时才导入；读取 GAME_CONFIG 不需要 pygame。
 """
 
-from .file_utils import load_game_data, save_game_data, load_image, ensure_directory
-from .audio_utils import load_music, play_music, stop_music, set_music_volume
-from .config import get_font, title_font, GAME_CONFIG, GAME_SETTINGS
+from .._lazy import lazy_exports
+
+# 导出的名称 -> 所在的子模块
+_EXPORTS = {
+    'load_game_data': '.file_utils',
+    'save_game_data': '.file_utils',
+    'load_image': '.file_utils',
+    'ensure_directory': '.file_utils',
+    'SaveWriter': '.save_writer',
+    'atomic_write': '.save_writer',
+    'SAVE_BACKENDS': '.save_writer',
+    'Storage': '.storage',
+    'get_storage': '.storage',
+    'set_storage': '.storage',
+    'load_music': '.audio_utils',
+    'play_music': '.audio_utils',
+    'stop_music': '.audio_utils',
+    'set_music_volume': '.audio_utils',
+    'probe_music': '.audio_utils',
+    'AssetManager': '.assets',
+    'SpriteAtlas': '.assets',
+    'SPRITES': '.assets',
+    'AssetLoader': '.asset_loader',
+    'default_asset_loader': '.asset_loader',
+    'get_font': '.config',
+    'get_title_font': '.config',
+    'font_manager': '.config',
+    'FontManager': '.config',
+    'GAME_CONFIG': '.config',
+    'GAME_SETTINGS': '.config',
+    'load_game_settings': '.config',
+    # 兼容旧代码，首次访问时才加载字体
+    'title_font': '.config'
+}
+
+__all__ = [name for name in _EXPORTS if name != 'title_font']
 
-__all__ = [
-    'load_game_data',
-    'save_game_data', 
-    'load_image',
-    'ensure_directory',
-    'load_music',
-    'play_music',
-    'stop_music',
-    'set_music_volume',
-    'get_font',
-    'title_font',
-    'GAME_CONFIG',
-    'GAME_SETTINGS'
-]
\ No newline at end of file
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS, __all__)
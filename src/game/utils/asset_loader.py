@@ -0,0 +1,95 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from .assets import assets
+from .audio_utils import MUSIC_FILES, probe_music
+from .config import font_manager, UI_FONT_SIZES
+
+
+class AssetLoader:
+    """
+    后台资源加载器
+
+    用线程池并行执行登记的加载任务，主线程可以一边绘制加载画面一边查询进度。
+    任务只做读取文件、解码等与显示无关的工作；转换为显示格式（convert_alpha）
+    仍在主线程第一次取用贴图时进行。
+    """
+
+    def __init__(self, max_workers=4):
+        self.max_workers = max_workers
+        self.results = {}
+        self.errors = {}
+        self._tasks = []
+        self._done = 0
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def add(self, name, func, *args):
+        """
+        登记一个加载任务
+
+        Args:
+            name: 任务名称
+            func: 加载函数
+            args: 传给加载函数的参数
+        """
+        self._tasks.append((name, func, args))
+
+    def _run(self, name, func, args):
+        try:
+            result = func(*args)
+        except Exception as e:  # 单个资源失败不影响其他资源，由调用方决定如何处理
+            with self._lock:
+                self.errors[name] = e
+                self._done += 1
+        else:
+            with self._lock:
+                self.results[name] = result
+                self._done += 1
+
+    def start(self):
+        """开始在后台加载，立即返回"""
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="asset-loader")
+        for name, func, args in self._tasks:
+            self._executor.submit(self._run, name, func, args)
+        # 不再接受新任务，全部完成后工作线程自行退出
+        self._executor.shutdown(wait=False)
+
+    @property
+    def total(self):
+        return len(self._tasks)
+
+    @property
+    def progress(self):
+        """已完成任务的比例（0.0 到 1.0）"""
+        with self._lock:
+            return self._done / self.total if self.total else 1.0
+
+    def is_done(self):
+        """所有任务是否都已完成"""
+        with self._lock:
+            return self._done >= self.total
+
+    def wait(self):
+        """阻塞直到所有任务完成"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+
+def default_asset_loader(max_workers=4):
+    """
+    创建加载启动所需资源的加载器：界面字体、实体贴图和音乐文件信息
+
+    各关卡的音乐不在其中，第一次播放时才检查（见 audio_utils.play_music）。
+
+    Returns:
+        AssetLoader: 尚未开始的加载器
+    """
+    loader = AssetLoader(max_workers)
+    # 字体查找要依次尝试多个路径，放在一个任务里顺序完成
+    loader.add("fonts", font_manager.preload, UI_FONT_SIZES)
+    for name in assets.sprites:
+        loader.add(f"image:{name}", assets.preload, name)
+    for music_type in ("main_menu", "settings"):
+        if music_type in MUSIC_FILES:
+            loader.add(f"music:{music_type}", probe_music, music_type)
+    return loader
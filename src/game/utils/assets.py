@@ -0,0 +1,218 @@
+import os
+import pygame
+from .file_utils import load_image
+
+# 贴图目录（相对于仓库根目录）
+IMAGE_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'assets', 'image'))
+
+# 游戏使用的贴图：名称 -> (文件名, 加载失败时的默认颜色, 尺寸)
+SPRITES = {
+    'peashooter': ('peashooter.png', (0, 128, 0), (60, 60)),
+    'sunflower': ('sunflower.png', (255, 255, 0), (60, 60)),
+    'zombie': ('zombie.png', (0, 0, 255), (40, 80)),
+    'pea': ('pea.png', (0, 255, 0), (16, 16)),
+    'sun': ('sun.png', (255, 255, 0), (40, 40))
+}
+
+
+class SpriteAtlas:
+    """
+    贴图集
+
+    把所有贴图和预先画好的僵尸生命条拼在一张表面上，
+    绘制时只需给出源矩形，整层实体可以用一次 Surface.blits 画完。
+    """
+
+    def __init__(self, images, bar_width=40, bar_height=5, padding=1):
+        """
+        拼合贴图
+
+        Args:
+            images: 名称 -> 贴图
+            bar_width, bar_height: 生命条尺寸
+            padding: 贴图之间的间隔（像素）
+        """
+        self.bar_width = bar_width
+        self.rects = {}
+        x = 0
+        row_height = 0
+        for name, image in images.items():
+            self.rects[name] = pygame.Rect(x, 0, image.get_width(), image.get_height())
+            x += image.get_width() + padding
+            row_height = max(row_height, image.get_height())
+
+        # 第 i 条生命条的绿色部分宽 i 像素，排在贴图下方
+        bars_top = row_height + padding
+        self.bar_rects = [pygame.Rect(0, bars_top + i * (bar_height + padding), bar_width, bar_height)
+                          for i in range(bar_width + 1)]
+
+        width = max(x, bar_width)
+        height = bars_top + len(self.bar_rects) * (bar_height + padding)
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        for name, image in images.items():
+            # 目标全透明，取最大值即原样复制像素（普通混合会让半透明边缘变暗）
+            surface.blit(image, self.rects[name], special_flags=pygame.BLEND_RGBA_MAX)
+        for filled, rect in enumerate(self.bar_rects):
+            surface.fill((255, 0, 0), rect)
+            surface.fill((0, 255, 0), (rect.x, rect.y, filled, rect.height))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        self.surface = surface
+
+    def bar_rect(self, health_ratio):
+        """
+        生命比例对应的生命条源矩形
+
+        Args:
+            health_ratio: 当前生命值 / 最大生命值
+
+        Returns:
+            pygame.Rect: 贴图集中的源矩形
+        """
+        filled = int(self.bar_width * health_ratio)
+        return self.bar_rects[min(max(filled, 0), self.bar_width)]
+
+
+class AssetManager:
+    """
+    贴图与叠加层管理
+
+    贴图从磁盘读取一次后缓存，并按当前显示模式转换像素格式（convert_alpha），
+    之后每次 blit 不再需要格式转换。半透明叠加层按尺寸和颜色缓存。
+    每次取用时检查显示模式，模式改变（例如切换全屏）后自动重新转换。
+    """
+
+    def __init__(self, image_dir=IMAGE_DIR, sprites=None):
+        self.image_dir = image_dir
+        self.sprites = dict(SPRITES if sprites is None else sprites)
+        self.conversions = 0  # 因显示模式改变而重建缓存的次数
+        self._raw = {}        # 从磁盘读取的原始贴图
+        self._converted = {}  # 转换为显示格式后的贴图
+        self._overlays = {}
+        self._display_key = None
+
+    def _check_display(self):
+        """显示模式改变时丢弃已转换的表面"""
+        surface = pygame.display.get_surface()
+        if surface is None:
+            key = None
+        else:
+            key = (surface.get_size(), surface.get_bitsize(), surface.get_masks(), surface.get_flags())
+        if key != self._display_key:
+            self._display_key = key
+            self._converted.clear()
+            self._overlays.clear()
+            self.conversions += 1
+        return key is not None
+
+    def register(self, name, filename, default_color=None, size=(40, 40)):
+        """
+        登记一张贴图
+
+        Args:
+            name: 贴图名称
+            filename: image_dir 下的文件名
+            default_color: 加载失败时默认图形的颜色
+            size: 缩放后的尺寸
+        """
+        self.sprites[name] = (filename, default_color, size)
+        self._raw.pop(name, None)
+        self._converted.pop(name, None)
+
+    def preload(self, name):
+        """
+        从磁盘读取贴图但不转换格式（可以在后台线程中调用）
+
+        Args:
+            name: 贴图名称
+        """
+        if name not in self._raw:
+            filename, default_color, size = self.sprites[name]
+            self._raw[name] = load_image(os.path.join(self.image_dir, filename), default_color, size)
+
+    def image(self, name):
+        """
+        获取转换为当前显示格式的贴图
+
+        Args:
+            name: 贴图名称
+
+        Returns:
+            pygame.Surface: 贴图（尚未设置显示模式时返回未转换的原图）
+        """
+        has_display = self._check_display()
+        surface = self._converted.get(name)
+        if surface is None:
+            self.preload(name)
+            surface = self._raw[name]
+            if has_display:
+                surface = surface.convert_alpha()
+                self._converted[name] = surface
+        return surface
+
+    def images(self, names=None):
+        """
+        获取一组贴图
+
+        Args:
+            names: 贴图名称列表，默认全部已登记的贴图
+
+        Returns:
+            dict: 名称 -> 贴图
+        """
+        return {name: self.image(name) for name in (names or self.sprites)}
+
+    def atlas(self, names=None):
+        """
+        获取由当前显示格式贴图拼成的贴图集（随显示模式改变自动重建）
+
+        Args:
+            names: 贴图名称列表，默认全部已登记的贴图
+
+        Returns:
+            SpriteAtlas: 贴图集
+        """
+        images = self.images(names)
+        key = ('atlas', tuple(images))
+        atlas = self._converted.get(key)
+        if atlas is None:
+            atlas = SpriteAtlas(images)
+            if self._display_key is not None:
+                self._converted[key] = atlas
+        return atlas
+
+    def overlay(self, size, color=(0, 0, 0), alpha=128):
+        """
+        获取纯色半透明叠加层
+
+        使用整体透明度而不是逐像素透明度，混合速度更快，效果相同。
+
+        Args:
+            size: 尺寸
+            color: 颜色
+            alpha: 透明度（0-255）
+
+        Returns:
+            pygame.Surface: 叠加层（共享对象，不要在上面绘制）
+        """
+        has_display = self._check_display()
+        key = (tuple(size), tuple(color), alpha)
+        surface = self._overlays.get(key)
+        if surface is None:
+            surface = pygame.Surface(size)
+            if has_display:
+                surface = surface.convert()
+            surface.fill(color)
+            surface.set_alpha(alpha)
+            self._overlays[key] = surface
+        return surface
+
+    def reload(self):
+        """丢弃所有缓存，下次取用时重新从磁盘读取"""
+        self._raw.clear()
+        self._converted.clear()
+        self._overlays.clear()
+        self._display_key = None
+
+
+assets = AssetManager()
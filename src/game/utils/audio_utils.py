@@ -5,36 +5,53 @@ import os
 MUSIC_FILES = {
     "main_menu": "lawnbgm(1).mp3",
     "settings": "lawnbgm(2).mp3", 
-    "game": "lawnbgm(3).mp3"
+    "game": "lawnbgm(3).mp3",
+    "gameplay": "lawnbgm(3).mp3"  # 关卡数据中的默认关卡音乐
 }
 
 # 全局音乐状态
 music_loaded = False
 current_music = None
 
-def load_music():
+# 已检查过的音乐文件：音乐类型 -> 文件大小（字节），文件不存在时为 None
+music_info = {}
+
+def probe_music(music_type):
     """
-    加载音乐文件
+    检查一首音乐的文件，结果会被缓存，每个文件只访问一次磁盘
+    
+    Args:
+        music_type: 音乐类型
     
     Returns:
-        bool: 是否成功加载音乐
+        bool: 音乐文件是否存在
+    """
+    if music_type not in music_info:
+        file_path = MUSIC_FILES[music_type]
+        try:
+            music_info[music_type] = os.path.getsize(file_path)
+        except OSError:
+            print(f"警告：音乐文件 {file_path} 不存在")
+            music_info[music_type] = None
+    return music_info[music_type] is not None
+
+def load_music(music_types=None):
+    """
+    启用音乐并检查音乐文件
+    
+    只检查 music_types 中的音乐；其余音乐在第一次播放时再检查。
+    缺少部分文件时其他音乐照常播放。
+    
+    Args:
+        music_types: 要预先检查的音乐类型，默认不检查
+    
+    Returns:
+        bool: 预先检查的音乐文件是否都存在
     """
     global music_loaded
     
-    try:
-        # 检查音乐文件是否存在
-        for music_type, file_path in MUSIC_FILES.items():
-            if not os.path.exists(file_path):
-                print(f"警告：音乐文件 {file_path} 不存在")
-                music_loaded = False
-                return False
-        
-        music_loaded = True
-        return True
-    except Exception as e:
-        print(f"加载音乐失败: {e}")
-        music_loaded = False
-        return False
+    music_loaded = True
+    return all([probe_music(music_type) for music_type in (music_types or ())])
 
 def play_music(music_type, loop=True):
     """
@@ -53,6 +70,9 @@ def play_music(music_type, loop=True):
         print(f"错误：未知的音乐类型 {music_type}")
         return
     
+    if not probe_music(music_type):
+        return
+    
     try:
         # 停止当前音乐
         pygame.mixer.music.stop()
@@ -1,10 +1,124 @@
-import pygame
 import os
+import threading
+from collections import OrderedDict
+
+# 尝试的中文字体，按优先级排列
+FONT_PATHS = [
+    "assets/fonts/simkai.ttf",  # 楷体
+    "assets/fonts/msyh.ttc",    # 微软雅黑  
+    "assets/fonts/simhei.ttf",  # 黑体
+    "assets/fonts/simsun.ttc",  # 宋体
+    "C:/Windows/Fonts/simkai.ttf",
+    "C:/Windows/Fonts/msyh.ttc",
+    "C:/Windows/Fonts/simhei.ttf",
+    "C:/Windows/Fonts/simsun.ttc"
+]
+
+# 字体管理
+class FontManager:
+    """
+    字体缓存
+    
+    第一次取字体时依次尝试 FONT_PATHS，记住第一个可用的字体文件，
+    之后按字号缓存 pygame.font.Font 对象，超过 max_size 个字号时淘汰最久未使用的。
+    缓存的字体对象是共享的，调用方不应修改其样式（粗体、斜体等）。
+    可以在后台线程中预加载（见 asset_loader），内部用锁保护。
+    """
+    
+    # 尚未查找字体文件的标记（None 表示使用系统默认字体）
+    _UNRESOLVED = object()
+    
+    def __init__(self, font_paths=None, max_size=16):
+        self.font_paths = FONT_PATHS if font_paths is None else font_paths
+        self.max_size = max_size
+        self.font_path = self._UNRESOLVED
+        self.hits = 0
+        self.misses = 0
+        self._fonts = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def _resolve(self, size):
+        """查找第一个可用的字体文件，返回用它创建的字体"""
+        import pygame
+        
+        for font_path in self.font_paths:
+            try:
+                font = pygame.font.Font(font_path, size)
+            except (OSError, pygame.error):
+                continue
+            self.font_path = font_path
+            return font
+        print("警告：未找到中文字体，使用系统默认字体")
+        self.font_path = None
+        return pygame.font.SysFont(None, size)
+    
+    def get(self, size):
+        """
+        获取字体对象
+        
+        Args:
+            size: 字体大小
+        
+        Returns:
+            pygame.font.Font: 字体对象
+        """
+        with self._lock:
+            font = self._fonts.get(size)
+            if font is not None:
+                self._fonts.move_to_end(size)
+                self.hits += 1
+                return font
+            
+            self.misses += 1
+            # pygame 在第一次取字体时才导入，只读 GAME_CONFIG 的代码不需要它
+            import pygame
+            if self.font_path is self._UNRESOLVED:
+                font = self._resolve(size)
+            elif self.font_path is None:
+                font = pygame.font.SysFont(None, size)
+            else:
+                font = pygame.font.Font(self.font_path, size)
+            self._fonts[size] = font
+            if len(self._fonts) > self.max_size:
+                self._fonts.popitem(last=False)
+            return font
+    
+    def preload(self, sizes):
+        """
+        预先加载一组字号
+        
+        Args:
+            sizes: 字号列表
+        """
+        for size in sizes:
+            self.get(size)
+    
+    def clear(self):
+        """清空缓存（pygame.font 重新初始化后需要调用），下次取字体时重新查找字体文件"""
+        with self._lock:
+            self._fonts.clear()
+            self.font_path = self._UNRESOLVED
+    
+    def stats(self):
+        """
+        缓存统计
+        
+        Returns:
+            dict: 命中次数、未命中次数、缓存的字号数和使用的字体文件
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "cached": len(self._fonts),
+            "font_path": None if self.font_path is self._UNRESOLVED else self.font_path
+        }
+
+font_manager = FontManager()
 
 # 字体设置
 def get_font(size):
     """
-    获取字体对象
+    获取字体对象（经过缓存，同一字号返回同一个对象）
     
     Args:
         size: 字体大小
@@ -12,30 +126,23 @@ def get_font(size):
     Returns:
         pygame.font.Font: 字体对象
     """
-    # 尝试多种中文字体
-    font_paths = [
-        "assets/fonts/simkai.ttf",  # 楷体
-        "assets/fonts/msyh.ttc",    # 微软雅黑  
-        "assets/fonts/simhei.ttf",  # 黑体
-        "assets/fonts/simsun.ttc",  # 宋体
-        "C:/Windows/Fonts/simkai.ttf",
-        "C:/Windows/Fonts/msyh.ttc",
-        "C:/Windows/Fonts/simhei.ttf",
-        "C:/Windows/Fonts/simsun.ttc"
-    ]
-    
-    for font_path in font_paths:
-        try:
-            return pygame.font.Font(font_path, size)
-        except:
-            continue
-    
-    # 如果都失败，使用系统默认字体
-    print("警告：未找到中文字体，使用系统默认字体")
-    return pygame.font.SysFont(None, size)
+    return font_manager.get(size)
+
+# 标题字体字号
+TITLE_FONT_SIZE = 48
+
+# 界面中用到的字号，启动时预加载
+UI_FONT_SIZES = (14, 16, 18, 20, 24, 36, TITLE_FONT_SIZE)
+
+def get_title_font():
+    """获取标题字体"""
+    return get_font(TITLE_FONT_SIZE)
 
-# 标题字体
-title_font = get_font(48)
+def __getattr__(name):
+    # 兼容旧代码中的 config.title_font：首次访问时才加载，导入本模块不再触发字体查找
+    if name == "title_font":
+        return get_title_font()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # 游戏配置
 GAME_CONFIG = {
@@ -109,13 +216,26 @@ def get_zombies_per_level(difficulty, level):
 
 def update_game_settings(new_settings):
     """
-    更新游戏设置
+    更新游戏设置，并保存到数据库的 "settings" 分区（后台写入，见 storage）
     
     Args:
         new_settings: 新的设置字典
     """
     global GAME_SETTINGS
     GAME_SETTINGS.update(new_settings)
+    from .file_utils import save_settings
+    save_settings(GAME_SETTINGS, "settings")
+
+def load_game_settings():
+    """
+    从数据库读取保存过的游戏设置，合并到 GAME_SETTINGS
+    
+    Returns:
+        dict: GAME_SETTINGS
+    """
+    from .storage import get_storage
+    GAME_SETTINGS.update(get_storage().load_settings("settings") or {})
+    return GAME_SETTINGS
 
 def get_game_setting(key, default=None):
     """
@@ -1,6 +1,6 @@
 import os
-import json
-import pygame
+from .save_writer import SAVE_BACKENDS, save_writer
+from .storage import DEFAULT_PROGRESS, Storage, get_storage
 
 def ensure_directory(directory_path):
     """确保目录存在，如果不存在则创建"""
@@ -9,7 +9,7 @@ def ensure_directory(directory_path):
 
 def load_game_data(difficulty="normal"):
     """
-    加载游戏数据
+    加载游戏数据（从 storage 中的数据库读取）
     
     Args:
         difficulty: 难度级别 ('easy', 'normal', 'hard')
@@ -17,44 +17,24 @@ def load_game_data(difficulty="normal"):
     Returns:
         dict: 游戏数据
     """
-    data_file = f"data/save_data/game_save_{difficulty}.json"
-    
-    # 确保数据目录存在
-    ensure_directory("data/save_data")
-    
-    if os.path.exists(data_file):
-        try:
-            with open(data_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"加载游戏数据失败: {e}")
-    
-    # 返回默认数据
-    return {
-        "current_level": 1,
-        "score": 0,
-        "unlocked_levels": 1,
-        "total_sun_collected": 0,
-        "total_zombies_killed": 0
-    }
+    storage = get_storage()
+    # 已提交但还没写完的存档比数据库中的新
+    game_data = save_writer.pending_data(difficulty, storage.progress)
+    if game_data is None:
+        game_data = storage.load_progress(difficulty)
+    
+    # 没有存档时返回默认数据
+    return dict(DEFAULT_PROGRESS) if game_data is None else game_data
 
 def save_game_data(game_data, difficulty="normal"):
     """
-    保存游戏数据
+    保存游戏数据（由后台线程在一个事务中写入数据库，见 save_writer）
     
     Args:
         game_data: 游戏数据字典
         difficulty: 难度级别
     """
-    data_file = f"data/save_data/game_save_{difficulty}.json"
-    
-    try:
-        with open(data_file, 'w', encoding='utf-8') as f:
-            json.dump(game_data, f, ensure_ascii=False, indent=2)
-        return True
-    except IOError as e:
-        print(f"保存游戏数据失败: {e}")
-        return False
+    return save_writer.submit(difficulty, game_data, get_storage().progress)
 
 def load_image(path, default_color=None, default_size=(40, 40)):
     """
@@ -68,6 +48,8 @@ def load_image(path, default_color=None, default_size=(40, 40)):
     Returns:
         pygame.Surface: 图片表面
     """
+    import pygame
+    
     try:
         image = pygame.image.load(path)
         return pygame.transform.scale(image, default_size)
@@ -81,54 +63,116 @@ def load_image(path, default_color=None, default_size=(40, 40)):
                              default_size[0]//2 - 5)
         return surf
 
-def load_config(config_file="data/config/game_config.json"):
+# 没有保存过配置时使用的默认配置
+DEFAULT_CONFIG = {
+    "screen_width": 900,
+    "screen_height": 600,
+    "grid_size": 80,
+    "grid_rows": 5,
+    "grid_cols": 9,
+    "lawn_left": 100,
+    "lawn_top": 100,
+    "fps": 60
+}
+
+# 按后缀识别为 SQLite 数据库的配置路径，其他路径按 JSON 文件读写
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+
+# 默认数据库以外的数据库文件（绝对路径 -> Storage），每个文件只打开一个连接
+_extra_storages = {}
+
+def _storage_for(db_path=None):
+    """
+    返回数据库文件对应的 Storage
+    
+    Args:
+        db_path: 数据库文件路径，None 表示默认数据库（见 get_storage）
+    
+    Returns:
+        Storage: 与默认数据库是同一文件时（不论路径的写法）返回 get_storage()
+    """
+    storage = get_storage()
+    if db_path is None:
+        return storage
+    path = os.path.abspath(db_path)
+    if storage.path != ":memory:" and path == os.path.abspath(storage.path):
+        return storage
+    if path not in _extra_storages:
+        # 只有默认数据库导入旧版本的存档
+        _extra_storages[path] = Storage(path, legacy_save_dir=None, legacy_config_file=None)
+    return _extra_storages[path]
+
+def load_settings(section="config", db_path=None):
+    """
+    读取数据库中一个分区的设置（见 storage）
+    
+    Args:
+        section: 设置分区名
+        db_path: 数据库文件路径，None 表示默认数据库
+    
+    Returns:
+        dict: 设置数据，分区不存在时返回空字典
+    """
+    storage = _storage_for(db_path)
+    # 已提交但还没写完的设置比数据库中的新
+    settings = save_writer.pending_data(section, storage.settings)
+    if settings is None:
+        settings = storage.load_settings(section) or {}
+    return settings
+
+def save_settings(settings, section="config", db_path=None):
+    """
+    保存一个分区的设置（由后台线程在一个事务中写入数据库，见 save_writer）
+    
+    Args:
+        settings: 设置数据
+        section: 设置分区名
+        db_path: 数据库文件路径，None 表示默认数据库
+    """
+    return save_writer.submit(section, settings, _storage_for(db_path).settings)
+
+def _is_sqlite_path(path):
+    """按文件后缀判断配置路径是否是 SQLite 数据库"""
+    return os.path.splitext(path)[1].lower() in SQLITE_SUFFIXES
+
+def load_config(config_file=None):
     """
     加载游戏配置
     
+    存储方式由 config_file 决定：None 读取默认数据库的 "config" 分区（旧版本的配置文件
+    已导入该分区）；后缀为 SQLITE_SUFFIXES 之一的路径读取该数据库的 "config" 分区；
+    其他路径读取该 JSON 文件。
+    
     Args:
         config_file: 配置文件路径
     
     Returns:
         dict: 配置数据
     """
-    ensure_directory("data/config")
-    
-    default_config = {
-        "screen_width": 900,
-        "screen_height": 600,
-        "grid_size": 80,
-        "grid_rows": 5,
-        "grid_cols": 9,
-        "lawn_left": 100,
-        "lawn_top": 100,
-        "fps": 60
-    }
-    
-    if os.path.exists(config_file):
-        try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                user_config = json.load(f)
-                # 合并配置，用户配置覆盖默认配置
-                return {**default_config, **user_config}
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"加载配置文件失败: {e}")
-    
-    return default_config
+    if config_file is None or _is_sqlite_path(config_file):
+        user_config = load_settings("config", config_file)
+    else:
+        user_config = save_writer.pending_data(config_file, "json")
+        if user_config is None:
+            try:
+                user_config = SAVE_BACKENDS["json"].read(config_file) or {}
+            except (ValueError, OSError) as e:
+                print(f"加载配置文件失败: {e}")
+                user_config = {}
+    # 合并配置，用户配置覆盖默认配置
+    return {**DEFAULT_CONFIG, **user_config}
 
-def save_config(config_data, config_file="data/config/game_config.json"):
+def save_config(config_data, config_file=None):
     """
-    保存游戏配置
+    保存游戏配置（后台写入，见 save_writer）
+    
+    存储方式与 load_config 相同：None 和 SQLite 数据库路径写入数据库的 "config" 分区，
+    其他路径原子地写入该 JSON 文件。
     
     Args:
         config_data: 配置数据
         config_file: 配置文件路径
     """
-    ensure_directory("data/config")
-    
-    try:
-        with open(config_file, 'w', encoding='utf-8') as f:
-            json.dump(config_data, f, ensure_ascii=False, indent=2)
-        return True
-    except IOError as e:
-        print(f"保存配置文件失败: {e}")
-        return False
\ No newline at end of file
+    if config_file is None or _is_sqlite_path(config_file):
+        return save_settings(config_data, "config", config_file)
+    return save_writer.submit(config_file, config_data, "json")
@@ -0,0 +1,306 @@
+import atexit
+import json
+import os
+import tempfile
+import threading
+import zlib
+
+
+class FileBackend:
+    """
+    按文件保存的存档格式基类
+
+    存档格式提供 key/read/write/signature 四个方法，SaveWriter 和 LevelManager 只通过它们访问存档。
+    子类实现 dumps(data) 和 loads(raw)。
+    """
+
+    extension = ""
+
+    def key(self, save_dir, difficulty):
+        """存档位置：文件路径"""
+        return os.path.join(save_dir, f"game_save_{difficulty}{self.extension}")
+
+    def read(self, path):
+        """读取存档，文件不存在时返回 None，内容损坏时抛出 ValueError"""
+        try:
+            with open(path, 'rb') as f:
+                raw = f.read()
+        except FileNotFoundError:
+            return None
+        return self.loads(raw)
+
+    def write(self, path, data):
+        atomic_write(path, self.dumps(data))
+
+    def signature(self, path):
+        """文件的 (修改时间, 大小)，用于判断文件是否被外部修改，文件不存在时返回 None"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+
+class JsonBackend(FileBackend):
+    """可读的 JSON 存档格式"""
+
+    name = "json"
+    extension = ".json"
+
+    def dumps(self, data):
+        return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+    def loads(self, raw):
+        return json.loads(raw.decode('utf-8'))
+
+
+class BinaryBackend(FileBackend):
+    """
+    紧凑的二进制存档格式
+
+    文件头 MAGIC 之后是 zlib 压缩的紧凑 JSON。只包含数据，读取不会执行任何代码。
+    """
+
+    name = "binary"
+    extension = ".sav"
+    MAGIC = b"PVZS\x01"
+
+    def dumps(self, data):
+        text = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+        return self.MAGIC + zlib.compress(text.encode('utf-8'))
+
+    def loads(self, raw):
+        if not raw.startswith(self.MAGIC):
+            raise ValueError("不是二进制存档文件")
+        try:
+            text = zlib.decompress(raw[len(self.MAGIC):])
+        except zlib.error as e:
+            raise ValueError(f"存档数据损坏: {e}") from e
+        return json.loads(text.decode('utf-8'))
+
+
+# 按文件保存的存档格式名称 -> 格式
+SAVE_BACKENDS = {
+    "json": JsonBackend(),
+    "binary": BinaryBackend()
+}
+
+
+def get_backend(backend):
+    """
+    取存档格式
+
+    Args:
+        backend: 格式名称（"sqlite" 或 SAVE_BACKENDS 中的名称）或格式对象
+
+    Returns:
+        存档格式对象，提供 key、read、write 和 signature
+    """
+    if backend == "sqlite":
+        from .storage import get_storage
+        return get_storage().progress
+    if isinstance(backend, str):
+        try:
+            return SAVE_BACKENDS[backend]
+        except KeyError:
+            raise ValueError(f"未知的存档格式: {backend}") from None
+    return backend
+
+
+def atomic_write(path, raw):
+    """
+    原子地写入文件
+
+    先写入同一目录下的临时文件并 fsync，再用 os.replace 替换目标文件。
+    写入途中崩溃时目标文件保持原样，不会出现写了一半的存档。
+
+    Args:
+        path: 目标文件路径
+        raw: 要写入的字节串
+    """
+    directory = os.path.dirname(path) or "."
+    # 游戏线程可能同时在创建同一个目录
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(raw)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+    # 让目录项的修改也落盘（Windows 不支持打开目录，跳过）
+    if hasattr(os, 'O_DIRECTORY'):
+        try:
+            dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            return
+        try:
+            os.fsync(dir_fd)
+        except OSError:
+            pass
+        finally:
+            os.close(dir_fd)
+
+
+class SaveWriter:
+    """
+    后台存档写入线程
+
+    submit() 只记录要写入的数据，立即返回，由后台线程调用存档格式的 write() 写入
+    （文件格式原子写入文件，SQLite 格式在一个事务中写入）。
+    同一位置在写入前被多次提交时只写最后一次的数据。
+    flush() 等待所有已提交的数据写完；进程退出时会自动 flush（见 atexit）。
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        # (存档格式, 存档位置) -> (数据, 回调)，按提交顺序排列
+        self._pending = {}
+        # 后台线程正在写入的 (存档格式, 存档位置) -> 数据
+        self._writing = {}
+        self._thread = None
+        self._closed = False
+        self.submitted = 0
+        self.written = 0
+        self.coalesced = 0
+        self.errors = 0
+
+    def submit(self, path, data, backend="json", callback=None):
+        """
+        提交一次写入
+
+        Args:
+            path: 存档位置（文件格式为文件路径，SQLite 格式为键）
+            data: 存档数据（提交时复制一份，之后修改原对象不影响写入）
+            backend: 存档格式名称或对象
+            callback: 写入完成后在后台线程中调用 callback(path, ok)
+
+        Returns:
+            bool: 是否已提交（关闭后提交会改为同步写入）
+        """
+        backend = get_backend(backend)
+        data = dict(data)
+        key = (backend, path)
+        with self._condition:
+            if not self._closed:
+                if key in self._pending:
+                    self.coalesced += 1
+                    # 删除后重新插入，保持按最后一次提交的顺序写入
+                    del self._pending[key]
+                self._pending[key] = (data, callback)
+                self.submitted += 1
+                self._ensure_thread()
+                self._condition.notify_all()
+                return True
+        return self._write(path, data, backend, callback)
+
+    def pending_data(self, path, backend="json"):
+        """
+        已提交但尚未写完的数据
+
+        Args:
+            path: 存档位置
+            backend: 存档格式名称或对象
+
+        Returns:
+            dict: 数据的副本，没有待写入的数据时返回 None
+        """
+        key = (get_backend(backend), path)
+        with self._condition:
+            entry = self._pending.get(key)
+            if entry is not None:
+                return dict(entry[0])
+            data = self._writing.get(key)
+            return None if data is None else dict(data)
+
+    def flush(self, timeout=None):
+        """
+        等待所有已提交的数据写完
+
+        Args:
+            timeout: 最长等待秒数，None 表示一直等待
+
+        Returns:
+            bool: 是否在超时前全部写完
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._pending and not self._writing, timeout)
+
+    def close(self):
+        """写完所有已提交的数据并停止后台线程，之后的提交改为同步写入"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+
+    def stats(self):
+        """
+        写入统计
+
+        Returns:
+            dict: 提交次数、实际写入次数、被合并的提交次数和失败次数
+        """
+        return {
+            "submitted": self.submitted,
+            "written": self.written,
+            "coalesced": self.coalesced,
+            "errors": self.errors
+        }
+
+    def _ensure_thread(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="SaveWriter", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        try:
+            while True:
+                with self._condition:
+                    self._condition.wait_for(lambda: self._pending or self._closed)
+                    if not self._pending:
+                        return
+                    key = next(iter(self._pending))
+                    data, callback = self._pending.pop(key)
+                    self._writing[key] = data
+                backend, path = key
+                try:
+                    self._write(path, data, backend, callback)
+                finally:
+                    with self._condition:
+                        del self._writing[key]
+                        self._condition.notify_all()
+        finally:
+            # 线程因异常退出时也要清掉，下次 submit() 会重新启动线程
+            with self._condition:
+                self._thread = None
+                self._condition.notify_all()
+
+    def _write(self, path, data, backend, callback):
+        try:
+            backend.write(path, data)
+            ok = True
+            self.written += 1
+        except Exception as e:
+            print(f"保存游戏数据失败: {e}")
+            ok = False
+            self.errors += 1
+        if callback is not None:
+            # 回调出错不能让写入线程退出，否则之后提交的数据不会再写入
+            try:
+                callback(path, ok)
+            except Exception as e:
+                print(f"存档写入回调出错: {e}")
+        return ok
+
+
+# 全局存档写入线程，进程退出前写完所有存档
+save_writer = SaveWriter()
+atexit.register(save_writer.close)
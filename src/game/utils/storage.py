@@ -0,0 +1,334 @@
+import glob
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+# 数据库文件，保存所有难度的进度、设置和统计
+DEFAULT_DB_PATH = "data/game.db"
+
+# 旧版本的 JSON 存档位置，第一次创建数据库时导入
+LEGACY_SAVE_DIR = "data/save_data"
+LEGACY_CONFIG_FILE = "data/config/game_config.json"
+
+# 没有存档时的默认进度
+DEFAULT_PROGRESS = {
+    "current_level": 1,
+    "score": 0,
+    "unlocked_levels": 1,
+    "total_sun_collected": 0,
+    "total_zombies_killed": 0
+}
+
+# 存档数据中以此开头的字段是累计统计，单独保存在 stats 表中
+STAT_PREFIX = "total_"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS progress (
+    difficulty TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS stats (
+    difficulty TEXT NOT NULL,
+    name TEXT NOT NULL,
+    value INTEGER NOT NULL,
+    PRIMARY KEY (difficulty, name)
+);
+CREATE TABLE IF NOT EXISTS settings (
+    section TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (section, key)
+);
+"""
+
+
+class ProgressTable:
+    """
+    进度表，作为 SaveWriter 的存档格式使用（见 save_writer.get_backend("sqlite")）
+
+    键为难度名。写入时进度和累计统计在同一个事务中更新。
+    """
+
+    name = "sqlite"
+
+    def __init__(self, storage):
+        self.storage = storage
+
+    def key(self, save_dir, difficulty):
+        return difficulty
+
+    def read(self, difficulty):
+        return self.storage.load_progress(difficulty)
+
+    def write(self, difficulty, data):
+        self.storage.save_progress(difficulty, data)
+
+    def signature(self, difficulty):
+        return self.storage.signature()
+
+
+class SettingsTable:
+    """设置表，键为分区名，作为 SaveWriter 的存档格式使用"""
+
+    name = "sqlite-settings"
+
+    def __init__(self, storage):
+        self.storage = storage
+
+    def key(self, save_dir, section):
+        return section
+
+    def read(self, section):
+        return self.storage.load_settings(section)
+
+    def write(self, section, data):
+        self.storage.save_settings(section, data)
+
+    def signature(self, section):
+        return self.storage.signature()
+
+
+class Storage:
+    """
+    游戏数据存储
+
+    所有难度的进度、设置和累计统计保存在同一个 SQLite 数据库中，
+    按主键索引查询，每次写入是一个事务。整个进程共用一个连接（见 get_storage），
+    连接在第一次使用时打开，可以在存档写入线程中使用，内部用锁串行化。
+    """
+
+    def __init__(self, path=DEFAULT_DB_PATH, legacy_save_dir=LEGACY_SAVE_DIR,
+                 legacy_config_file=LEGACY_CONFIG_FILE):
+        self.path = path
+        self.legacy_save_dir = legacy_save_dir
+        self.legacy_config_file = legacy_config_file
+        self._lock = threading.RLock()
+        # 第一次使用时才打开数据库（见 _connect），创建 Storage 不访问文件系统
+        self._conn = None
+        # 本连接提交写入的次数；本连接的写入不改变 data_version，由它区分
+        self.generation = 0
+        self.progress = ProgressTable(self)
+        self.settings = SettingsTable(self)
+
+    def _connect(self):
+        """返回数据库连接，第一次调用时打开数据库，新建的数据库导入旧版本的存档"""
+        with self._lock:
+            if self._conn is not None:
+                return self._conn
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            created = self.path == ":memory:" or not os.path.exists(self.path)
+            # isolation_level=None：由 transaction() 显式开始和提交事务
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            if self.path != ":memory:":
+                # WAL 模式下写入不阻塞读取，提交只追加日志
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            self._conn = conn
+            if created:
+                self.import_legacy_files(self.legacy_save_dir, self.legacy_config_file)
+            return conn
+
+    @contextmanager
+    def transaction(self):
+        """在一个事务中执行多次写入，出错时回滚"""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+            self.generation += 1
+
+    def data_version(self):
+        """
+        数据库版本号，其他连接（例如另一个游戏进程）提交修改后会变化，本连接的写入不会改变它
+
+        Returns:
+            int: PRAGMA data_version 的值
+        """
+        with self._lock:
+            return self._connect().execute("PRAGMA data_version").fetchone()[0]
+
+    def signature(self):
+        """
+        数据的签名，任何连接提交修改后都会变化（供 LevelManager 校验缓存）
+
+        Returns:
+            tuple: (data_version, generation)
+        """
+        with self._lock:
+            return self.data_version(), self.generation
+
+    def load_progress(self, difficulty):
+        """
+        读取一个难度的进度（包含累计统计）
+
+        Args:
+            difficulty: 难度级别
+
+        Returns:
+            dict: 进度数据，没有存档时返回 None
+        """
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT data FROM progress WHERE difficulty = ?", (difficulty,)).fetchone()
+            if row is None:
+                return None
+            data = json.loads(row[0])
+            data.update(conn.execute(
+                "SELECT name, value FROM stats WHERE difficulty = ?", (difficulty,)).fetchall())
+        return data
+
+    def save_progress(self, difficulty, data):
+        """
+        保存一个难度的进度，进度和累计统计在同一个事务中写入
+
+        Args:
+            difficulty: 难度级别
+            data: 进度数据，以 STAT_PREFIX 开头的整数字段写入 stats 表
+        """
+        stats = {name: value for name, value in data.items()
+                 if name.startswith(STAT_PREFIX) and isinstance(value, int)}
+        progress = {name: value for name, value in data.items() if name not in stats}
+        with self.transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO progress (difficulty, data, updated_at) VALUES (?, ?, ?)",
+                (difficulty, json.dumps(progress, ensure_ascii=False), time.time()))
+            conn.execute("DELETE FROM stats WHERE difficulty = ?", (difficulty,))
+            conn.executemany(
+                "INSERT INTO stats (difficulty, name, value) VALUES (?, ?, ?)",
+                [(difficulty, name, value) for name, value in stats.items()])
+
+    def get_stats(self, difficulty=None):
+        """
+        读取累计统计
+
+        Args:
+            difficulty: 难度级别，None 表示所有难度之和
+
+        Returns:
+            dict: 统计名 -> 数值
+        """
+        with self._lock:
+            conn = self._connect()
+            if difficulty is None:
+                rows = conn.execute("SELECT name, SUM(value) FROM stats GROUP BY name").fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT name, value FROM stats WHERE difficulty = ?", (difficulty,)).fetchall()
+        return dict(rows)
+
+    def load_settings(self, section):
+        """
+        读取一个分区的设置
+
+        Args:
+            section: 分区名（例如 "config"、"settings"）
+
+        Returns:
+            dict: 设置数据，分区不存在时返回 None
+        """
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT key, value FROM settings WHERE section = ?", (section,)).fetchall()
+        if not rows:
+            return None
+        return {key: json.loads(value) for key, value in rows}
+
+    def save_settings(self, section, data):
+        """
+        在一个事务中替换一个分区的全部设置
+
+        Args:
+            section: 分区名
+            data: 设置数据，值需要能转换为 JSON
+        """
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM settings WHERE section = ?", (section,))
+            conn.executemany(
+                "INSERT INTO settings (section, key, value) VALUES (?, ?, ?)",
+                [(section, key, json.dumps(value, ensure_ascii=False)) for key, value in data.items()])
+
+    def import_legacy_files(self, save_dir, config_file):
+        """
+        导入旧版本的 JSON 存档和配置文件（原文件保留不动）
+
+        Args:
+            save_dir: 旧存档目录，其中的 game_save_<难度>.json 导入为进度
+            config_file: 旧配置文件，导入为 "config" 分区的设置
+
+        save_dir 或 config_file 为 None 时跳过对应的导入。
+        """
+        if save_dir is not None:
+            for save_file in sorted(glob.glob(os.path.join(save_dir, "game_save_*.json"))):
+                difficulty = os.path.basename(save_file)[len("game_save_"):-len(".json")]
+                data = self._read_json(save_file)
+                if data is not None:
+                    self.save_progress(difficulty, data)
+        if config_file is not None:
+            data = self._read_json(config_file)
+            if data is not None:
+                self.save_settings("config", data)
+
+    def _read_json(self, path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return data if isinstance(data, dict) else None
+
+    def close(self):
+        """关闭连接（先写完后台线程中尚未写入的数据）"""
+        from .save_writer import save_writer
+        save_writer.flush()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_storage = None
+_storage_lock = threading.Lock()
+
+
+def get_storage():
+    """
+    获取进程共用的存储，第一次调用时打开数据库
+
+    Returns:
+        Storage: 存储对象
+    """
+    global _storage
+    if _storage is None:
+        with _storage_lock:
+            if _storage is None:
+                _storage = Storage()
+    return _storage
+
+
+def set_storage(storage):
+    """
+    替换进程共用的存储（例如使用其他路径的数据库），返回原来的存储
+
+    Args:
+        storage: 新的存储对象，None 表示下次使用时重新打开默认数据库
+
+    Returns:
+        Storage: 原来的存储对象，可能为 None
+    """
+    global _storage
+    with _storage_lock:
+        previous, _storage = _storage, storage
+    return previous
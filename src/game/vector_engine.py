@@ -0,0 +1,64 @@
+from typing import List
+
+from .game_engine import GameEngine
+from .entities.plants import Plant
+from .entities.zombies import Zombie
+from .systems.vector_sim import VectorSimulation, EntityViews, SunflowerView
+
+
+class VectorGameEngine(GameEngine):
+    """向量化游戏引擎
+
+    植物、僵尸和豌豆的状态保存在 VectorSimulation 的 NumPy 数组中，
+    每帧的移动、冷却、命中结算和死亡剔除都以整批数组运算完成。
+    plants / zombies / peas 属性返回只读视图序列，仅供绘制使用。
+    相同随机种子下与 GameEngine 的结果一致。
+
+    每帧的开销主要是固定次数的 NumPy 调用，与实体数量关系不大：场上有数百个僵尸时
+    比 GameEngine 快（见 tools.bench 的 siege 和 zombie_swarm 场景）；普通关卡只有几十个实体，
+    GameEngine 只处理到期实体的时间轮调度更快。
+    """
+
+    def _reset_entities(self):
+        """重建数组存储"""
+        self.sim = VectorSimulation(self.grid_rows, self.grid_cols, self.lawn_left, self.grid_size)
+
+    @property
+    def plants(self) -> EntityViews:
+        return EntityViews(self.sim, 'plants')
+
+    @property
+    def zombies(self) -> EntityViews:
+        return EntityViews(self.sim, 'zombies')
+
+    @property
+    def peas(self) -> EntityViews:
+        return EntityViews(self.sim, 'peas')
+
+    def _spawn_zombie(self, zombie: Zombie):
+        self.sim.add_zombie(zombie)
+
+    def _add_plant(self, plant: Plant):
+        self.sim.add_plant(plant)
+
+    def _add_plants(self, plants: List[Plant]):
+        self.sim.add_plants(plants)
+
+    def _update_plants(self):
+        produced = self.sim.update_plants()
+        if len(produced):
+            self._gain_sun(self.economy.produce([SunflowerView(self.sim, i) for i in produced]))
+
+    def _update_peas(self):
+        self.sim.update_peas()
+
+    def _update_zombies(self):
+        reached_house, killed = self.sim.update_zombies()
+        if reached_house:
+            self.game_over = True
+        self.zombies_killed += killed
+        self.score += 10 * killed
+
+    def _remove_dead_plants(self):
+        for row, col in self.sim.remove_dead_plants():
+            self._free_cell(row, col)